@@ -1,7 +1,7 @@
 """Main CLI entry point for Raid project"""
 
 import click
-from .utils import CliContext
+from .utils import CliContext, configure_logging
 from .agents import agents_group
 from .tasks import tasks_group
 from .system import system_group
@@ -32,6 +32,8 @@ def cli(ctx, verbose, format):
     
     Other commands: agent management, system monitoring, profiles, collaboration
     """
+    configure_logging()
+    
     # Ensure that ctx.obj exists and is a CliContext
     ctx.ensure_object(CliContext)
     ctx.obj.verbose = verbose
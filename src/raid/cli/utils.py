@@ -1,26 +1,73 @@
 """Shared utilities for Raid CLI"""
 
 import asyncio
+import atexit
 import functools
 import json
+import logging
 import os
+import sys
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import click
 from dotenv import load_dotenv
 from ..config.settings import RaidConfig
 from ..control_agent.agent import ControlAgent
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Event loop shared across commands when RAID_CLI_REUSE_LOOP is set
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _close_cached_loop() -> None:
+    """Shut down the shared CLI event loop at interpreter exit"""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+    finally:
+        _LOOP.close()
+
+
+atexit.register(_close_cached_loop)
+
 
 def async_command(f):
     """Decorator to run async functions in Click commands"""
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
+        if os.getenv('RAID_CLI_REUSE_LOOP'):
+            # Reuse one loop for in-process invocations (scripts, test runners)
+            global _LOOP
+            if _LOOP is None or _LOOP.is_closed():
+                _LOOP = asyncio.new_event_loop()
+            return _LOOP.run_until_complete(f(*args, **kwargs))
         return asyncio.run(f(*args, **kwargs))
     return wrapper
 
 
+def configure_logging() -> None:
+    """Print progress from the raid loggers (e.g. the ReAct trace) to stdout
+    
+    INFO by default; RAID_QUIET keeps only warnings and errors. Library users
+    who never call this get Python's default of WARNING and above.
+    """
+    raid_logger = logging.getLogger("raid")
+    if raid_logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    raid_logger.addHandler(handler)
+    raid_logger.setLevel(logging.WARNING if os.getenv('RAID_QUIET') else logging.INFO)
+    raid_logger.propagate = False
+
+
 def load_raid_config() -> RaidConfig:
     """Load Raid configuration from environment"""
     try:
@@ -122,11 +169,17 @@ def validate_agent_name(ctx, param, value):
     return value
 
 
-def safe_json_loads(data: str) -> Optional[Dict[str, Any]]:
-    """Safely parse JSON data"""
+def safe_json_loads(data: Union[str, bytes, Dict[str, Any], list, None]) -> Optional[Any]:
+    """Safely parse JSON data, passing through already-decoded values"""
+    if data is None:
+        return None
+    if isinstance(data, (dict, list)):
+        return data
     try:
+        if orjson is not None:
+            return orjson.loads(data)
         return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+    except (ValueError, TypeError):
         return None
 
 
@@ -2,13 +2,17 @@
 
 import uuid
 import asyncio
-from typing import Dict, List, Any, Optional, Set
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, FrozenSet, Tuple, Union
 from datetime import datetime, timedelta
 from enum import Enum
 from pydantic import BaseModel, Field
 from .dynamic_subagent import DynamicSubAgentManager, SubAgentRole
 from .settings import RaidConfig
 from ..message_queue.redis_mq import RedisMQ
+from ..utils import DATACLASS_SLOTS, json_dumps, json_loads
 
 
 class CollaborationMessageType(str, Enum):
@@ -21,14 +25,15 @@ class CollaborationMessageType(str, Enum):
     ERROR_REPORT = "error_report"      # Report errors or issues
 
 
-class CollaborationMessage(BaseModel):
-    """Structured message format for Sub-Agent collaboration"""
-    message_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class CollaborationMessage:
+    """Structured message format for Sub-Agent collaboration (immutable, so its cached JSON stays valid)"""
     message_type: CollaborationMessageType
     sender_agent: str
-    target_agent: Optional[str] = None  # None means broadcast to all in group
     group_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    target_agent: Optional[str] = None  # None means broadcast to all in group
+    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     
     # Restricted payload - only specific data types allowed
     data: Optional[Dict[str, Any]] = None
@@ -40,12 +45,88 @@ class CollaborationMessage(BaseModel):
     correlation_id: Optional[str] = None
     expires_at: Optional[datetime] = None
     
+    # Serialized form, computed on first to_json() call
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     def is_expired(self) -> bool:
         """Check if message has expired"""
         if self.expires_at:
             return datetime.utcnow() > self.expires_at
         return False
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert message to a JSON-compatible dict"""
+        return {
+            "message_id": self.message_id,
+            "message_type": self.message_type.value,
+            "sender_agent": self.sender_agent,
+            "target_agent": self.target_agent,
+            "group_id": self.group_id,
+            "timestamp": self.timestamp.isoformat(),
+            "data": self.data,
+            "request": self.request,
+            "status": self.status,
+            "error": self.error,
+            "correlation_id": self.correlation_id,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None
+        }
+    
+    def to_json(self) -> str:
+        """Serialize message to JSON (cached after the first call)"""
+        if self._json is None:
+            object.__setattr__(self, "_json", json_dumps(self.to_dict()))
+        return self._json
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollaborationMessage":
+        """Build a message from an untrusted dict, validating it first"""
+        _validate_inbound(data)
+        expires_at = data.get("expires_at")
+        timestamp = data.get("timestamp")
+        return cls(
+            message_id=data.get("message_id") or str(uuid.uuid4()),
+            message_type=CollaborationMessageType(data["message_type"]),
+            sender_agent=data["sender_agent"],
+            target_agent=data.get("target_agent"),
+            group_id=data["group_id"],
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow(),
+            data=data.get("data"),
+            request=data.get("request"),
+            status=data.get("status"),
+            error=data.get("error"),
+            correlation_id=data.get("correlation_id"),
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None
+        )
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "CollaborationMessage":
+        """Parse and validate a message received from the network"""
+        return cls.from_dict(_loads_message(raw))
+    
+    @classmethod
+    def from_json_for_agent(
+        cls,
+        raw: Union[str, bytes],
+        agent_name: str
+    ) -> Optional["CollaborationMessage"]:
+        """Parse a network message only if it should be delivered to agent_name
+        
+        Routing and expiry are checked on the raw dict, so messages meant for
+        other agents are dropped without building a CollaborationMessage.
+        """
+        data = _loads_message(raw)
+        
+        target_agent = data.get("target_agent")
+        if target_agent is not None and target_agent != agent_name:
+            return None
+        if data.get("sender_agent") == agent_name:
+            return None
+        expires_at = data.get("expires_at")
+        if expires_at and datetime.fromisoformat(expires_at) < datetime.utcnow():
+            return None
+        
+        return cls.from_dict(data)
+    
     @classmethod
     def create_data_share(
         cls, 
@@ -105,22 +186,63 @@ class CollaborationMessage(BaseModel):
         )
 
 
+_MESSAGE_TYPE_VALUES = frozenset(t.value for t in CollaborationMessageType)
+_REQUIRED_STR_FIELDS = ("message_type", "sender_agent", "group_id")
+_OPTIONAL_STR_FIELDS = (
+    "message_id", "target_agent", "timestamp", "request", "status",
+    "error", "correlation_id", "expires_at"
+)
+
+
+def collaboration_channel_name(group_id: str, target_agent: Optional[str] = None) -> str:
+    """Pub/sub channel for a group's broadcasts, or for messages to one agent"""
+    return f"raid:collaboration:{group_id}:{target_agent or 'bcast'}"
+
+
+def _loads_message(raw: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode a raw collaboration message into a dict"""
+    data = json_loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError("Collaboration message must be a JSON object")
+    return data
+
+
+def _validate_inbound(data: Dict[str, Any]) -> None:
+    """Cheap structural validation for messages received over the network"""
+    for key in _REQUIRED_STR_FIELDS:
+        if not isinstance(data.get(key), str):
+            raise ValueError(f"Collaboration message field '{key}' is missing or not a string")
+    if data["message_type"] not in _MESSAGE_TYPE_VALUES:
+        raise ValueError(f"Unknown collaboration message type: {data['message_type']}")
+    for key in _OPTIONAL_STR_FIELDS:
+        value = data.get(key)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"Collaboration message field '{key}' must be a string")
+    payload = data.get("data")
+    if payload is not None and not isinstance(payload, dict):
+        raise ValueError("Collaboration message field 'data' must be an object")
+
+
 class CollaborationRestrictions(BaseModel):
     """Restrictions and rules for Sub-Agent collaboration"""
-    allowed_message_types: Set[CollaborationMessageType] = Field(
-        default_factory=lambda: {
+    allowed_message_types: FrozenSet[CollaborationMessageType] = Field(
+        default_factory=lambda: frozenset({
             CollaborationMessageType.DATA_SHARE,
             CollaborationMessageType.REQUEST_DATA,
             CollaborationMessageType.STATUS_UPDATE
-        }
+        })
     )
     max_message_size_bytes: int = 10000  # 10KB max message size
     max_messages_per_minute: int = 30
-    allowed_data_keys: Optional[Set[str]] = None  # Restrict data keys if specified
+    allowed_data_keys: Optional[FrozenSet[str]] = None  # Restrict data keys if specified
     collaboration_timeout_minutes: int = 60
     auto_cleanup_expired: bool = True
 
 
+# Agents with activity in this window are reported as active
+ACTIVE_AGENT_WINDOW_SECONDS = 300
+
+
 class CollaborativeAgentGroup:
     """Manages a group of Sub-Agents that can collaborate with restricted communication"""
     
@@ -129,26 +251,39 @@ class CollaborativeAgentGroup:
         group_id: str,
         group_name: str,
         config: RaidConfig,
-        restrictions: Optional[CollaborationRestrictions] = None
+        restrictions: Optional[CollaborationRestrictions] = None,
+        mq: Optional[RedisMQ] = None
     ):
         self.group_id = group_id
         self.group_name = group_name
         self.config = config
         self.restrictions = restrictions or CollaborationRestrictions()
+        # Restrictions are fixed for the group's lifetime; callers must not mutate this
+        self._restrictions_dump = self.restrictions.model_dump(mode="json")
         
         self.agents: Dict[str, Dict[str, Any]] = {}  # agent_name -> metadata
         self.created_at = datetime.utcnow()
-        self.collaboration_channel = f"raid:collaboration:{self.group_id}"
+        self.created_ts = time.time()  # created_at as epoch seconds
+        self.collaboration_channel = collaboration_channel_name(self.group_id)
+        self._subscribed_channels: Set[str] = set()
         self.message_history: List[CollaborationMessage] = []
         self.message_rate_tracking: Dict[str, List[datetime]] = {}
+        # Epoch seconds of the most recent agent activity (join or send)
+        self.last_activity_ts = time.time()
+        # agent_name -> epoch seconds at which it stops counting as active;
+        # entries are dropped by a timer so status reads stay O(|active|)
+        self._active_agents: Dict[str, float] = {}
+        self._active_timers: Dict[str, asyncio.TimerHandle] = {}
         
-        self.mq: Optional[RedisMQ] = None
+        # A shared connection is owned (and disconnected) by the manager
+        self.mq: Optional[RedisMQ] = mq
+        self._owns_mq = mq is None
     
     async def initialize_messaging(self) -> None:
         """Initialize Redis messaging for collaboration"""
         if not self.mq:
             self.mq = RedisMQ(self.config.message_queue)
-            await self.mq.connect()
+        await self.mq.connect()
     
     def add_agent(
         self,
@@ -162,10 +297,12 @@ class CollaborativeAgentGroup:
             "role": role,
             "profile_data": profile_data,
             "joined_at": datetime.utcnow(),
-            "permissions": collaboration_permissions or self.restrictions.allowed_message_types,
+            "permissions": frozenset(collaboration_permissions or self.restrictions.allowed_message_types),
             "message_count": 0,
             "last_activity": datetime.utcnow()
         }
+        self.last_activity_ts = time.time()
+        self._mark_active(agent_name)
     
     def remove_agent(self, agent_name: str) -> None:
         """Remove a Sub-Agent from the collaboration group"""
@@ -173,6 +310,31 @@ class CollaborativeAgentGroup:
             del self.agents[agent_name]
             if agent_name in self.message_rate_tracking:
                 del self.message_rate_tracking[agent_name]
+            self._mark_inactive(agent_name)
+    
+    def _mark_active(self, agent_name: str) -> None:
+        """Record agent activity and (re)arm its inactivity timer"""
+        self._active_agents[agent_name] = self.last_activity_ts + ACTIVE_AGENT_WINDOW_SECONDS
+        
+        timer = self._active_timers.pop(agent_name, None)
+        if timer:
+            timer.cancel()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to schedule on; get_group_status filters by deadline
+            return
+        self._active_timers[agent_name] = loop.call_later(
+            ACTIVE_AGENT_WINDOW_SECONDS, self._mark_inactive, agent_name
+        )
+    
+    def _mark_inactive(self, agent_name: str) -> None:
+        """Drop an agent from the active set"""
+        self._active_agents.pop(agent_name, None)
+        timer = self._active_timers.pop(agent_name, None)
+        if timer:
+            timer.cancel()
     
     def get_agent_list(self) -> List[str]:
         """Get list of all agents in the group"""
@@ -194,14 +356,15 @@ class CollaborativeAgentGroup:
             return False
         
         # Check message size (approximation)
-        message_json = message.model_dump_json()
+        message_json = message.to_json()
         if len(message_json.encode()) > self.restrictions.max_message_size_bytes:
             return False
         
-        # Check data keys if restricted
+        # Check data keys if restricted (dict_keys compares against sets directly)
+        allowed_data_keys = self.restrictions.allowed_data_keys
         if (message.data and 
-            self.restrictions.allowed_data_keys and 
-            not set(message.data.keys()).issubset(self.restrictions.allowed_data_keys)):
+            allowed_data_keys and 
+            not message.data.keys() <= allowed_data_keys):
             return False
         
         # Check target agent exists (if specified)
@@ -228,7 +391,7 @@ class CollaborativeAgentGroup:
     
     async def send_collaboration_message(self, message: CollaborationMessage) -> bool:
         """Send a collaboration message with validation"""
-        if not self.mq:
+        if not self.mq or not self.mq.redis_client:
             await self.initialize_messaging()
         
         # Validate message
@@ -244,38 +407,38 @@ class CollaborativeAgentGroup:
         self.message_history.append(message)
         self.agents[message.sender_agent]["message_count"] += 1
         self.agents[message.sender_agent]["last_activity"] = datetime.utcnow()
+        self.last_activity_ts = time.time()
+        self._mark_active(message.sender_agent)
         
-        # Send to Redis channel
-        await self.mq.publish_message(self.collaboration_channel, message.model_dump_json())
+        # Directed messages go to the target's own channel so other agents never see them
+        channel = collaboration_channel_name(self.group_id, message.target_agent)
+        await self.mq.publish_message(channel, message.to_json())
         return True
     
     async def listen_for_messages(self, agent_name: str, callback: callable) -> None:
         """Listen for collaboration messages for a specific agent"""
-        if not self.mq:
+        if not self.mq or not self.mq.redis_client:
             await self.initialize_messaging()
         
         # Subscribe to collaboration channel
         async def message_handler(channel: str, message_data: str):
             try:
-                message_dict = eval(message_data)  # Safe in controlled environment
-                message = CollaborationMessage(**message_dict)
-                
-                # Check if message is for this agent
-                if (message.target_agent is None or  # Broadcast
-                    message.target_agent == agent_name):
-                    
-                    # Don't send back to sender
-                    if message.sender_agent != agent_name:
-                        # Check expiration
-                        if not message.is_expired():
-                            await callback(message)
+                # Filters broadcast/targeted, own and expired messages pre-construction
+                message = CollaborationMessage.from_json_for_agent(message_data, agent_name)
+                if message is not None:
+                    await callback(message)
             except Exception as e:
                 print(f"Error processing collaboration message: {e}")
         
-        await self.mq.subscribe_to_channel(self.collaboration_channel, message_handler)
+        # Broadcasts plus messages addressed to this agent
+        for channel in (self.collaboration_channel,
+                        collaboration_channel_name(self.group_id, agent_name)):
+            await self.mq.subscribe_to_channel(channel, message_handler)
+            self._subscribed_channels.add(channel)
     
     def get_group_status(self) -> Dict[str, Any]:
         """Get status of the collaboration group"""
+        now = time.time()
         return {
             "group_id": self.group_id,
             "group_name": self.group_name,
@@ -284,10 +447,10 @@ class CollaborativeAgentGroup:
             "created_at": self.created_at,
             "total_messages": len(self.message_history),
             "active_agents": [
-                name for name, data in self.agents.items()
-                if (datetime.utcnow() - data["last_activity"]).total_seconds() < 300  # 5 min
+                name for name, active_until in self._active_agents.items()
+                if active_until > now
             ],
-            "restrictions": self.restrictions.model_dump()
+            "restrictions": self._restrictions_dump
         }
     
     def cleanup_expired_messages(self) -> int:
@@ -304,9 +467,17 @@ class CollaborativeAgentGroup:
     
     async def shutdown(self) -> None:
         """Shutdown the collaboration group"""
+        for timer in self._active_timers.values():
+            timer.cancel()
+        self._active_timers.clear()
+        self._active_agents.clear()
+        
         if self.mq:
-            await self.mq.unsubscribe_from_channel(self.collaboration_channel)
-            await self.mq.disconnect()
+            for channel in self._subscribed_channels:
+                await self.mq.unsubscribe_from_channel(channel)
+            self._subscribed_channels.clear()
+            if self._owns_mq:
+                await self.mq.disconnect()
 
 
 class CollaborationManager:
@@ -316,6 +487,11 @@ class CollaborationManager:
         self.config = config
         self.active_groups: Dict[str, CollaborativeAgentGroup] = {}
         self.group_counter = 0
+        # Min-heap of (epoch seconds before which the group cannot be removed, group_id);
+        # keys are lower bounds, revalidated when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Single Redis connection shared by every group's channel
+        self._shared_mq: Optional[RedisMQ] = None
     
     def create_collaboration_group(
         self,
@@ -326,41 +502,62 @@ class CollaborationManager:
         self.group_counter += 1
         group_id = f"collab_{self.group_counter}_{uuid.uuid4().hex[:8]}"
         
+        if self._shared_mq is None:
+            self._shared_mq = RedisMQ(self.config.message_queue)
+        
         group = CollaborativeAgentGroup(
             group_id=group_id,
             group_name=group_name,
             config=self.config,
-            restrictions=restrictions
+            restrictions=restrictions,
+            mq=self._shared_mq
         )
         
         self.active_groups[group_id] = group
+        heapq.heappush(self._expiry_heap, (group.last_activity_ts, group_id))
         return group
     
     def get_group(self, group_id: str) -> Optional[CollaborativeAgentGroup]:
         """Get a collaboration group by ID"""
         return self.active_groups.get(group_id)
     
+    async def remove_group(self, group_id: str) -> None:
+        """Shut down and forget a collaboration group"""
+        group = self.active_groups.pop(group_id, None)
+        # Its expiry heap entry is skipped once the group is gone
+        if group is not None:
+            await group.shutdown()
+    
     def list_groups(self) -> List[Dict[str, Any]]:
         """List all active collaboration groups"""
         return [group.get_group_status() for group in self.active_groups.values()]
     
-    async def cleanup_inactive_groups(self, max_age_hours: int = 24) -> List[str]:
-        """Remove groups that have been inactive"""
-        now = datetime.utcnow()
+    async def cleanup_inactive_groups(self, max_age_hours: int = 24, inactive_hours: float = 1) -> List[str]:
+        """Remove groups older than max_age_hours with no activity in the last inactive_hours
+        
+        Only groups whose removal deadline has passed are popped from the
+        expiry heap, and a group is pushed back only when activity has moved
+        its deadline, so a sweep is O(k log G) in the number of due groups.
+        """
+        now = time.time()
+        max_age = max_age_hours * 3600
+        inactive_for = inactive_hours * 3600
         to_remove = []
         
-        for group_id, group in self.active_groups.items():
-            age = now - group.created_at
-            if age.total_seconds() > (max_age_hours * 3600):
-                # Check if any agent had recent activity
-                recent_activity = any(
-                    (now - agent_data["last_activity"]).total_seconds() < 3600
-                    for agent_data in group.agents.values()
-                )
-                
-                if not recent_activity:
-                    to_remove.append(group_id)
-                    await group.shutdown()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, group_id = heapq.heappop(self._expiry_heap)
+            group = self.active_groups.get(group_id)
+            if group is None:
+                continue
+            
+            deadline = max(group.last_activity_ts + inactive_for, group.created_ts + max_age)
+            if deadline > now:
+                # Not due yet (recent activity, or still too young): requeue at its real deadline
+                heapq.heappush(self._expiry_heap, (deadline, group_id))
+                continue
+            
+            to_remove.append(group_id)
+            await group.shutdown()
         
         for group_id in to_remove:
             del self.active_groups[group_id]
@@ -371,4 +568,9 @@ class CollaborationManager:
         """Shutdown all collaboration groups"""
         for group in self.active_groups.values():
             await group.shutdown()
-        self.active_groups.clear()
\ No newline at end of file
+        self.active_groups.clear()
+        self._expiry_heap.clear()
+        
+        if self._shared_mq:
+            await self._shared_mq.disconnect()
+            self._shared_mq = None
\ No newline at end of file
@@ -1,9 +1,12 @@
 """Dynamic Sub-Agent creation and role-based templates"""
 
-import uuid
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from .sub_agent_config import SubAgentProfile, DockerConfig
+import heapq
+import re
+import secrets
+import time
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+from datetime import datetime, timezone
+from .sub_agent_config import SubAgentProfile, DockerConfig, LLMConfig
 
 
 class SubAgentRole:
@@ -13,7 +16,7 @@ class SubAgentRole:
         self,
         role_name: str,
         description: str,
-        tools: List[str],
+        tools: Sequence[str],
         system_prompt_template: str,
         specialization: str
     ):
@@ -22,32 +25,52 @@ class SubAgentRole:
         self.tools = tools
         self.system_prompt_template = system_prompt_template
         self.specialization = specialization
+        
+        # Pre-apply the fixed specialization and split around the task placeholder;
+        # templates with any other braces keep going through str.format
+        self._prompt_prefix: Optional[str] = None
+        self._prompt_suffix: Optional[str] = None
+        parts = system_prompt_template.split("{task_description}")
+        if len(parts) == 2 and not any(
+            brace in part.replace("{specialization}", "")
+            for part in parts for brace in "{}"
+        ):
+            self._prompt_prefix, self._prompt_suffix = (
+                part.replace("{specialization}", specialization) for part in parts
+            )
     
     def create_profile(
         self, 
         task_description: str,
-        llm_config: Dict[str, Any],
+        llm_config: Union[LLMConfig, Dict[str, Any]],
         instance_id: Optional[str] = None
     ) -> SubAgentProfile:
-        """Create a Sub-Agent profile for this role"""
+        """Create a Sub-Agent profile for this role
+        
+        The generated instance_id is 8 hex characters (32 bits of entropy),
+        ample for the handful of concurrent dynamic agents allowed.
+        """
         
         if not instance_id:
-            instance_id = str(uuid.uuid4())[:8]
+            instance_id = secrets.token_hex(4)
         
         profile_name = f"dynamic_{self.role_name}_{instance_id}"
         
         # Customize system prompt with task-specific information
-        system_prompt = self.system_prompt_template.format(
-            task_description=task_description,
-            specialization=self.specialization
-        )
+        if self._prompt_prefix is not None:
+            system_prompt = f"{self._prompt_prefix}{task_description}{self._prompt_suffix}"
+        else:
+            system_prompt = self.system_prompt_template.format(
+                task_description=task_description,
+                specialization=self.specialization
+            )
         
         return SubAgentProfile(
             name=profile_name,
             description=f"{self.description} (Created for: {task_description})",
             version="dynamic-1.0",
             llm_config=llm_config,
-            tools=self.tools,
+            tools=list(self.tools),
             system_prompt=system_prompt,
             docker_config=DockerConfig(
                 base_image="python:3.9-slim",
@@ -57,22 +80,24 @@ class SubAgentRole:
         )
 
 
-class RoleTemplateRegistry:
-    """Registry of available role templates for dynamic Sub-Agent creation"""
-    
-    def __init__(self):
-        self.roles: Dict[str, SubAgentRole] = {}
-        self._register_default_roles()
-    
-    def _register_default_roles(self) -> None:
-        """Register default role templates"""
-        
-        # Data Analyst Role
-        self.register_role(SubAgentRole(
-            role_name="data_analyst",
-            description="Specialized Sub-Agent for data analysis and calculations",
-            tools=["calculator", "run_python_code", "create_file", "read_file", "list_files"],
-            system_prompt_template="""You are a specialized Data Analyst Sub-Agent focused on {specialization}.
+_ROLE_DESCRIPTIONS: Dict[str, str] = {
+    "data_analyst": "Specialized Sub-Agent for data analysis and calculations",
+    "financial_analyst": "Specialized Sub-Agent for financial calculations and analysis",
+    "research_analyst": "Specialized Sub-Agent for research and information analysis",
+    "problem_solver": "Specialized Sub-Agent for general problem-solving tasks",
+    "quality_analyst": "Specialized Sub-Agent for quality assurance and validation"
+}
+
+_ROLE_TOOLS: Dict[str, Tuple[str, ...]] = {
+    "data_analyst": ("calculator", "run_python_code", "create_file", "read_file", "list_files"),
+    "financial_analyst": ("calculator", "run_python_code", "websearch", "create_file", "read_file"),
+    "research_analyst": ("websearch", "run_python_code", "create_file", "read_file", "list_files"),
+    "problem_solver": ("calculator", "run_python_code", "websearch", "create_file", "read_file", "run_bash_command"),
+    "quality_analyst": ("calculator", "run_python_code", "read_file", "list_files")
+}
+
+_ROLE_PROMPT_TEMPLATES: Dict[str, str] = {
+    "data_analyst": """You are a specialized Data Analyst Sub-Agent focused on {specialization}.
 
 Task Context: {task_description}
 
@@ -90,15 +115,8 @@ For the current task, apply your analytical skills to:
 
 Always use the calculator tool for any mathematical operations, even simple ones.
 Provide detailed analysis and explain your reasoning.""",
-            specialization="data analysis and statistical calculations"
-        ))
-        
-        # Financial Analyst Role
-        self.register_role(SubAgentRole(
-            role_name="financial_analyst",
-            description="Specialized Sub-Agent for financial calculations and analysis",
-            tools=["calculator", "run_python_code", "websearch", "create_file", "read_file"],
-            system_prompt_template="""You are a specialized Financial Analyst Sub-Agent focused on {specialization}.
+
+    "financial_analyst": """You are a specialized Financial Analyst Sub-Agent focused on {specialization}.
 
 Task Context: {task_description}
 
@@ -117,15 +135,8 @@ For the current task, apply your financial expertise to:
 
 Always use the calculator tool for any mathematical operations.
 Present results in clear financial terms with appropriate context.""",
-            specialization="financial analysis and monetary calculations"
-        ))
-        
-        # Research Analyst Role
-        self.register_role(SubAgentRole(
-            role_name="research_analyst",
-            description="Specialized Sub-Agent for research and information analysis",
-            tools=["websearch", "run_python_code", "create_file", "read_file", "list_files"],
-            system_prompt_template="""You are a specialized Research Analyst Sub-Agent focused on {specialization}.
+
+    "research_analyst": """You are a specialized Research Analyst Sub-Agent focused on {specialization}.
 
 Task Context: {task_description}
 
@@ -144,15 +155,8 @@ For the current task, apply your research skills to:
 
 Always use the calculator tool for numerical analysis.
 Structure your findings clearly with supporting evidence.""",
-            specialization="research and analytical investigations"
-        ))
-        
-        # Problem Solver Role
-        self.register_role(SubAgentRole(
-            role_name="problem_solver",
-            description="Specialized Sub-Agent for general problem-solving tasks",
-            tools=["calculator", "run_python_code", "websearch", "create_file", "read_file", "run_bash_command"],
-            system_prompt_template="""You are a specialized Problem Solver Sub-Agent focused on {specialization}.
+
+    "problem_solver": """You are a specialized Problem Solver Sub-Agent focused on {specialization}.
 
 Task Context: {task_description}
 
@@ -171,15 +175,8 @@ For the current task, apply your problem-solving methodology:
 
 Always use the calculator tool for mathematical operations.
 Provide clear, step-by-step solutions with reasoning.""",
-            specialization="systematic problem-solving and logical analysis"
-        ))
-        
-        # Quality Analyst Role  
-        self.register_role(SubAgentRole(
-            role_name="quality_analyst",
-            description="Specialized Sub-Agent for quality assurance and validation",
-            tools=["calculator", "run_python_code", "read_file", "list_files"],
-            system_prompt_template="""You are a specialized Quality Analyst Sub-Agent focused on {specialization}.
+
+    "quality_analyst": """You are a specialized Quality Analyst Sub-Agent focused on {specialization}.
 
 Task Context: {task_description}
 
@@ -197,42 +194,88 @@ For the current task, apply your quality assurance skills to:
 4. Ensure outputs meet quality standards
 
 Always use the calculator tool for verification calculations.
-Provide thorough quality assessments with detailed validation.""",
-            specialization="quality assurance and validation processes"
-        ))
+Provide thorough quality assessments with detailed validation."""
+}
+
+
+_ROLE_SPECIALIZATIONS: Dict[str, str] = {
+    "data_analyst": "data analysis and statistical calculations",
+    "financial_analyst": "financial analysis and monetary calculations",
+    "research_analyst": "research and analytical investigations",
+    "problem_solver": "systematic problem-solving and logical analysis",
+    "quality_analyst": "quality assurance and validation processes"
+}
+
+
+def _make_role(role_name: str) -> SubAgentRole:
+    """Build a default role template from the role tables"""
+    return SubAgentRole(
+        role_name=role_name,
+        description=_ROLE_DESCRIPTIONS[role_name],
+        tools=_ROLE_TOOLS[role_name],
+        system_prompt_template=_ROLE_PROMPT_TEMPLATES[role_name],
+        specialization=_ROLE_SPECIALIZATIONS[role_name]
+    )
+
+
+# Keywords used by suggest_role_for_task, in priority order; a keyword matches
+# anywhere in the task, so "prices" and "validation" still count
+_ROLE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "financial_analyst": ("financial", "money", "cost", "price", "budget", "profit", "discount"),
+    "data_analyst": ("data", "statistics", "analysis", "trend", "pattern"),
+    "research_analyst": ("research", "investigate", "study", "explore"),
+    "quality_analyst": ("quality", "verify", "validate", "check", "accurate")
+}
+
+# One compiled alternation per role, tried in priority order
+_ROLE_KEYWORD_RES: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (role_name, re.compile("|".join(keywords)))
+    for role_name, keywords in _ROLE_KEYWORDS.items()
+)
+
+
+class RoleTemplateRegistry:
+    """Registry of available role templates for dynamic Sub-Agent creation"""
+    
+    def __init__(self):
+        self.roles: Dict[str, SubAgentRole] = {}
+        self._available_roles_cache: Optional[Dict[str, str]] = None
     
     def register_role(self, role: SubAgentRole) -> None:
         """Register a role template"""
         self.roles[role.role_name] = role
+        self._available_roles_cache = None
     
     def get_role(self, role_name: str) -> SubAgentRole:
         """Get a role template by name"""
-        if role_name not in self.roles:
-            raise ValueError(f"Role '{role_name}' not found")
-        return self.roles[role_name]
+        role = self.roles.get(role_name)
+        if role is None:
+            # Default roles are only built the first time they are requested
+            if role_name not in _ROLE_DESCRIPTIONS:
+                raise ValueError(f"Role '{role_name}' not found")
+            role = self.roles[role_name] = _make_role(role_name)
+        return role
     
     def get_available_roles(self) -> Dict[str, str]:
-        """Get list of available roles with descriptions"""
-        return {
-            name: role.description 
-            for name, role in self.roles.items()
-        }
+        """Get list of available roles with descriptions (shared dict, do not mutate)"""
+        if self._available_roles_cache is None:
+            roles = dict(_ROLE_DESCRIPTIONS)
+            roles.update(
+                (name, role.description)
+                for name, role in self.roles.items()
+            )
+            self._available_roles_cache = roles
+        return self._available_roles_cache
     
     def suggest_role_for_task(self, task_description: str) -> str:
         """Suggest the best role for a given task description"""
         task_lower = task_description.lower()
         
         # Simple keyword-based role suggestion
-        if any(word in task_lower for word in ["financial", "money", "cost", "price", "budget", "profit", "discount"]):
-            return "financial_analyst"
-        elif any(word in task_lower for word in ["data", "statistics", "analysis", "trend", "pattern"]):
-            return "data_analyst"
-        elif any(word in task_lower for word in ["research", "investigate", "study", "explore"]):
-            return "research_analyst"
-        elif any(word in task_lower for word in ["quality", "verify", "validate", "check", "accurate"]):
-            return "quality_analyst"
-        else:
-            return "problem_solver"  # Default role
+        for role_name, keyword_re in _ROLE_KEYWORD_RES:
+            if keyword_re.search(task_lower):
+                return role_name
+        return "problem_solver"  # Default role
 
 
 class DynamicSubAgentManager:
@@ -241,7 +284,16 @@ class DynamicSubAgentManager:
     def __init__(self, max_agents: int = 5):
         self.max_agents = max_agents
         self.active_agents: Dict[str, Dict[str, Any]] = {}  # profile_name -> metadata
+        # (created epoch seconds, profile_name), oldest first; may hold removed agents
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.role_registry = RoleTemplateRegistry()
+        # Frozen, so one instance is shared by every profile that uses the default
+        self._default_llm = LLMConfig(
+            provider="openai",
+            model="gpt-3.5-turbo",
+            max_tokens=1000,
+            temperature=0.3
+        )
     
     def can_create_agent(self) -> bool:
         """Check if we can create a new dynamic agent"""
@@ -251,7 +303,7 @@ class DynamicSubAgentManager:
         self,
         task_description: str,
         role_name: Optional[str] = None,
-        llm_config: Optional[Dict[str, Any]] = None
+        llm_config: Optional[Union[LLMConfig, Dict[str, Any]]] = None
     ) -> SubAgentProfile:
         """Create a new dynamic Sub-Agent"""
         
@@ -267,23 +319,20 @@ class DynamicSubAgentManager:
         
         # Use default LLM config if not provided
         if not llm_config:
-            llm_config = {
-                "provider": "openai",
-                "model": "gpt-3.5-turbo",
-                "max_tokens": 1000,
-                "temperature": 0.3
-            }
+            llm_config = self._default_llm
         
         # Create profile
         profile = role.create_profile(task_description, llm_config)
         
         # Track the agent
+        created_at = time.time()
         self.active_agents[profile.name] = {
             "role": role_name,
             "task_description": task_description,
-            "created_at": datetime.utcnow(),
+            "created_at": created_at,  # epoch seconds
             "profile": profile
         }
+        heapq.heappush(self._expiry_heap, (created_at, profile.name))
         
         return profile
     
@@ -292,21 +341,25 @@ class DynamicSubAgentManager:
         if profile_name in self.active_agents:
             del self.active_agents[profile_name]
     
+    def get_agent_created_datetime(self, profile_name: str) -> datetime:
+        """Get an active agent's creation time as a UTC datetime"""
+        return datetime.fromtimestamp(self.active_agents[profile_name]["created_at"], tz=timezone.utc)
+    
     def list_active_agents(self) -> Dict[str, Dict[str, Any]]:
         """List all active dynamic agents"""
         return self.active_agents.copy()
     
     def cleanup_old_agents(self, max_age_hours: int = 24) -> List[str]:
         """Clean up agents older than specified hours"""
-        now = datetime.utcnow()
-        to_remove = []
-        
-        for profile_name, metadata in self.active_agents.items():
-            age = now - metadata["created_at"]
-            if age.total_seconds() > (max_age_hours * 3600):
-                to_remove.append(profile_name)
+        cutoff = time.time() - max_age_hours * 3600
+        removed = []
         
-        for profile_name in to_remove:
-            self.remove_dynamic_agent(profile_name)
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            created_at, profile_name = heapq.heappop(self._expiry_heap)
+            metadata = self.active_agents.get(profile_name)
+            # Skip entries for agents that were already removed
+            if metadata is not None and metadata["created_at"] == created_at:
+                self.remove_dynamic_agent(profile_name)
+                removed.append(profile_name)
         
-        return to_remove
\ No newline at end of file
+        return removed
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Global settings for the Raid system"""
 
+from functools import lru_cache
 from pydantic import BaseModel
-from typing import Optional
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple
 import os
 
 
@@ -21,6 +23,45 @@ class MessageQueueConfig(BaseModel):
     redis_port: int = 6379
     redis_db: int = 0
     redis_password: Optional[str] = None
+    redis_max_connections: int = 64  # Upper bound for the shared connection pool
+    redis_pool_timeout: float = 20.0  # Seconds to wait for a free pooled connection
+
+
+@lru_cache(maxsize=4)
+def _build_config(cls: type, snapshot: FrozenSet[Tuple[str, str]]) -> "RaidConfig":
+    """Build a RaidConfig from a snapshot of the relevant environment variables"""
+    env = dict(snapshot)
+    llm_provider = env.get("RAID_LLM_PROVIDER", "openai")
+    if env.get("RAID_DEBUG"):
+        print(f"DEBUG: Detected LLM Provider: '{llm_provider}' (Type: {type(llm_provider)})")
+    
+    if llm_provider == "openai":
+        llm_raw = {
+            "provider": "openai",
+            "api_key": env.get("OPENAI_API_KEY"),
+            "model": env.get("RAID_OPENAI_MODEL", "gpt-4o")
+        }
+    elif llm_provider == "ollama":
+        llm_raw = {
+            "provider": "ollama",
+            "base_url": env.get("RAID_OLLAMA_URL", "http://localhost:11434"),
+            "model": env.get("RAID_OLLAMA_MODEL", "qwen3:30b")
+        }
+    else:
+        raise ValueError(f"Unsupported LLM provider: {llm_provider}")
+    
+    # Validate the whole tree in one pass; Pydantic coerces the numeric strings
+    return cls.model_validate({
+        "llm_backend": llm_raw,
+        "message_queue": {
+            "redis_host": env.get("RAID_REDIS_HOST", "localhost"),
+            "redis_port": env.get("RAID_REDIS_PORT", "6379"),
+            "redis_db": env.get("RAID_REDIS_DB", "0"),
+            "redis_password": env.get("RAID_REDIS_PASSWORD")
+        },
+        "docker_socket": env.get("RAID_DOCKER_SOCKET", "unix://var/run/docker.sock"),
+        "max_dynamic_sub_agents": env.get("RAID_MAX_DYNAMIC_SUB_AGENTS", "5")
+    })
 
 
 class RaidConfig(BaseModel):
@@ -32,35 +73,28 @@ class RaidConfig(BaseModel):
     
     @classmethod
     def from_env(cls) -> "RaidConfig":
-        """Create configuration from environment variables"""
-        llm_provider = os.getenv("RAID_LLM_PROVIDER", "openai")
-        print(f"DEBUG: Detected LLM Provider: '{llm_provider}' (Type: {type(llm_provider)})")
+        """Create configuration from environment variables
         
-        if llm_provider == "openai":
-            llm_config = LLMBackendConfig(
-                provider="openai",
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model=os.getenv("RAID_OPENAI_MODEL", "gpt-4o")
-            )
-        elif llm_provider == "ollama":
-            llm_config = LLMBackendConfig(
-                provider="ollama",
-                base_url=os.getenv("RAID_OLLAMA_URL", "http://localhost:11434"),
-                model=os.getenv("RAID_OLLAMA_MODEL", "qwen3:30b")
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {llm_provider}")
-        
-        mq_config = MessageQueueConfig(
-            redis_host=os.getenv("RAID_REDIS_HOST", "localhost"),
-            redis_port=int(os.getenv("RAID_REDIS_PORT", "6379")),
-            redis_db=int(os.getenv("RAID_REDIS_DB", "0")),
-            redis_password=os.getenv("RAID_REDIS_PASSWORD")
+        Builds are cached per environment snapshot and each caller gets its
+        own copy; call clear_config_cache() to force a fresh build.
+        """
+        snapshot = frozenset(
+            (key, value) for key, value in os.environ.items()
+            if key.startswith("RAID_") or key == "OPENAI_API_KEY"
         )
-        
-        return cls(
-            llm_backend=llm_config,
-            message_queue=mq_config,
-            docker_socket=os.getenv("RAID_DOCKER_SOCKET", "unix://var/run/docker.sock"),
-            max_dynamic_sub_agents=int(os.getenv("RAID_MAX_DYNAMIC_SUB_AGENTS", "5"))
-        )
\ No newline at end of file
+        return _build_config(cls, snapshot).model_copy(deep=True)
+    
+    @property
+    def subagent_base_env(self) -> Mapping[str, str]:
+        """Container environment shared by every Sub-Agent, read-only and built from the current settings"""
+        return MappingProxyType({
+            "RAID_LLM_PROVIDER": self.llm_backend.provider,
+            "OPENAI_API_KEY": self.llm_backend.api_key or "",
+            "RAID_REDIS_HOST": "host.docker.internal",
+            "RAID_REDIS_PORT": str(self.message_queue.redis_port),
+        })
+
+
+def clear_config_cache() -> None:
+    """Drop the configurations cached by RaidConfig.from_env"""
+    _build_config.cache_clear()
\ No newline at end of file
@@ -1,11 +1,69 @@
 """Sub-Agent Auto-Configurator for YAML profile management"""
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 import yaml
 import os
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+_REQUIREMENTS_TXT = """pydantic>=2.0.0
+pyyaml>=6.0
+redis>=4.5.0
+openai>=1.0.0
+requests>=2.28.0
+asyncio-mqtt>=0.13.0
+aiohttp>=3.8.0
+beautifulsoup4>=4.0.0
+orjson>=3.9.0
+"""
+
+_DOCKERFILE_TEMPLATE = """# Dockerfile for {name}
+FROM {base_image}
+
+WORKDIR {working_dir}
+
+# Set profile environment variables for build and runtime
+{env_section}
+
+# Install OS dependencies
+{install_section}
+
+# Install Python dependencies
+COPY requirements.txt .
+RUN python3 -m pip install --no-cache-dir -r requirements.txt
+
+# Runtime settings; set after the installs so profiles with the same base image
+# and packages share the dependency layers
+{runtime_env_section}
+
+# Copy Sub-Agent code
+COPY src/ ./src/
+
+# Copy profile configuration
+COPY profiles/{name}.yaml ./profile.yaml
+
+# Run the Sub-Agent
+CMD ["python3", "-m", "raid.sub_agent.main"]
+"""
+
+
+class LLMConfig(BaseModel, frozen=True):
+    """LLM settings for a Sub-Agent profile (immutable, safe to share between profiles)"""
+    provider: str
+    model: str
+    max_tokens: int = 1000
+    temperature: float = 0.3
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
+
 
 class DockerConfig(BaseModel):
     """Docker configuration for Sub-Agent"""
@@ -30,7 +88,7 @@ class SubAgentProfile(BaseModel):
     name: str
     description: str
     version: str
-    llm_config: Dict[str, Any]
+    llm_config: LLMConfig
     tools: List[str]
     system_prompt: str
     docker_config: DockerConfig
@@ -38,16 +96,34 @@ class SubAgentProfile(BaseModel):
     
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "SubAgentProfile":
-        """Load profile from YAML file"""
+        """Load profile from YAML file, reusing the parsed profile while the file is unchanged"""
+        mtime_ns = os.stat(yaml_path).st_mtime_ns
+        cached = _PROFILE_CACHE.get(yaml_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
         with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         
-        return cls(**data)
+        profile = cls(**data)
+        _PROFILE_CACHE[yaml_path] = (mtime_ns, profile)
+        return profile
     
     def to_yaml(self, yaml_path: str) -> None:
         """Save profile to YAML file"""
+        _PROFILE_CACHE.pop(yaml_path, None)
         with open(yaml_path, 'w') as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            f.write(self.to_yaml_string())
+    
+    def to_yaml_string(self) -> str:
+        """Serialize profile as YAML, leaving out fields that were never set"""
+        # Written-out defaults would read back as explicit choices, e.g. an llm_config
+        # temperature overriding the global backend setting in the sub-agent
+        return yaml.dump(self.model_dump(exclude_unset=True), default_flow_style=False)
+
+
+# yaml_path -> (st_mtime_ns, parsed profile)
+_PROFILE_CACHE: Dict[str, Tuple[int, SubAgentProfile]] = {}
 
 
 class SubAgentConfigurator:
@@ -63,9 +139,12 @@ class SubAgentConfigurator:
                 self.profiles_dir = Path(".")
             else:
                 self.profiles_dir.mkdir(exist_ok=True)
+        
+        # (fingerprint of the YAML files, profiles) from the last full scan
+        self._all_profiles: Optional[Tuple[FrozenSet[Tuple[str, int]], Dict[str, SubAgentProfile]]] = None
     
     def load_profile(self, profile_name: str) -> SubAgentProfile:
-        """Load a Sub-Agent profile by name"""
+        """Load a Sub-Agent profile by name (parsed profiles are cached per file mtime)"""
         # First try the standard path
         yaml_path = self.profiles_dir / f"{profile_name}.yaml"
         
@@ -84,89 +163,118 @@ class SubAgentConfigurator:
         """Save a Sub-Agent profile"""
         yaml_path = self.profiles_dir / f"{profile.name}.yaml"
         profile.to_yaml(str(yaml_path))
+        self._all_profiles = None
+    
+    def save_profiles(self, profiles: List[SubAgentProfile]) -> None:
+        """Save several Sub-Agent profiles, invalidating the caches once"""
+        for profile in profiles:
+            profile.to_yaml(str(self.profiles_dir / f"{profile.name}.yaml"))
+        self._all_profiles = None
+    
+    def delete_profiles(self, profile_names: List[str]) -> None:
+        """Delete saved Sub-Agent profiles, ignoring ones that were never written"""
+        for profile_name in profile_names:
+            yaml_path = self.profiles_dir / f"{profile_name}.yaml"
+            _PROFILE_CACHE.pop(str(yaml_path), None)
+            yaml_path.unlink(missing_ok=True)
+        self._all_profiles = None
+    
+    def _iter_profile_paths(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (profile name, path) for every YAML file in the profiles directory"""
+        for path in self.profiles_dir.iterdir():
+            if path.suffix == ".yaml":
+                yield path.stem, path
+    
+    def _load_path(self, path: Path) -> SubAgentProfile:
+        """Load a profile from a path already known to exist"""
+        return SubAgentProfile.from_yaml(str(path))
     
     def list_profiles(self) -> List[str]:
         """List available profile names"""
-        return [
-            f.stem for f in self.profiles_dir.glob("*.yaml")
-        ]
+        return [stem for stem, _ in self._iter_profile_paths()]
+    
+    def _try_load_path(self, entry: Tuple[str, Path]) -> Optional[SubAgentProfile]:
+        """Load one profile for get_all_profiles, reporting failures instead of raising"""
+        profile_name, path = entry
+        try:
+            return self._load_path(path)
+        except Exception as e:
+            print(f"Warning: Failed to load profile '{profile_name}': {e}")
+            return None
     
     def get_all_profiles(self) -> Dict[str, SubAgentProfile]:
-        """Get all available profiles"""
+        """Get all available profiles, reloading only when a YAML file is added, removed or edited"""
+        entries = list(self._iter_profile_paths())
+        # Edits in place keep the directory's mtime, so fingerprint each file
+        fingerprint = frozenset((path.name, path.stat().st_mtime_ns) for _, path in entries)
+        if self._all_profiles is not None and self._all_profiles[0] == fingerprint:
+            return dict(self._all_profiles[1])
+        
         profiles = {}
-        for profile_name in self.list_profiles():
-            try:
-                profiles[profile_name] = self.load_profile(profile_name)
-            except Exception as e:
-                print(f"Warning: Failed to load profile '{profile_name}': {e}")
-        return profiles
+        if entries:
+            # Read the files in parallel
+            with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+                loaded = executor.map(self._try_load_path, entries)
+                profiles = {
+                    profile_name: profile
+                    for (profile_name, _), profile in zip(entries, loaded)
+                    if profile is not None
+                }
+        
+        self._all_profiles = (fingerprint, profiles)
+        return dict(profiles)
     
     def generate_dockerfile(self, profile: SubAgentProfile) -> str:
         """Generate Dockerfile content for a Sub-Agent profile"""
-        
-        install_commands = []
-        packages_to_install = set(profile.docker_config.additional_packages or [])
-
-        # For slim images that might not have pip
-        if "slim" in profile.docker_config.base_image and "python3-pip" not in packages_to_install:
-            packages_to_install.add("python3-pip")
-
-        if packages_to_install:
-            install_commands.append("apt-get update -y")
-            install_commands.append(f"apt-get install -y --no-install-recommends {' '.join(sorted(list(packages_to_install)))}")
-            install_commands.append("rm -rf /var/lib/apt/lists/*")
-
-        install_section = f"RUN {' && '.join(install_commands)}" if install_commands else ""
-        
-        python_executable = "python3"
-        
-        env_vars = {
-            "PYTHONPATH": f"{profile.docker_config.working_dir}/src",
-            "RAID_SUB_AGENT_PROFILE": profile.name,
-        }
-        if profile.docker_config.environment_variables:
-            env_vars.update(profile.docker_config.environment_variables)
-
-        env_section = "\n".join([f"ENV {key}={value}" for key, value in env_vars.items()])
-
-        dockerfile_content = f"""# Dockerfile for {profile.name}
-FROM {profile.docker_config.base_image}
+        return _render_dockerfile(profile.name, profile.docker_config.model_dump_json())
+    
+    @staticmethod
+    def generate_requirements_txt() -> str:
+        """Generate requirements.txt for Sub-Agent Docker image"""
+        return _REQUIREMENTS_TXT
 
-WORKDIR {profile.docker_config.working_dir}
 
-# Set environment variables for build and runtime
-{env_section}
+@lru_cache(maxsize=128)
+def _render_dockerfile(profile_name: str, docker_config_json: str) -> str:
+    """Render a Dockerfile, cached by profile name and serialized DockerConfig"""
+    docker_config = DockerConfig.model_validate_json(docker_config_json)
+    
+    install_commands = []
+    packages_to_install = set(docker_config.additional_packages or [])
 
-# Install OS dependencies
-{install_section}
+    # For slim images that might not have pip
+    if "slim" in docker_config.base_image and "python3-pip" not in packages_to_install:
+        packages_to_install.add("python3-pip")
 
-# Install Python dependencies
-COPY requirements.txt .
-RUN {python_executable} -m pip install --no-cache-dir -r requirements.txt
+    if packages_to_install:
+        install_commands.append("apt-get update -y")
+        install_commands.append(f"apt-get install -y --no-install-recommends {' '.join(sorted(packages_to_install))}")
+        install_commands.append("rm -rf /var/lib/apt/lists/*")
 
-# Copy Sub-Agent code
-COPY src/ ./src/
+    install_section = f"RUN {' && '.join(install_commands)}" if install_commands else ""
+    
+    runtime_env_vars = {
+        "PYTHONPATH": f"{docker_config.working_dir}/src",
+        "RAID_SUB_AGENT_PROFILE": profile_name,
+    }
+    env_vars = dict(docker_config.environment_variables or {})
+    # Profile variables still override the runtime defaults
+    for key in env_vars.keys() & runtime_env_vars.keys():
+        runtime_env_vars[key] = env_vars.pop(key)
 
-# Copy profile configuration
-COPY profiles/{profile.name}.yaml ./profile.yaml
+    env_section = "\n".join([f"ENV {key}={value}" for key, value in env_vars.items()])
+    runtime_env_section = "\n".join([f"ENV {key}={value}" for key, value in runtime_env_vars.items()])
 
-# Run the Sub-Agent
-CMD ["{python_executable}", "-m", "raid.sub_agent.main"]
-"""
-        
-        if profile.docker_config.expose_port:
-            dockerfile_content += f"\nEXPOSE {profile.docker_config.expose_port}\n"
-        
-        return dockerfile_content
+    dockerfile_content = _DOCKERFILE_TEMPLATE.format(
+        name=profile_name,
+        base_image=docker_config.base_image,
+        working_dir=docker_config.working_dir,
+        env_section=env_section,
+        runtime_env_section=runtime_env_section,
+        install_section=install_section
+    )
     
-    def generate_requirements_txt(self) -> str:
-        """Generate requirements.txt for Sub-Agent Docker image"""
-        return """pydantic>=2.0.0
-pyyaml>=6.0
-redis>=4.5.0
-openai>=1.0.0
-requests>=2.28.0
-asyncio-mqtt>=0.13.0
-aiohttp>=3.8.0
-beautifulsoup4>=4.0.0
-"""
\ No newline at end of file
+    if docker_config.expose_port:
+        dockerfile_content += f"\nEXPOSE {docker_config.expose_port}\n"
+    
+    return dockerfile_content
\ No newline at end of file
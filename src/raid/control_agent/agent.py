@@ -1,6 +1,8 @@
 """Control Agent - The master orchestrator using ReAct cycles"""
 
 import asyncio
+import os
+from functools import cached_property
 from typing import Optional
 
 from ..config.settings import RaidConfig
@@ -16,34 +18,56 @@ class ControlAgent:
     def __init__(self, config: RaidConfig):
         self.config = config
         
-        # Initialize LLM backend for Control Agent
-        self.llm_backend = create_llm_backend(config.llm_backend)
-        
         # Initialize lifecycle manager
         self.lifecycle_manager = SubAgentLifecycleManager(config)
-        
-        # Initialize meta-tool registry (pass lifecycle manager to it)
-        self.meta_tool_registry = MetaToolRegistry(config, lifecycle_manager=self.lifecycle_manager)
-        
-        # Initialize ReAct engine
-        self.react_engine = ReActEngine(
+    
+    # Heavier components are built on first use
+    
+    @cached_property
+    def llm_backend(self):
+        """LLM backend for Control Agent"""
+        return create_llm_backend(self.config.llm_backend)
+    
+    @cached_property
+    def meta_tool_registry(self) -> MetaToolRegistry:
+        """Meta-tool registry sharing the lifecycle manager"""
+        return MetaToolRegistry(self.config, lifecycle_manager=self.lifecycle_manager)
+    
+    @cached_property
+    def react_engine(self) -> ReActEngine:
+        """ReAct engine driving the meta-tools"""
+        return ReActEngine(
             llm_backend=self.llm_backend,
             meta_tool_registry=self.meta_tool_registry,
             max_steps=20
         )
+    
+    def describe(self) -> None:
+        """Print a summary of the Control Agent configuration (silenced by RAID_QUIET)"""
+        if os.getenv("RAID_QUIET"):
+            return
         
-        print("🤖 Control Agent initialized successfully")
-        print(f"   LLM Backend: {config.llm_backend.provider} ({config.llm_backend.model})")
-        print(f"   Meta-Tools: {len(self.meta_tool_registry.list_tool_names())} available")
+        lines = [
+            "🤖 Control Agent initialized successfully",
+            f"   LLM Backend: {self.config.llm_backend.provider} ({self.config.llm_backend.model})"
+        ]
+        # Only report the tool count if the registry has already been built
+        if "meta_tool_registry" in self.__dict__:
+            lines.append(f"   Meta-Tools: {len(self.meta_tool_registry.list_tool_names())} available")
+        print("\n".join(lines))
     
     async def start(self):
         """Start the Control Agent and its lifecycle manager"""
+        self.describe()
         await self.lifecycle_manager.start_monitoring()
         print("🤖 Control Agent started with lifecycle management")
     
     async def stop(self):
         """Stop the Control Agent and cleanup all Sub-Agents"""
         await self.lifecycle_manager.stop_monitoring()
+        # Only close the LLM backend if it was ever built
+        if "llm_backend" in self.__dict__:
+            await self.llm_backend.close()
         print("🤖 Control Agent stopped")
     
     async def process_user_goal(self, user_goal: str, task_id: Optional[str] = None) -> TaskContext:
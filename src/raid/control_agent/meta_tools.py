@@ -1,18 +1,23 @@
 """Meta-tools for Control Agent to orchestrate Sub-Agents"""
 
 import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, ClassVar, Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel
 
 from ..config.settings import RaidConfig
 from ..config.sub_agent_config import SubAgentConfigurator, SubAgentProfile
 from ..config.dynamic_subagent import DynamicSubAgentManager
-from ..config.collaboration import CollaborationManager, CollaborationRestrictions, CollaborationMessageType
+from ..config.collaboration import CollaborationManager, CollaborationRestrictions, CollaborationMessageType, CollaborativeAgentGroup
 from ..docker_orchestrator.orchestrator import DockerOrchestrator
-from ..message_queue.redis_mq import RedisMQ
+from ..message_queue.redis_mq import READY_HEARTBEAT_SECONDS, RedisMQ
 from ..message_queue.models import TaskMessage
 
+# Dispatch diagnostics; the CLI routes the "raid" loggers to stdout
+logger = logging.getLogger(__name__)
+
 
 class MetaToolParameter(BaseModel):
     """Parameter definition for a meta-tool"""
@@ -32,27 +37,24 @@ class MetaToolDefinition(BaseModel):
 class MetaTool(ABC):
     """Abstract base class for Control Agent meta-tools"""
     
+    # Definition constants, set once on each subclass
+    name: ClassVar[str]
+    description: ClassVar[str]
+    parameters: ClassVar[List[MetaToolParameter]]
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Reject concrete meta-tools that leave a definition constant unset"""
+        super().__init_subclass__(**kwargs)
+        # Intermediate abstract bases may leave them to their own subclasses
+        if getattr(cls.execute, "__isabstractmethod__", False):
+            return
+        missing = [attr for attr in ("name", "description", "parameters") if not hasattr(cls, attr)]
+        if missing:
+            raise TypeError(f"Meta-tool {cls.__name__} must define {', '.join(missing)}")
+    
     def __init__(self, config: RaidConfig):
         self.config = config
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Meta-tool name"""
-        pass
-    
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Meta-tool description"""
-        pass
-    
-    @property
-    @abstractmethod
-    def parameters(self) -> List[MetaToolParameter]:
-        """Meta-tool parameters"""
-        pass
-    
     @abstractmethod
     async def execute(self, **kwargs: Any) -> str:
         """Execute the meta-tool with given parameters"""
@@ -67,118 +69,163 @@ class MetaTool(ABC):
         )
 
 
+# Enhanced capability descriptions for the bundled static profiles
+_PROFILE_CAPABILITIES = {
+    "calculator_agent": {
+        "use_cases": ["Mathematical calculations", "Statistical analysis", "Numerical computations", "Data analysis", "Mathematical modeling"],
+        "best_for": "Any task involving numbers, arithmetic, algebra, calculus, or mathematical operations"
+    },
+    "developer_agent": {
+        "use_cases": ["Software development", "Code generation", "Code review", "Testing", "Build automation", "File management"],
+        "best_for": "Programming tasks, software engineering, technical implementation, code-related operations"
+    },
+    "advanced_agent": {
+        "use_cases": ["System integration", "API integration", "Workflow automation", "Multi-domain tasks", "Infrastructure management"],
+        "best_for": "Complex workflows requiring multiple tools, system integration, automation tasks"
+    },
+    "research_agent": {
+        "use_cases": ["Web research", "Information gathering", "Market analysis", "Fact-checking", "Data collection"],
+        "best_for": "Tasks requiring external information, research, competitive analysis, knowledge synthesis"
+    },
+    "setup_agent": {
+        "use_cases": ["Environment setup", "Repository cloning", "Dependency installation", "Build configuration", "Infrastructure setup"],
+        "best_for": "Project initialization, development environment configuration, deployment setup"
+    }
+}
+
+
 class DiscoverSubAgentProfilesTool(MetaTool):
     """Meta-tool to discover available Sub-Agent profiles"""
     
-    @property
-    def name(self) -> str:
-        return "discover_sub_agent_profiles"
-    
-    @property
-    def description(self) -> str:
-        return "Get comprehensive list of available static Sub-Agent profiles with their capabilities, tools, and recommended use cases. Use this FIRST to understand what existing profiles can handle before considering dynamic agent creation."
+    name: ClassVar[str] = "discover_sub_agent_profiles"
+    description: ClassVar[str] = "Get comprehensive list of available static Sub-Agent profiles with their capabilities, tools, and recommended use cases. Use this FIRST to understand what existing profiles can handle before considering dynamic agent creation."
+    parameters: ClassVar[List[MetaToolParameter]] = []  # No parameters needed
     
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return []  # No parameters needed
+    def __init__(self, config: RaidConfig, configurator: Optional[SubAgentConfigurator] = None):
+        super().__init__(config)
+        self.configurator = configurator or SubAgentConfigurator()
+        # name -> (profile the card was rendered from, card); the configurator hands
+        # back the same profile object until its YAML changes
+        self._cards: Dict[str, Tuple[SubAgentProfile, str]] = {}
+    
+    def _render_card(self, name: str, profile: SubAgentProfile) -> str:
+        """Get the discovery card for a profile, rendering it only when the profile changed"""
+        cached = self._cards.get(name)
+        if cached and cached[0] is profile:
+            return cached[1]
+        
+        parts = [
+            f"\n🔧 **{name}** (v{profile.version})\n",
+            f"   📝 Description: {profile.description}\n",
+            f"   🛠️  Tools: {', '.join(profile.tools)}\n",
+            f"   🧠 LLM Model: {profile.llm_config.model}\n"
+        ]
+        
+        # Add enhanced capability information
+        caps = _PROFILE_CAPABILITIES.get(name)
+        if caps:
+            parts.append(f"   ✅ Use Cases: {', '.join(caps['use_cases'])}\n")
+            parts.append(f"   🎯 Best For: {caps['best_for']}\n")
+        
+        parts.append("\n")
+        card = "".join(parts)
+        self._cards[name] = (profile, card)
+        return card
     
     async def execute(self, **kwargs: Any) -> str:
         """Discover available Sub-Agent profiles"""
         try:
-            configurator = SubAgentConfigurator()
-            profiles = configurator.get_all_profiles()
+            profiles = await asyncio.to_thread(self.configurator.get_all_profiles)
             
             if not profiles:
                 return "No Sub-Agent profiles available."
             
-            result = "🤖 Available Static Sub-Agent Profiles (PREFER THESE OVER DYNAMIC CREATION):\n"
-            
-            # Define enhanced capability descriptions for each profile
-            profile_capabilities = {
-                "calculator_agent": {
-                    "use_cases": ["Mathematical calculations", "Statistical analysis", "Numerical computations", "Data analysis", "Mathematical modeling"],
-                    "best_for": "Any task involving numbers, arithmetic, algebra, calculus, or mathematical operations"
-                },
-                "developer_agent": {
-                    "use_cases": ["Software development", "Code generation", "Code review", "Testing", "Build automation", "File management"],
-                    "best_for": "Programming tasks, software engineering, technical implementation, code-related operations"
-                },
-                "advanced_agent": {
-                    "use_cases": ["System integration", "API integration", "Workflow automation", "Multi-domain tasks", "Infrastructure management"],
-                    "best_for": "Complex workflows requiring multiple tools, system integration, automation tasks"
-                },
-                "research_agent": {
-                    "use_cases": ["Web research", "Information gathering", "Market analysis", "Fact-checking", "Data collection"],
-                    "best_for": "Tasks requiring external information, research, competitive analysis, knowledge synthesis"
-                },
-                "setup_agent": {
-                    "use_cases": ["Environment setup", "Repository cloning", "Dependency installation", "Build configuration", "Infrastructure setup"],
-                    "best_for": "Project initialization, development environment configuration, deployment setup"
-                }
-            }
+            parts = ["🤖 Available Static Sub-Agent Profiles (PREFER THESE OVER DYNAMIC CREATION):\n"]
+            parts.extend(self._render_card(name, profile) for name, profile in profiles.items())
             
-            for name, profile in profiles.items():
-                result += f"\n🔧 **{name}** (v{profile.version})\n"
-                result += f"   📝 Description: {profile.description}\n"
-                result += f"   🛠️  Tools: {', '.join(profile.tools)}\n"
-                result += f"   🧠 LLM Model: {profile.llm_config.get('model', 'default')}\n"
-                
-                # Add enhanced capability information
-                if name in profile_capabilities:
-                    caps = profile_capabilities[name]
-                    result += f"   ✅ Use Cases: {', '.join(caps['use_cases'])}\n"
-                    result += f"   🎯 Best For: {caps['best_for']}\n"
-                
-                result += "\n"
-            
-            result += "💡 RECOMMENDATION: Always try to use these existing static profiles before creating dynamic agents.\n"
-            result += "   Dynamic agents should only be created for highly specialized tasks that existing profiles cannot handle.\n"
+            parts.append("💡 RECOMMENDATION: Always try to use these existing static profiles before creating dynamic agents.\n")
+            parts.append("   Dynamic agents should only be created for highly specialized tasks that existing profiles cannot handle.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             return f"Error discovering profiles: {str(e)}"
 
 
+# Upper bound on waiting for a Sub-Agent ready signal, and how long one stays trusted
+# (no longer than the Sub-Agent's heartbeat period, so a dead one is noticed quickly)
+READY_TIMEOUT_SECONDS = 2.0
+READY_CACHE_SECONDS = READY_HEARTBEAT_SECONDS
+# How long a container seen running is trusted before Docker is asked again
+RUNNING_CACHE_SECONDS = 30
+
+
 class DispatchToSubAgentTool(MetaTool):
     """Meta-tool to dispatch tasks to Sub-Agents"""
     
-    def __init__(self, config: RaidConfig, lifecycle_manager=None):
+    name: ClassVar[str] = "dispatch_to_sub_agent"
+    description: ClassVar[str] = "Send a task to a specific Sub-Agent and wait for the result"
+    parameters: ClassVar[List[MetaToolParameter]] = [
+        MetaToolParameter(
+            name="sub_agent_profile",
+            type="string",
+            description="Name of the Sub-Agent profile to use (e.g., 'calculator_agent')",
+            required=True
+        ),
+        MetaToolParameter(
+            name="task_prompt",
+            type="string",
+            description="The task prompt to send to the Sub-Agent",
+            required=True
+        ),
+        MetaToolParameter(
+            name="timeout",
+            type="integer",
+            description="Timeout in seconds to wait for result (default: 300)",
+            required=False
+        )
+    ]
+    
+    def __init__(
+        self,
+        config: RaidConfig,
+        lifecycle_manager=None,
+        configurator: Optional[SubAgentConfigurator] = None,
+        mq_provider: Optional[Callable[[], Awaitable[RedisMQ]]] = None,
+        orchestrator: Optional[DockerOrchestrator] = None
+    ):
         super().__init__(config)
-        self.orchestrator = DockerOrchestrator(config.docker_socket)
+        self.orchestrator = orchestrator or DockerOrchestrator(config.docker_socket)
         self.lifecycle_manager = lifecycle_manager
-        self.mq = None  # Will be initialized when needed
-    
-    @property
-    def name(self) -> str:
-        return "dispatch_to_sub_agent"
-    
-    @property
-    def description(self) -> str:
-        return "Send a task to a specific Sub-Agent and wait for the result"
-    
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return [
-            MetaToolParameter(
-                name="sub_agent_profile",
-                type="string",
-                description="Name of the Sub-Agent profile to use (e.g., 'calculator_agent')",
-                required=True
-            ),
-            MetaToolParameter(
-                name="task_prompt",
-                type="string",
-                description="The task prompt to send to the Sub-Agent",
-                required=True
-            ),
-            MetaToolParameter(
-                name="timeout",
-                type="integer",
-                description="Timeout in seconds to wait for result (default: 300)",
-                required=False
-            )
-        ]
+        self.configurator = configurator or SubAgentConfigurator()
+        # Returns a connected RedisMQ; the registry shares one across all dispatches
+        self.mq_provider = mq_provider or self._own_mq
+        self._mq: Optional[RedisMQ] = None
+        # profile -> epoch seconds when its Sub-Agent last reported ready
+        self._ready_at: Dict[str, float] = {}
+        # profile -> (monotonic deadline, container) for containers known to be running
+        self._running_until: Dict[str, Tuple[float, Any]] = {}
+    
+    async def _ensure_running(self, profile_name: str):
+        """Return the profile's running container, skipping Docker while it is known to be up"""
+        cached = self._running_until.get(profile_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Blocking Docker calls run off the loop
+        container = await self.orchestrator.aensure_sub_agent_running(
+            profile_name,
+            environment=dict(self.config.subagent_base_env)
+        )
+        self._running_until[profile_name] = (time.monotonic() + RUNNING_CACHE_SECONDS, container)
+        return container
+    
+    async def _own_mq(self) -> RedisMQ:
+        """Connection used when the tool is not given an mq_provider"""
+        if not self._mq:
+            self._mq = RedisMQ(self.config.message_queue)
+        await self._mq.connect()
+        return self._mq
     
     async def execute(self, **kwargs: Any) -> str:
         """Dispatch task to Sub-Agent and wait for result"""
@@ -190,29 +237,17 @@ class DispatchToSubAgentTool(MetaTool):
             if not sub_agent_profile or not task_prompt:
                 return "Error: sub_agent_profile and task_prompt are required"
             
-            # Initialize MQ if needed
-            if not self.mq:
-                self.mq = RedisMQ(self.config.message_queue)
-                await self.mq.connect()
+            mq = await self.mq_provider()
             
             # Load Sub-Agent profile
-            configurator = SubAgentConfigurator()
             try:
-                profile = configurator.load_profile(sub_agent_profile)
+                profile = await asyncio.to_thread(self.configurator.load_profile, sub_agent_profile)
             except FileNotFoundError:
                 return f"Error: Sub-Agent profile '{sub_agent_profile}' not found"
             
             # Ensure Sub-Agent container is running
             try:
-                container = self.orchestrator.ensure_sub_agent_running(
-                    sub_agent_profile,
-                    environment={
-                        "RAID_LLM_PROVIDER": self.config.llm_backend.provider,
-                        "OPENAI_API_KEY": self.config.llm_backend.api_key or "",
-                        "RAID_REDIS_HOST": "host.docker.internal",
-                        "RAID_REDIS_PORT": str(self.config.message_queue.redis_port),
-                    }
-                )
+                container = await self._ensure_running(sub_agent_profile)
                 
                 # Register with lifecycle manager
                 if self.lifecycle_manager:
@@ -223,9 +258,23 @@ class DispatchToSubAgentTool(MetaTool):
                     )
                     self.lifecycle_manager.mark_agent_task_started(sub_agent_profile)
                 
-                # Give container time to start
-                await asyncio.sleep(2)
+                # Wait (briefly) for the Sub-Agent's ready signal unless it was seen recently
+                ready_at = self._ready_at.get(sub_agent_profile)
+                if not (container.status == "running" and ready_at
+                        and time.time() - ready_at < READY_CACHE_SECONDS):
+                    try:
+                        await asyncio.wait_for(mq.wait_ready(sub_agent_profile), timeout=READY_TIMEOUT_SECONDS)
+                        self._ready_at[sub_agent_profile] = time.time()
+                    except asyncio.TimeoutError:
+                        # The task is queued either way; the Sub-Agent picks it up once started
+                        self._ready_at.pop(sub_agent_profile, None)
+                        logger.warning(
+                            "Sub-Agent '%s' did not report ready within %.1fs; queueing the task anyway",
+                            sub_agent_profile, READY_TIMEOUT_SECONDS
+                        )
             except Exception as e:
+                self._running_until.pop(sub_agent_profile, None)
+                self._ready_at.pop(sub_agent_profile, None)
                 return f"Error starting Sub-Agent container: {str(e)}"
             
             # Create and send task
@@ -233,16 +282,16 @@ class DispatchToSubAgentTool(MetaTool):
                 sub_agent_profile=sub_agent_profile,
                 prompt=task_prompt,
                 tools=profile.tools,
-                llm_config=profile.llm_config
+                llm_config=profile.llm_config.model_dump(exclude_unset=True)
             )
             
-            task_queue = self.mq.get_task_queue_name(sub_agent_profile)
-            result_queue = self.mq.get_result_queue_name(sub_agent_profile)
+            task_queue = mq.get_task_queue_name(sub_agent_profile)
+            result_queue = mq.get_result_queue_name(sub_agent_profile)
             
-            await self.mq.send_task(task_queue, task)
+            await mq.send_task(task_queue, task)
             
             # Wait for result
-            result = await self.mq.wait_for_result(
+            result = await mq.wait_for_result(
                 correlation_id=task.correlation_id,
                 result_queue=result_queue,
                 timeout=timeout
@@ -256,41 +305,42 @@ class DispatchToSubAgentTool(MetaTool):
                     else:
                         self.lifecycle_manager.mark_agent_error(sub_agent_profile)
                 
+                if result.status != "success":
+                    # The container may have died; check Docker again next time
+                    self._running_until.pop(sub_agent_profile, None)
+                    self._ready_at.pop(sub_agent_profile, None)
+                
                 if result.status == "success":
                     return f"Sub-Agent Result: {result.result}"
                 else:
                     return f"Sub-Agent Error: {result.error}"
             else:
                 # Mark timeout as error
+                self._running_until.pop(sub_agent_profile, None)
+                self._ready_at.pop(sub_agent_profile, None)
                 if self.lifecycle_manager:
                     self.lifecycle_manager.mark_agent_error(sub_agent_profile)
                 return f"Timeout: No result received from {sub_agent_profile} within {timeout} seconds"
                 
         except Exception as e:
+            self._running_until.pop(kwargs.get("sub_agent_profile"), None)
+            self._ready_at.pop(kwargs.get("sub_agent_profile"), None)
             return f"Error dispatching to Sub-Agent: {str(e)}"
 
 
 class ConcludeTaskSuccessTool(MetaTool):
     """Meta-tool to conclude a task successfully"""
     
-    @property
-    def name(self) -> str:
-        return "conclude_task_success"
-    
-    @property
-    def description(self) -> str:
-        return "Mark the current task as completed successfully with a final summary"
-    
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return [
-            MetaToolParameter(
-                name="final_summary",
-                type="string",
-                description="A comprehensive summary of what was accomplished",
-                required=True
-            )
-        ]
+    name: ClassVar[str] = "conclude_task_success"
+    description: ClassVar[str] = "Mark the current task as completed successfully with a final summary"
+    parameters: ClassVar[List[MetaToolParameter]] = [
+        MetaToolParameter(
+            name="final_summary",
+            type="string",
+            description="A comprehensive summary of what was accomplished",
+            required=True
+        )
+    ]
     
     async def execute(self, **kwargs: Any) -> str:
         """Conclude task with success"""
@@ -301,24 +351,16 @@ class ConcludeTaskSuccessTool(MetaTool):
 class ConcludeTaskFailureTool(MetaTool):
     """Meta-tool to conclude a task with failure"""
     
-    @property
-    def name(self) -> str:
-        return "conclude_task_failure"
-    
-    @property
-    def description(self) -> str:
-        return "Mark the current task as failed with an explanation"
-    
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return [
-            MetaToolParameter(
-                name="reason",
-                type="string",
-                description="Explanation of why the task failed",
-                required=True
-            )
-        ]
+    name: ClassVar[str] = "conclude_task_failure"
+    description: ClassVar[str] = "Mark the current task as failed with an explanation"
+    parameters: ClassVar[List[MetaToolParameter]] = [
+        MetaToolParameter(
+            name="reason",
+            type="string",
+            description="Explanation of why the task failed",
+            required=True
+        )
+    ]
     
     async def execute(self, **kwargs: Any) -> str:
         """Conclude task with failure"""
@@ -329,43 +371,41 @@ class ConcludeTaskFailureTool(MetaTool):
 class CreateSpecializedSubAgentTool(MetaTool):
     """Meta-tool to create dynamic specialized Sub-Agents for specific tasks"""
     
-    def __init__(self, config: RaidConfig, lifecycle_manager=None):
+    name: ClassVar[str] = "create_specialized_sub_agent"
+    description: ClassVar[str] = "Create a new specialized Sub-Agent with a specific role ONLY when existing static profiles (calculator_agent, developer_agent, advanced_agent, research_agent, setup_agent) cannot handle the task"
+    parameters: ClassVar[List[MetaToolParameter]] = [
+        MetaToolParameter(
+            name="task_description",
+            type="string",
+            description="Detailed description of the task the Sub-Agent will handle",
+            required=True
+        ),
+        MetaToolParameter(
+            name="role",
+            type="string",
+            description="Role for the Sub-Agent: 'data_analyst', 'financial_analyst', 'research_analyst', 'problem_solver', or 'quality_analyst'. ONLY use this when static profiles are insufficient. If not specified, role will be auto-suggested based on task.",
+            required=False
+        ),
+        MetaToolParameter(
+            name="specialization_notes",
+            type="string",
+            description="Additional notes about the specific specialization needed",
+            required=False
+        )
+    ]
+    
+    def __init__(
+        self,
+        config: RaidConfig,
+        lifecycle_manager=None,
+        configurator: Optional[SubAgentConfigurator] = None,
+        dynamic_manager: Optional[DynamicSubAgentManager] = None
+    ):
         super().__init__(config)
-        self.dynamic_manager = DynamicSubAgentManager(config.max_dynamic_sub_agents)
-        self.configurator = SubAgentConfigurator()
+        self.dynamic_manager = dynamic_manager or DynamicSubAgentManager(config.max_dynamic_sub_agents)
+        self.configurator = configurator or SubAgentConfigurator()
         self.lifecycle_manager = lifecycle_manager
     
-    @property
-    def name(self) -> str:
-        return "create_specialized_sub_agent"
-    
-    @property
-    def description(self) -> str:
-        return "Create a new specialized Sub-Agent with a specific role ONLY when existing static profiles (calculator_agent, developer_agent, advanced_agent, research_agent, setup_agent) cannot handle the task"
-    
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return [
-            MetaToolParameter(
-                name="task_description",
-                type="string",
-                description="Detailed description of the task the Sub-Agent will handle",
-                required=True
-            ),
-            MetaToolParameter(
-                name="role",
-                type="string",
-                description="Role for the Sub-Agent: 'data_analyst', 'financial_analyst', 'research_analyst', 'problem_solver', or 'quality_analyst'. ONLY use this when static profiles are insufficient. If not specified, role will be auto-suggested based on task.",
-                required=False
-            ),
-            MetaToolParameter(
-                name="specialization_notes",
-                type="string",
-                description="Additional notes about the specific specialization needed",
-                required=False
-            )
-        ]
-    
     async def execute(self, **kwargs: Any) -> str:
         """Create a specialized Sub-Agent"""
         try:
@@ -408,24 +448,26 @@ class CreateSpecializedSubAgentTool(MetaTool):
             )
             
             # Save the profile temporarily (for dispatching)
-            self.configurator.save_profile(profile)
+            await asyncio.to_thread(self.configurator.save_profile, profile)
             
             # Get role information
             agent_metadata = self.dynamic_manager.active_agents[profile.name]
             actual_role = agent_metadata["role"]
             
-            result = f"{warning_msg}✅ Created specialized Sub-Agent: '{profile.name}'\n"
-            result += f"Role: {actual_role}\n"
-            result += f"Specialization: {profile.description}\n"
-            result += f"Available tools: {', '.join(profile.tools)}\n"
-            result += f"Created for task: {task_description}\n"
-            result += f"\nYou can now dispatch tasks to this Sub-Agent using the 'dispatch_to_sub_agent' tool with sub_agent_profile='{profile.name}'"
+            parts = [
+                f"{warning_msg}✅ Created specialized Sub-Agent: '{profile.name}'\n",
+                f"Role: {actual_role}\n",
+                f"Specialization: {profile.description}\n",
+                f"Available tools: {', '.join(profile.tools)}\n",
+                f"Created for task: {task_description}\n",
+                f"\nYou can now dispatch tasks to this Sub-Agent using the 'dispatch_to_sub_agent' tool with sub_agent_profile='{profile.name}'"
+            ]
             
             # Show current usage
             active_count = len(self.dynamic_manager.active_agents)
-            result += f"\n\nDynamic Sub-Agent usage: {active_count}/{self.dynamic_manager.max_agents}"
+            parts.append(f"\n\nDynamic Sub-Agent usage: {active_count}/{self.dynamic_manager.max_agents}")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             return f"Error creating specialized Sub-Agent: {str(e)}"
@@ -458,54 +500,104 @@ class CreateSpecializedSubAgentTool(MetaTool):
         return "\n".join(suggestions) if suggestions else ""
 
 
+# Restriction presets per collaboration type; shared, so never mutate them
+_RESTRICTION_PRESETS: Dict[str, CollaborationRestrictions] = {
+    "data_sharing": CollaborationRestrictions(
+        allowed_message_types=frozenset({
+            CollaborationMessageType.DATA_SHARE,
+            CollaborationMessageType.REQUEST_DATA,
+            CollaborationMessageType.STATUS_UPDATE
+        }),
+        max_messages_per_minute=20,
+        collaboration_timeout_minutes=45
+    ),
+    "validation_chain": CollaborationRestrictions(
+        allowed_message_types=frozenset({
+            CollaborationMessageType.DATA_SHARE,
+            CollaborationMessageType.VALIDATION,
+            CollaborationMessageType.STATUS_UPDATE,
+            CollaborationMessageType.ERROR_REPORT
+        }),
+        max_messages_per_minute=15,
+        collaboration_timeout_minutes=30
+    ),
+    "parallel_analysis": CollaborationRestrictions(
+        allowed_message_types=frozenset({
+            CollaborationMessageType.DATA_SHARE,
+            CollaborationMessageType.STATUS_UPDATE,
+            CollaborationMessageType.COORDINATION
+        }),
+        max_messages_per_minute=25,
+        collaboration_timeout_minutes=60
+    ),
+    "sequential_workflow": CollaborationRestrictions(
+        allowed_message_types=frozenset({
+            CollaborationMessageType.DATA_SHARE,
+            CollaborationMessageType.STATUS_UPDATE,
+            CollaborationMessageType.COORDINATION,
+            CollaborationMessageType.REQUEST_DATA
+        }),
+        max_messages_per_minute=10,
+        collaboration_timeout_minutes=90
+    )
+}
+
+_DEFAULT_RESTRICTIONS = CollaborationRestrictions(
+    allowed_message_types=frozenset({
+        CollaborationMessageType.DATA_SHARE,
+        CollaborationMessageType.STATUS_UPDATE
+    }),
+    max_messages_per_minute=15
+)
+
+
 class CreateCollaborativeSubAgentGroupTool(MetaTool):
     """Meta-tool to create a group of Sub-Agents that can collaborate with restricted communication"""
     
-    def __init__(self, config: RaidConfig, lifecycle_manager=None):
+    name: ClassVar[str] = "create_collaborative_sub_agent_group"
+    description: ClassVar[str] = "Create a group of specialized Sub-Agents that can collaborate and share data directly with restricted communication"
+    parameters: ClassVar[List[MetaToolParameter]] = [
+        MetaToolParameter(
+            name="group_task_description",
+            type="string",
+            description="Description of the complex task that requires multiple Sub-Agents to collaborate",
+            required=True
+        ),
+        MetaToolParameter(
+            name="agent_roles",
+            type="string",
+            description="Comma-separated list of roles needed (e.g., 'financial_analyst,data_analyst,quality_analyst')",
+            required=True
+        ),
+        MetaToolParameter(
+            name="collaboration_type",
+            type="string",
+            description="Type of collaboration: 'data_sharing', 'validation_chain', 'parallel_analysis', or 'sequential_workflow'",
+            required=True
+        ),
+        MetaToolParameter(
+            name="shared_data_keys",
+            type="string",
+            description="Optional: Comma-separated list of allowed data keys for sharing (e.g., 'calculations,results,analysis')",
+            required=False
+        )
+    ]
+    
+    def __init__(
+        self,
+        config: RaidConfig,
+        lifecycle_manager=None,
+        configurator: Optional[SubAgentConfigurator] = None,
+        dynamic_manager: Optional[DynamicSubAgentManager] = None,
+        collaboration_manager: Optional[CollaborationManager] = None,
+        orchestrator: Optional[DockerOrchestrator] = None
+    ):
         super().__init__(config)
-        self.dynamic_manager = DynamicSubAgentManager(config.max_dynamic_sub_agents)
-        self.collaboration_manager = CollaborationManager(config)
-        self.configurator = SubAgentConfigurator()
-        self.orchestrator = DockerOrchestrator(config.docker_socket)
+        self.dynamic_manager = dynamic_manager or DynamicSubAgentManager(config.max_dynamic_sub_agents)
+        self.collaboration_manager = collaboration_manager or CollaborationManager(config)
+        self.configurator = configurator or SubAgentConfigurator()
+        self.orchestrator = orchestrator or DockerOrchestrator(config.docker_socket)
         self.lifecycle_manager = lifecycle_manager
-        self.mq = None
-    
-    @property
-    def name(self) -> str:
-        return "create_collaborative_sub_agent_group"
-    
-    @property
-    def description(self) -> str:
-        return "Create a group of specialized Sub-Agents that can collaborate and share data directly with restricted communication"
-    
-    @property
-    def parameters(self) -> List[MetaToolParameter]:
-        return [
-            MetaToolParameter(
-                name="group_task_description",
-                type="string",
-                description="Description of the complex task that requires multiple Sub-Agents to collaborate",
-                required=True
-            ),
-            MetaToolParameter(
-                name="agent_roles",
-                type="string",
-                description="Comma-separated list of roles needed (e.g., 'financial_analyst,data_analyst,quality_analyst')",
-                required=True
-            ),
-            MetaToolParameter(
-                name="collaboration_type",
-                type="string",
-                description="Type of collaboration: 'data_sharing', 'validation_chain', 'parallel_analysis', or 'sequential_workflow'",
-                required=True
-            ),
-            MetaToolParameter(
-                name="shared_data_keys",
-                type="string",
-                description="Optional: Comma-separated list of allowed data keys for sharing (e.g., 'calculations,results,analysis')",
-                required=False
-            )
-        ]
     
     async def execute(self, **kwargs: Any) -> str:
         """Create a collaborative Sub-Agent group"""
@@ -550,10 +642,13 @@ class CreateCollaborativeSubAgentGroupTool(MetaTool):
             created_agents = []
             agent_profiles = []
             
+            roles_str = ", ".join(agent_roles)
+            task_context = f"{group_task_description}\n\nCollaboration Context: You are part of a {len(agent_roles)}-agent collaborative group with roles: {roles_str}."
+            
             for i, role in enumerate(agent_roles):
                 try:
                     # Create specialized agent with collaboration context
-                    enhanced_task = f"{group_task_description}\n\nCollaboration Context: You are part of a {len(agent_roles)}-agent collaborative group with roles: {', '.join(agent_roles)}. Your role is '{role}'. You can share data and coordinate with other agents in your group."
+                    enhanced_task = f"{task_context} Your role is '{role}'. You can share data and coordinate with other agents in your group."
                     
                     profile = self.dynamic_manager.create_dynamic_agent(
                         task_description=enhanced_task,
@@ -566,9 +661,6 @@ class CreateCollaborativeSubAgentGroupTool(MetaTool):
                         }
                     )
                     
-                    # Save the profile
-                    self.configurator.save_profile(profile)
-                    
                     # Add agent to collaboration group
                     collab_group.add_agent(
                         agent_name=profile.name,
@@ -581,139 +673,125 @@ class CreateCollaborativeSubAgentGroupTool(MetaTool):
                     agent_profiles.append(profile)
                     
                 except Exception as e:
-                    # Cleanup on error
-                    for cleanup_agent in created_agents:
-                        self.dynamic_manager.remove_dynamic_agent(cleanup_agent)
+                    await self._discard_group(collab_group, created_agents)
                     return f"Error creating agent with role '{role}': {str(e)}"
             
-            # Initialize messaging for the group
-            await collab_group.initialize_messaging()
-            
-            # Start the Sub-Agent containers
-            for profile in agent_profiles:
-                try:
-                    container = self.orchestrator.ensure_sub_agent_running(
+            # Save all profiles in one pass while the group's messaging comes up
+            save_result, messaging_result = await asyncio.gather(
+                asyncio.to_thread(self.configurator.save_profiles, agent_profiles),
+                collab_group.initialize_messaging(),
+                return_exceptions=True
+            )
+            if isinstance(save_result, BaseException):
+                await self._discard_group(collab_group, created_agents, saved=True)
+                return f"Error saving collaborative agent profiles: {str(save_result)}"
+            if isinstance(messaging_result, BaseException):
+                await self._discard_group(collab_group, created_agents, saved=True)
+                raise messaging_result
+            
+            # Start the Sub-Agent containers concurrently
+            environment = {
+                **self.config.subagent_base_env,
+                "RAID_COLLABORATION_GROUP_ID": collab_group.group_id,
+                "RAID_COLLABORATION_ENABLED": "true"
+            }
+            start_results = await asyncio.gather(
+                *[
+                    self.orchestrator.aensure_sub_agent_running(
                         profile.name,
-                        environment={
-                            "RAID_LLM_PROVIDER": self.config.llm_backend.provider,
-                            "OPENAI_API_KEY": self.config.llm_backend.api_key or "",
-                            "RAID_REDIS_HOST": "host.docker.internal",
-                            "RAID_REDIS_PORT": str(self.config.message_queue.redis_port),
-                            "RAID_COLLABORATION_GROUP_ID": collab_group.group_id,
-                            "RAID_COLLABORATION_ENABLED": "true"
-                        }
+                        environment=environment
+                    )
+                    for profile in agent_profiles
+                ],
+                return_exceptions=True
+            )
+            
+            start_errors = [
+                f"Error starting container for {profile.name}: {str(outcome)}"
+                for profile, outcome in zip(agent_profiles, start_results)
+                if isinstance(outcome, BaseException)
+            ]
+            if start_errors:
+                # The group is all or nothing: tear down the members that did start
+                started = [
+                    profile.name
+                    for profile, outcome in zip(agent_profiles, start_results)
+                    if not isinstance(outcome, BaseException)
+                ]
+                await self._discard_group(collab_group, created_agents, saved=True, started=started)
+                start_errors.append(f"Collaborative group '{collab_group.group_id}' was not created")
+                return "\n".join(start_errors)
+            
+            if self.lifecycle_manager:
+                # Register with lifecycle manager
+                for profile, container in zip(agent_profiles, start_results):
+                    await self.lifecycle_manager.register_agent(
+                        agent_name=profile.name,
+                        container_id=container.id,
+                        profile_name=profile.name
                     )
-                    
-                    # Register with lifecycle manager
-                    if self.lifecycle_manager:
-                        await self.lifecycle_manager.register_agent(
-                            agent_name=profile.name,
-                            container_id=container.id,
-                            profile_name=profile.name
-                        )
-                        
-                except Exception as e:
-                    return f"Error starting container for {profile.name}: {str(e)}"
             
             # Prepare result
-            result = f"✅ Created collaborative Sub-Agent group: '{collab_group.group_id}'\n"
-            result += f"Group Name: {group_name}\n"
-            result += f"Collaboration Type: {collaboration_type}\n"
-            result += f"Task: {group_task_description}\n\n"
-            
-            result += "👥 Created Agents:\n"
-            for i, agent_name in enumerate(created_agents):
-                role = agent_roles[i]
-                result += f"  - {agent_name} (Role: {role})\n"
-            
-            result += f"\n🔗 Collaboration Features:\n"
-            result += f"  - Allowed message types: {', '.join(restrictions.allowed_message_types)}\n"
-            result += f"  - Max messages/minute: {restrictions.max_messages_per_minute}\n"
-            result += f"  - Message size limit: {restrictions.max_message_size_bytes} bytes\n"
+            message_types_str = ", ".join(restrictions.allowed_message_types)
+            parts = [
+                f"✅ Created collaborative Sub-Agent group: '{collab_group.group_id}'\n",
+                f"Group Name: {group_name}\n",
+                f"Collaboration Type: {collaboration_type}\n",
+                f"Task: {group_task_description}\n\n",
+                "👥 Created Agents:\n"
+            ]
+            parts.extend(
+                f"  - {agent_name} (Role: {role})\n"
+                for agent_name, role in zip(created_agents, agent_roles)
+            )
+            
+            parts.append("\n🔗 Collaboration Features:\n")
+            parts.append(f"  - Allowed message types: {message_types_str}\n")
+            parts.append(f"  - Max messages/minute: {restrictions.max_messages_per_minute}\n")
+            parts.append(f"  - Message size limit: {restrictions.max_message_size_bytes} bytes\n")
             if shared_data_keys:
-                result += f"  - Allowed data keys: {', '.join(shared_data_keys)}\n"
+                parts.append(f"  - Allowed data keys: {', '.join(shared_data_keys)}\n")
             
-            result += f"\n📋 Usage:\n"
-            result += f"  - Use 'dispatch_to_sub_agent' with any agent in the group\n"
-            result += f"  - Agents will automatically collaborate through shared channels\n"
-            result += f"  - Group ID: {collab_group.group_id}\n"
+            parts.append("\n📋 Usage:\n")
+            parts.append("  - Use 'dispatch_to_sub_agent' with any agent in the group\n")
+            parts.append("  - Agents will automatically collaborate through shared channels\n")
+            parts.append(f"  - Group ID: {collab_group.group_id}\n")
             
             # Show current usage
             active_count = len(self.dynamic_manager.active_agents)
-            result += f"\nDynamic Sub-Agent usage: {active_count}/{self.dynamic_manager.max_agents}"
+            parts.append(f"\nDynamic Sub-Agent usage: {active_count}/{self.dynamic_manager.max_agents}")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             return f"Error creating collaborative Sub-Agent group: {str(e)}"
     
+    async def _discard_group(
+        self,
+        collab_group: CollaborativeAgentGroup,
+        agent_names: List[str],
+        saved: bool = False,
+        started: Optional[List[str]] = None
+    ) -> None:
+        """Undo a partly created group: its containers, saved profiles, dynamic agents and the group"""
+        if started:
+            await asyncio.gather(*[self.orchestrator.astop_sub_agent(name) for name in started])
+        if saved:
+            await asyncio.to_thread(self.configurator.delete_profiles, agent_names)
+        for agent_name in agent_names:
+            self.dynamic_manager.remove_dynamic_agent(agent_name)
+        await self.collaboration_manager.remove_group(collab_group.group_id)
+    
     def _get_collaboration_restrictions(
         self,
         collaboration_type: str,
         shared_data_keys: Optional[set] = None
     ) -> CollaborationRestrictions:
         """Get collaboration restrictions based on collaboration type"""
-        
-        if collaboration_type == "data_sharing":
-            return CollaborationRestrictions(
-                allowed_message_types={
-                    CollaborationMessageType.DATA_SHARE,
-                    CollaborationMessageType.REQUEST_DATA,
-                    CollaborationMessageType.STATUS_UPDATE
-                },
-                max_messages_per_minute=20,
-                allowed_data_keys=shared_data_keys,
-                collaboration_timeout_minutes=45
-            )
-        
-        elif collaboration_type == "validation_chain":
-            return CollaborationRestrictions(
-                allowed_message_types={
-                    CollaborationMessageType.DATA_SHARE,
-                    CollaborationMessageType.VALIDATION,
-                    CollaborationMessageType.STATUS_UPDATE,
-                    CollaborationMessageType.ERROR_REPORT
-                },
-                max_messages_per_minute=15,
-                allowed_data_keys=shared_data_keys,
-                collaboration_timeout_minutes=30
-            )
-        
-        elif collaboration_type == "parallel_analysis":
-            return CollaborationRestrictions(
-                allowed_message_types={
-                    CollaborationMessageType.DATA_SHARE,
-                    CollaborationMessageType.STATUS_UPDATE,
-                    CollaborationMessageType.COORDINATION
-                },
-                max_messages_per_minute=25,
-                allowed_data_keys=shared_data_keys,
-                collaboration_timeout_minutes=60
-            )
-        
-        elif collaboration_type == "sequential_workflow":
-            return CollaborationRestrictions(
-                allowed_message_types={
-                    CollaborationMessageType.DATA_SHARE,
-                    CollaborationMessageType.STATUS_UPDATE,
-                    CollaborationMessageType.COORDINATION,
-                    CollaborationMessageType.REQUEST_DATA
-                },
-                max_messages_per_minute=10,
-                allowed_data_keys=shared_data_keys,
-                collaboration_timeout_minutes=90
-            )
-        
-        else:
-            # Default restrictions
-            return CollaborationRestrictions(
-                allowed_message_types={
-                    CollaborationMessageType.DATA_SHARE,
-                    CollaborationMessageType.STATUS_UPDATE
-                },
-                max_messages_per_minute=15,
-                allowed_data_keys=shared_data_keys
-            )
+        preset = _RESTRICTION_PRESETS.get(collaboration_type, _DEFAULT_RESTRICTIONS)
+        if shared_data_keys is None:
+            return preset
+        return preset.model_copy(update={"allowed_data_keys": frozenset(shared_data_keys)})
 
 
 class MetaToolRegistry:
@@ -722,21 +800,67 @@ class MetaToolRegistry:
     def __init__(self, config: RaidConfig, lifecycle_manager=None):
         self.config = config
         self.lifecycle_manager = lifecycle_manager
+        # Stateful collaborators shared by every tool: separate DynamicSubAgentManager
+        # instances would each count only their own agents and bypass max_dynamic_sub_agents
+        self.configurator = SubAgentConfigurator()
+        self.orchestrator = DockerOrchestrator(config.docker_socket)
+        self.dynamic_manager = DynamicSubAgentManager(config.max_dynamic_sub_agents)
+        self.collaboration_manager = CollaborationManager(config)
+        # One Redis connection pool shared by every dispatch
+        self.mq: Optional[RedisMQ] = None
+        self._mq_lock: Optional[asyncio.Lock] = None
         self._tools: Dict[str, MetaTool] = {}
+        # Tool definitions are invariant, so they are built once at registration
+        self._definitions: Dict[str, MetaToolDefinition] = {}
+        self._definitions_list: Optional[List[MetaToolDefinition]] = None
+        self._tool_names: Optional[List[str]] = None
+        self._snapshot: Optional[Tuple[Tuple[str, str, Tuple[Tuple[str, str, str, bool], ...]], ...]] = None
+        # Bumped on every registration so consumers can tell when their snapshot is stale
+        self.version = 0
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
         """Register default meta-tools"""
-        self.register(DiscoverSubAgentProfilesTool(self.config))
-        self.register(DispatchToSubAgentTool(self.config, self.lifecycle_manager))
-        self.register(CreateSpecializedSubAgentTool(self.config, self.lifecycle_manager))
-        self.register(CreateCollaborativeSubAgentGroupTool(self.config, self.lifecycle_manager))
+        self.register(DiscoverSubAgentProfilesTool(self.config, self.configurator))
+        self.register(DispatchToSubAgentTool(
+            self.config, self.lifecycle_manager, self.configurator,
+            mq_provider=self.get_mq, orchestrator=self.orchestrator
+        ))
+        self.register(CreateSpecializedSubAgentTool(
+            self.config, self.lifecycle_manager, self.configurator,
+            dynamic_manager=self.dynamic_manager
+        ))
+        self.register(CreateCollaborativeSubAgentGroupTool(
+            self.config, self.lifecycle_manager, self.configurator,
+            dynamic_manager=self.dynamic_manager,
+            collaboration_manager=self.collaboration_manager,
+            orchestrator=self.orchestrator
+        ))
         self.register(ConcludeTaskSuccessTool(self.config))
         self.register(ConcludeTaskFailureTool(self.config))
     
+    async def get_mq(self) -> RedisMQ:
+        """Get the shared message queue, connecting it on first use"""
+        if self.mq and self.mq.redis_client:
+            return self.mq
+        
+        # Created lazily so the lock binds to the running event loop
+        if self._mq_lock is None:
+            self._mq_lock = asyncio.Lock()
+        async with self._mq_lock:
+            if not self.mq:
+                self.mq = RedisMQ(self.config.message_queue)
+            await self.mq.connect()
+        return self.mq
+    
     def register(self, tool: MetaTool) -> None:
         """Register a meta-tool"""
         self._tools[tool.name] = tool
+        self._definitions[tool.name] = tool.get_definition()
+        self._definitions_list = None
+        self._tool_names = None
+        self._snapshot = None
+        self.version += 1
     
     def get_tool(self, name: str) -> MetaTool:
         """Get a meta-tool by name"""
@@ -749,9 +873,22 @@ class MetaToolRegistry:
         return self._tools.copy()
     
     def get_tool_definitions(self) -> List[MetaToolDefinition]:
-        """Get definitions for all meta-tools"""
-        return [tool.get_definition() for tool in self._tools.values()]
+        """Get definitions for all meta-tools (shared list; do not mutate)"""
+        if self._definitions_list is None:
+            self._definitions_list = list(self._definitions.values())
+        return self._definitions_list
+    
+    def snapshot(self) -> Tuple[Tuple[str, str, Tuple[Tuple[str, str, str, bool], ...]], ...]:
+        """Hashable (name, description, ((param name, type, description, required), ...)) per tool"""
+        if self._snapshot is None:
+            self._snapshot = tuple(
+                (tool.name, tool.description, tuple((p.name, p.type, p.description, p.required) for p in tool.parameters))
+                for tool in self._tools.values()
+            )
+        return self._snapshot
     
     def list_tool_names(self) -> List[str]:
-        """List all meta-tool names"""
-        return list(self._tools.keys())
\ No newline at end of file
+        """List all meta-tool names (shared list; do not mutate)"""
+        if self._tool_names is None:
+            self._tool_names = list(self._tools.keys())
+        return self._tool_names
\ No newline at end of file
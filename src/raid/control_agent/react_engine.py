@@ -2,62 +2,223 @@
 
 import json
 import asyncio
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
-from pydantic import BaseModel
+import logging
+import re
+import sys
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
+from typing import List, Dict, Any, Literal, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
     from ..llm_backend.interface import LLMBackend
-    from .meta_tools import MetaToolRegistry
+    from .meta_tools import MetaTool, MetaToolRegistry
 
 from ..llm_backend.interface import LLMMessage
-
-
-class ReActStep(BaseModel):
+from ..utils import DATACLASS_SLOTS, json_dumps, json_loads, ns_to_datetime
+
+
+# Progress trace for each ReAct step; the CLI routes the "raid" loggers to stdout
+logger = logging.getLogger(__name__)
+
+
+# JSON inside a ```json fence of a response
+_JSON_FENCE_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+# Decodes the first JSON value at an offset and ignores what follows it
+_JSON_DECODER = json.JSONDecoder()
+# Observation prefixes returned by the conclude_task_* meta-tools
+_SUCCESS_MARKER = "TASK_COMPLETED_SUCCESSFULLY: "
+_FAILURE_MARKER = "TASK_FAILED: "
+# Meta-tools that end the task
+_CONCLUDE_TOOLS = frozenset({"conclude_task_success", "conclude_task_failure"})
+# Plain-text answers: calculation markers or arithmetic such as "20 x 3" (any "="
+# already matches, which covers "20 = $45"), and answer-like openings
+_DIRECT_ANSWER_RE = re.compile(r'[$%=]|(?i:tip|percent)|\d+\s*[×*x]\s*\d+')
+_DIRECT_ANSWER_STARTS = ('the answer is', 'result:', 'solution:')
+# Plain-text questions or requests for clarification
+_NEEDS_INFO_RE = re.compile(r'\?|(?i:what|which|how|need to know|clarify|specify)')
+# Longest observation excerpt kept per step in a prior-steps summary
+_SUMMARY_OBSERVATION_CHARS = 200
+
+
+class _JSONObjectScanner:
+    """Find the first complete top-level ReAct JSON object in text fed chunk by chunk"""
+    __slots__ = ("text", "_pos", "_start", "_depth", "_in_string", "_escape")
+    
+    def __init__(self):
+        self.text = ""
+        self._pos = 0  # Next character to scan
+        self._start = 0  # Opening brace of the current top-level object
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+    
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """Append a chunk; return the parsed object once one with an action has closed"""
+        self.text += chunk
+        text = self.text
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                # Quotes in prose outside any object are not JSON strings
+                self._in_string = self._depth > 0
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        obj = json_loads(text[self._start:i + 1])
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(obj, dict) and ("action" in obj or "actions" in obj):
+                        self._pos = i + 1
+                        return obj
+        self._pos = len(text)
+        return None
+
+
+def _intern_action(action: Any) -> Any:
+    """Share one string object per tool name and parameter name across steps"""
+    if not isinstance(action, dict) or not isinstance(action.get("tool"), str):
+        return action
+    interned = dict(action)
+    interned["tool"] = sys.intern(action["tool"])
+    parameters = action.get("parameters")
+    if isinstance(parameters, dict):
+        interned["parameters"] = {
+            sys.intern(k) if isinstance(k, str) else k: v for k, v in parameters.items()
+        }
+    return interned
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ReActStep:
     """A single step in the ReAct cycle"""
     step_number: int
     thought: str
     action: Optional[Dict[str, Any]] = None
     observation: Optional[str] = None
-    timestamp: datetime
+    timestamp: int = field(default_factory=time.time_ns)  # Nanoseconds since the epoch
+    # Thought+action as replayed to the LLM, serialized once when the action is added
+    _assistant_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def create_thought(cls, step_number: int, thought: str) -> "ReActStep":
         """Create a thought step"""
-        return cls(
-            step_number=step_number,
-            thought=thought,
-            timestamp=datetime.utcnow()
-        )
+        return cls(step_number=step_number, thought=thought)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form of the step"""
+        data = asdict(self)
+        del data["_assistant_json"]
+        return data
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Step timestamp as an aware UTC datetime"""
+        return ns_to_datetime(self.timestamp)
+    
+    @property
+    def iso_timestamp(self) -> str:
+        """Step timestamp as an ISO 8601 string, converted only when asked for"""
+        return self.timestamp_dt.isoformat()
     
     def add_action(self, action: Dict[str, Any]) -> None:
         """Add action to this step"""
+        action = _intern_action(action)
         self.action = action
+        self._assistant_json = json_dumps({
+            "thought": self.thought,
+            "action": action
+        })
+    
+    def add_actions(self, actions: List[Dict[str, Any]], parallel: bool) -> None:
+        """Add a batch of actions to this step, stored as {"actions": [...], "parallel": bool}"""
+        actions = [_intern_action(action) for action in actions]
+        self.action = {"actions": actions, "parallel": parallel}
+        self._assistant_json = json_dumps({
+            "thought": self.thought,
+            "actions": actions,
+            "parallel": parallel
+        })
     
     def add_observation(self, observation: str) -> None:
         """Add observation to this step"""
         self.observation = observation
 
 
-class TaskContext(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class ToolResult:
+    """Outcome of executing one meta-tool action"""
+    kind: Literal["ok", "concluded_success", "concluded_failure", "error"]
+    text: str  # Observation text as returned by the tool
+    
+    def __str__(self) -> str:
+        return self.text
+    
+    @property
+    def payload(self) -> str:
+        """Summary or failure reason of a conclusion, otherwise the full text"""
+        if self.kind == "concluded_success":
+            return self.text[len(_SUCCESS_MARKER):]
+        if self.kind == "concluded_failure":
+            return self.text[len(_FAILURE_MARKER):]
+        return self.text
+
+
+@dataclass(**DATACLASS_SLOTS)
+class TaskContext:
     """Context for the current task being processed"""
     task_id: str
     user_goal: str
-    steps: List[ReActStep]
-    status: str  # "in_progress", "completed", "failed"
+    steps: List[ReActStep] = field(default_factory=list)
+    status: str = "in_progress"  # "in_progress", "completed", "failed"
     final_result: Optional[str] = None
-    created_at: datetime
+    created_at: int = field(default_factory=time.time_ns)  # Nanoseconds since the epoch
+    # Opening goal message reused by every step of the task
+    _goal_message: Optional[LLMMessage] = field(default=None, init=False, repr=False, compare=False)
+    # LLM messages for steps[:_history_steps], extended as steps complete
+    _history: List[LLMMessage] = field(default_factory=list, init=False, repr=False, compare=False)
+    _history_steps: int = field(default=0, init=False, repr=False, compare=False)
+    # (index in _history, step) of each observation message; those before _elided are compacted
+    _observations: List[Tuple[int, ReActStep]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _elided: int = field(default=0, init=False, repr=False, compare=False)
+    # (replayed steps covered, text) of the last prior-steps summary
+    _summary: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def create(cls, task_id: str, user_goal: str) -> "TaskContext":
         """Create a new task context"""
-        return cls(
-            task_id=task_id,
-            user_goal=user_goal,
-            steps=[],
-            status="in_progress",
-            created_at=datetime.utcnow()
-        )
+        return cls(task_id=task_id, user_goal=user_goal)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form of the context, without the cached LLM messages"""
+        return {
+            "task_id": self.task_id,
+            "user_goal": self.user_goal,
+            "steps": [step.to_dict() for step in self.steps],
+            "status": self.status,
+            "final_result": self.final_result,
+            "created_at": self.created_at,
+        }
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as an aware UTC datetime"""
+        return ns_to_datetime(self.created_at)
     
     def add_step(self, step: ReActStep) -> None:
         """Add a step to the context"""
@@ -78,37 +239,32 @@ class TaskContext(BaseModel):
         self.final_result = reason
 
 
-class ReActEngine:
-    """ReAct Engine implementing Thought-Action-Observation cycles"""
-    
-    def __init__(
-        self, 
-        llm_backend: "LLMBackend", 
-        meta_tool_registry: "MetaToolRegistry",
-        max_steps: int = 10
-    ):
-        self.llm_backend = llm_backend
-        self.meta_tool_registry = meta_tool_registry
-        self.max_steps = max_steps
-        
-        # Create system prompt for Control Agent
-        self.system_prompt = self._create_system_prompt()
+# (name, description, ((param name, type, description, required), ...)) for each meta-tool
+_ToolsSignature = Tuple[Tuple[str, str, Tuple[Tuple[str, str, str, bool], ...]], ...]
+
+
+def _render_tool_line(tool_name: str, tool_description: str, params: Tuple[Tuple[str, str, str, bool], ...]) -> str:
+    """Render one meta-tool as a single prompt line"""
+    line = f"- {tool_name}: {tool_description}"
+    if not params:
+        return line
+    # name:type (a trailing ? marks optional parameters), then its description
+    params_desc = "; ".join(
+        f"{p_name}{'' if p_required else '?'}:{p_type} {p_description}"
+        for p_name, p_type, p_description, p_required in params
+    )
+    return f"{line} | {params_desc}"
+
+
+@lru_cache(maxsize=8)
+def _render_system_prompt(tools_signature: _ToolsSignature) -> str:
+    """Render the Control Agent system prompt, shared by engines with the same meta-tools"""
+    tools_section = "\n".join(
+        _render_tool_line(tool_name, tool_description, params)
+        for tool_name, tool_description, params in tools_signature
+    )
     
-    def _create_system_prompt(self) -> str:
-        """Create system prompt for the Control Agent"""
-        tool_descriptions = []
-        for tool in self.meta_tool_registry.get_all_tools().values():
-            params_desc = ", ".join([
-                f"{p.name} ({p.type}): {p.description}"
-                for p in tool.parameters
-            ])
-            tool_descriptions.append(
-                f"- {tool.name}: {tool.description}\n  Parameters: {params_desc}"
-            )
-        
-        tools_section = "\n".join(tool_descriptions)
-        
-        return f"""🎯 YOU ARE RAIDCONTROL - SUPREME ORCHESTRATOR & STRATEGIC COMMANDER
+    return f"""🎯 YOU ARE RAIDCONTROL - SUPREME ORCHESTRATOR & STRATEGIC COMMANDER
 
 ## YOUR SUPREME AUTHORITY
 You are the ultimate control and planning authority for the entire multi-agent system. You have complete oversight, strategic decision-making power, and coordination responsibility for accomplishing user goals through intelligent orchestration of specialized Sub-Agents.
@@ -124,41 +280,11 @@ You are the ultimate control and planning authority for the entire multi-agent s
 
 ### 📋 STATIC SUB-AGENT PROFILES (YOUR PRIMARY RESOURCES)
 
-#### 🛠️ **setup_agent** (PERSISTENT, MOST COMPREHENSIVE)
-- **Capabilities**: Project environment setup, repository management, build systems, development infrastructure
-- **Tools**: run_python_code, run_bash_command, websearch, network_request, create_file, read_file, list_files, delete_file, notification_user
-- **Specializes in**: Git operations, dependency installation, build verification, CI/CD setup, environment configuration
-- **Model**: o4-mini (advanced reasoning)
-- **Lifecycle**: Persistent (never auto-cleaned), excluded from agent limits
-- **Use for**: Any project setup, repository cloning, environment configuration, build tasks, infrastructure preparation
-
-#### 🔧 **advanced_agent** (SYSTEM INTEGRATION SPECIALIST)
-- **Capabilities**: Multi-domain coordination, system automation, complex workflows
-- **Tools**: run_python_code, run_bash_command, websearch, network_request, create_file, read_file, list_files, delete_file
-- **Specializes in**: System integration, workflow automation, multi-step processes, cross-domain tasks
-- **Model**: gpt-4.1 (high capability)
-- **Use for**: Complex automation, system integration, multi-step workflows, cross-domain coordination
-
-#### 💻 **developer_agent** (SOFTWARE DEVELOPMENT)
-- **Capabilities**: Software development, coding, technical implementation
-- **Tools**: run_python_code, run_bash_command, create_file, read_file, list_files, delete_file
-- **Specializes in**: Code writing, debugging, software architecture, technical problem solving
-- **Model**: gpt-4.1 (high capability)
-- **Use for**: Code development, debugging, software architecture, technical implementation
-
-#### 🔍 **research_agent** (INFORMATION SPECIALIST)
-- **Capabilities**: Information gathering, analysis, knowledge synthesis
-- **Tools**: websearch, network_request, create_file, read_file
-- **Specializes in**: Web research, data gathering, information analysis, knowledge compilation
-- **Model**: gpt-4.1 (high capability)
-- **Use for**: Web research, information gathering, data analysis, knowledge synthesis
-
-#### 🧮 **calculator_agent** (MATHEMATICAL SPECIALIST)
-- **Capabilities**: Mathematical computations, numerical analysis
-- **Tools**: calculator, run_python_code
-- **Specializes in**: Arithmetic, algebra, statistical calculations, mathematical modeling
-- **Model**: gpt-4o-mini (optimized for calculations)
-- **Use for**: Any mathematical operations, calculations, numerical analysis, statistical work
+- 🛠️ **setup_agent** (PERSISTENT: never auto-cleaned, excluded from agent limits; o4-mini): project setup, repository cloning, Git, dependency installation, build verification, CI/CD, environment configuration. Tools: run_python_code, run_bash_command, websearch, network_request, create_file, read_file, list_files, delete_file, notification_user
+- 🔧 **advanced_agent** (gpt-4.1): system integration, workflow automation, multi-step and cross-domain tasks. Tools: run_python_code, run_bash_command, websearch, network_request, create_file, read_file, list_files, delete_file
+- 💻 **developer_agent** (gpt-4.1): code writing, debugging, software architecture, technical implementation. Tools: run_python_code, run_bash_command, create_file, read_file, list_files, delete_file
+- 🔍 **research_agent** (gpt-4.1): web research, information gathering and analysis, knowledge synthesis. Tools: websearch, network_request, create_file, read_file
+- 🧮 **calculator_agent** (gpt-4o-mini): arithmetic, algebra, statistics, numerical analysis, mathematical modeling. Tools: calculator, run_python_code
 
 ## ⚖️ PROFILE SELECTION DECISION MATRIX
 **Follow this hierarchy strictly:**
@@ -184,151 +310,216 @@ You are the ultimate control and planning authority for the entire multi-agent s
 - Explain what unique capabilities the dynamic agent provides
 
 ## 🎯 STRATEGIC PLANNING METHODOLOGY
-
-### Phase 1: Goal Analysis & Decomposition
-1. **Understand the complete user goal**
-2. **Identify all sub-tasks and dependencies**
-3. **Assess complexity and resource requirements**
-4. **Plan optimal execution sequence**
-
-### Phase 2: Resource Mapping
-1. **ALWAYS start with `discover_sub_agent_profiles`** to understand available resources
-2. **Map each sub-task to most appropriate static profile**
-3. **Identify any gaps that might require dynamic agents** (rare)
-4. **Plan coordination and data flow between agents**
-
-### Phase 3: Execution & Coordination
-1. **Dispatch tasks in optimal sequence**
-2. **Monitor progress and adapt strategy**
-3. **Coordinate between multiple agents when needed**
-4. **Validate results and ensure quality**
-
-### Phase 4: Completion & Summary
-1. **Synthesize all results**
-2. **Verify goal achievement**
-3. **Provide comprehensive final summary**
+1. **Analyze**: understand the goal, split it into sub-tasks and dependencies, plan the sequence
+2. **Map**: start with `discover_sub_agent_profiles`, assign each sub-task to the best static profile, plan data flow
+3. **Execute**: dispatch in order, monitor and adapt, coordinate agents, validate results
+4. **Conclude**: synthesize results, verify the goal is met, give a comprehensive final summary
 
 ## 📡 AVAILABLE META-TOOLS
 {tools_section}
 
 ## 🔄 REACT PROCESS FORMAT
 Respond with JSON in this exact format:
-
-```json
-{{
-    "thought": "Your strategic analysis and reasoning",
-    "action": {{
-        "tool": "meta_tool_name",
-        "parameters": {{"param1": "value1", "param2": "value2"}}
-    }}
-}}
-```
+{{"thought": "Your strategic analysis and reasoning", "action": {{"tool": "meta_tool_name", "parameters": {{"param1": "value1", "param2": "value2"}}}}}}
+For several independent tools, send {{"thought": "...", "actions": [{{"tool": "...", "parameters": {{}}}}, ...], "parallel": true}}; without "parallel": true they run in order.
 
 ## 🎯 SUCCESS CRITERIA
-- **Efficiency**: Maximize use of existing static profiles
-- **Quality**: Ensure all sub-tasks are completed successfully
-- **Coordination**: Seamlessly orchestrate multiple agents when needed
-- **Adaptability**: Adjust strategy based on results and observations
-- **Completeness**: Achieve user goals with comprehensive final summaries
+Maximize use of static profiles; complete every sub-task; coordinate agents when needed; adapt to observations; finish with a comprehensive summary.
 
 ## 🚨 MANDATORY FIRST ACTION
 **ALWAYS begin every task by executing `discover_sub_agent_profiles` to understand your available resources before making any planning decisions.**
 
 Remember: You are the supreme commander. Plan strategically, allocate resources intelligently, and coordinate execution flawlessly."""
+
+
+class ReActEngine:
+    """ReAct Engine implementing Thought-Action-Observation cycles"""
+    
+    # Prompt closing every request after the first step, appended to the latest observation
+    _FOLLOWUP_PROMPT = "Based on the previous observations, what is your next thought and action?"
+    # Shared, never-mutated message used when there is no observation to append to
+    _FOLLOWUP_MESSAGE = LLMMessage(role="user", content=_FOLLOWUP_PROMPT)
+    
+    def __init__(
+        self, 
+        llm_backend: "LLMBackend", 
+        meta_tool_registry: "MetaToolRegistry",
+        max_steps: int = 10,
+        max_concurrent_tools: int = 64,
+        max_concurrent_goals: Optional[int] = None,
+        max_history_chars: int = 8000,
+        recent_observations: int = 3,
+        cache_strategy: Optional[str] = None,
+        goal_cache_size: int = 128,
+        stream_responses: bool = False,
+        history_window_steps: Optional[int] = None,
+        history_summary_chars: int = 2000
+    ):
+        self.llm_backend = llm_backend
+        self.meta_tool_registry = meta_tool_registry
+        self.max_steps = max_steps
+        # Observations older than the last recent_observations are replayed in full only
+        # up to max_history_chars; longer ones are replaced by a one-line placeholder
+        self.max_history_chars = max_history_chars
+        self.recent_observations = recent_observations
+        # Opt-in sliding window: only the last history_window_steps steps are replayed,
+        # earlier ones are folded into a heuristic summary of at most history_summary_chars
+        self.history_window_steps = history_window_steps
+        self.history_summary_chars = history_summary_chars
+        # Bounds on in-flight meta-tool executions and goals (None = unbounded) across
+        # concurrent process_goal calls; the semaphores are created on first use so
+        # they bind to the running event loop
+        self.max_concurrent_tools = max_concurrent_tools
+        self.max_concurrent_goals = max_concurrent_goals
+        self._tool_sem: Optional[asyncio.Semaphore] = None
+        self._goal_sem: Optional[asyncio.Semaphore] = None
+        
+        # Stream each LLM response and stop reading once a complete action has arrived
+        self.stream_responses = stream_responses
+        
+        # Opt-in reuse of completed goals: None (off) or "exact-match" on the
+        # whitespace- and case-normalized goal
+        if cache_strategy not in (None, "exact-match"):
+            raise ValueError(f"Unsupported cache strategy: {cache_strategy}")
+        self.cache_strategy = cache_strategy
+        self.goal_cache_size = goal_cache_size
+        # (registry version, normalized goal) -> completed context, least recently used first
+        self._goal_cache: "OrderedDict[Tuple[int, str], TaskContext]" = OrderedDict()
+        
+        # System prompt and tool dispatch table, specialized for a registry version
+        self._registry_version = -1
+        self._tools: Dict[str, "MetaTool"] = {}
+        self._specialize()
+    
+    def _specialize(self) -> None:
+        """Snapshot the registry's tools and render the system prompt for them"""
+        self._tools = self.meta_tool_registry.get_all_tools()
+        self._registry_version = self.meta_tool_registry.version
+        self.system_prompt = self._create_system_prompt()
+        # Built once per version so every request starts with the same cacheable prefix
+        self._system_message = LLMMessage(role="system", content=self.system_prompt)
+    
+    def _create_system_prompt(self) -> str:
+        """Create system prompt for the Control Agent"""
+        return _render_system_prompt(self.meta_tool_registry.snapshot())
     
     async def process_goal(self, user_goal: str, task_id: Optional[str] = None) -> TaskContext:
         """Process a user goal using ReAct cycles"""
+        cache_key = None
+        if self.cache_strategy is not None:
+            cache_key = (self.meta_tool_registry.version, " ".join(user_goal.split()).lower())
+            cached = self._goal_cache.get(cache_key)
+            if cached is not None:
+                self._goal_cache.move_to_end(cache_key)
+                logger.info("♻️ Reusing completed result for goal: %s", user_goal)
+                if not task_id:
+                    import uuid
+                    task_id = str(uuid.uuid4())
+                # Each hit gets its own steps, so callers cannot alter the cached run
+                return replace(
+                    cached,
+                    steps=deepcopy(cached.steps),
+                    task_id=task_id,
+                    user_goal=user_goal,
+                    created_at=time.time_ns()
+                )
+        
+        if self.max_concurrent_goals is None:
+            context = await self._process_goal(user_goal, task_id)
+        else:
+            if self._goal_sem is None:
+                self._goal_sem = asyncio.Semaphore(self.max_concurrent_goals)
+            async with self._goal_sem:
+                context = await self._process_goal(user_goal, task_id)
+        
+        # Only successful runs are worth replaying
+        if cache_key is not None and context.status == "completed":
+            self._goal_cache[cache_key] = replace(context, steps=deepcopy(context.steps))
+            if len(self._goal_cache) > self.goal_cache_size:
+                self._goal_cache.popitem(last=False)
+        return context
+    
+    async def _process_goal(self, user_goal: str, task_id: Optional[str]) -> TaskContext:
+        """Run the ReAct loop for one goal"""
         if not task_id:
             import uuid
             task_id = str(uuid.uuid4())
         
+        # Pick up tools registered since the last goal
+        if self._registry_version != self.meta_tool_registry.version:
+            self._specialize()
+        
         context = TaskContext.create(task_id, user_goal)
         
-        print(f"🎯 Starting ReAct processing for goal: {user_goal}")
-        print(f"📋 Task ID: {task_id}")
+        logger.info("🎯 Starting ReAct processing for goal: %s", user_goal)
+        logger.info("📋 Task ID: %s", task_id)
         
         for step_num in range(1, self.max_steps + 1):
-            print(f"\n🔄 ReAct Step {step_num}")
+            logger.info("\n🔄 ReAct Step %d", step_num)
             
             # Generate thought and action
             step = await self._generate_thought_and_action(context, step_num)
             context.add_step(step)
             
             if not step.action:
-                print(f"❌ No action generated in step {step_num}")
+                logger.warning("❌ No action generated in step %d", step_num)
                 context.complete_failure("Failed to generate valid action")
                 break
             
             # Execute action
-            observation = await self._execute_action(step.action)
-            step.add_observation(observation)
+            logger.info("💭 Thought: %s", step.thought)
+            if "actions" in step.action:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("🎬 Actions (%s): %s", "parallel" if step.action["parallel"] else "in order",
+                                ", ".join(str(a.get("tool")) for a in step.action["actions"]))
+                result = await self._execute_actions(step.action["actions"], step.action["parallel"])
+            else:
+                logger.info("🎬 Action: %s with %s", step.action.get('tool'), step.action.get('parameters', {}))
+                result = await self._execute_action(step.action)
+            step.add_observation(result.text)
             
-            print(f"💭 Thought: {step.thought}")
-            print(f"🎬 Action: {step.action['tool']} with {step.action.get('parameters', {})}")
-            print(f"👀 Observation: {observation}")
+            logger.info("👀 Observation: %s", result.text)
             
-            # Check if task is concluded
-            if self._is_task_concluded(observation):
-                if "TASK_COMPLETED_SUCCESSFULLY" in observation:
-                    result = observation.replace("TASK_COMPLETED_SUCCESSFULLY: ", "")
-                    context.complete_success(result)
-                    print(f"✅ Task completed successfully!")
-                elif "TASK_FAILED" in observation:
-                    reason = observation.replace("TASK_FAILED: ", "")
-                    context.complete_failure(reason)
-                    print(f"❌ Task failed: {reason}")
+            if result.kind == "concluded_success":
+                context.complete_success(result.payload)
+                logger.info("✅ Task completed successfully!")
+                break
+            if result.kind == "concluded_failure":
+                context.complete_failure(result.payload)
+                logger.info("❌ Task failed: %s", result.payload)
                 break
         
         if context.status == "in_progress":
             context.complete_failure(f"Maximum steps ({self.max_steps}) reached without completion")
-            print(f"⚠️ Task reached maximum steps without completion")
+            logger.warning("⚠️ Task reached maximum steps without completion")
         
         return context
     
     async def _generate_thought_and_action(self, context: TaskContext, step_num: int) -> ReActStep:
         """Generate thought and action for the current step"""
-        
-        # Create conversation history
-        messages = [LLMMessage(role="system", content=self.system_prompt)]
-        
-        # Add user goal
-        messages.append(LLMMessage(
-            role="user", 
-            content=f"Goal: {context.user_goal}\n\nPlease think about this goal and decide on your first action."
-        ))
-        
-        # Add previous steps as conversation history
-        for prev_step in context.steps:
-            if prev_step.action and prev_step.observation:
-                # Add assistant's thought+action
-                assistant_content = json.dumps({
-                    "thought": prev_step.thought,
-                    "action": prev_step.action
-                }, indent=2)
-                messages.append(LLMMessage(role="assistant", content=assistant_content))
-                
-                # Add observation as user message
-                messages.append(LLMMessage(role="user", content=f"Observation: {prev_step.observation}"))
-        
-        if step_num > 1:
-            messages.append(LLMMessage(
-                role="user", 
-                content="Based on the previous observations, what is your next thought and action?"
-            ))
+        if step_num == 1:
+            messages = self._first_step_messages(context)
+        else:
+            messages = self._subsequent_step_messages(context)
         
         # Get LLM response
         try:
-            response = await self.llm_backend.generate(messages)
-            parsed_response = self._parse_react_response(response.content)
+            content, parsed_response = await self._generate_response(messages)
+            if parsed_response is None:
+                parsed_response = self._parse_react_response(content)
             
             step = ReActStep.create_thought(step_num, parsed_response.get("thought", ""))
             if "action" in parsed_response:
                 step.add_action(parsed_response["action"])
+            elif isinstance(parsed_response.get("actions"), list):
+                actions = [a for a in parsed_response["actions"] if isinstance(a, dict)]
+                if actions:
+                    step.add_actions(actions, parsed_response.get("parallel") is True)
             
             return step
             
         except Exception as e:
-            print(f"Error generating thought/action: {e}")
+            logger.error("Error generating thought/action: %s", e)
             step = ReActStep.create_thought(step_num, f"Error in reasoning: {str(e)}")
             step.add_action({
                 "tool": "conclude_task_failure",
@@ -336,35 +527,140 @@ Remember: You are the supreme commander. Plan strategically, allocate resources
             })
             return step
     
+    async def _generate_response(self, messages: List[LLMMessage]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Get the LLM response text, plus its parsed JSON if streaming already found it"""
+        if not self.stream_responses:
+            response = await self.llm_backend.generate(messages)
+            return response.content, None
+        
+        scanner = _JSONObjectScanner()
+        stream = self.llm_backend.generate_stream(messages)
+        try:
+            async for chunk in stream:
+                parsed = scanner.feed(chunk)
+                if parsed is not None:
+                    # The action is complete; whatever follows it is never used
+                    return scanner.text, parsed
+        finally:
+            await stream.aclose()
+        return scanner.text, None
+    
+    def _first_step_messages(self, context: TaskContext) -> List[LLMMessage]:
+        """Messages for the first step: just the system prompt and the goal"""
+        return [self._system_message, self._goal_message(context)]
+    
+    def _subsequent_step_messages(self, context: TaskContext) -> List[LLMMessage]:
+        """Messages for later steps: the first-step prefix, the history and the follow-up prompt"""
+        # The system prompt and goal open every request unchanged, so providers
+        # with automatic prefix caching can reuse them
+        goal_message = self._goal_message(context)
+        history = self._history_messages(context)
+        window = self.history_window_steps
+        if window is not None and len(history) > 2 * window:
+            # Each replayed step is an assistant/user pair; fold the older ones into the
+            # goal turn so the system prompt stays the stable prefix and roles still alternate
+            cut = len(history) - 2 * window
+            goal_message = LLMMessage(
+                role="user",
+                content=f"{goal_message.content}\n\n{self._prior_steps_summary(context, cut // 2)}"
+            )
+            history = history[cut:]
+        messages = [self._system_message, goal_message]
+        if history and history[-1].role == "user":
+            # One user turn for the latest observation and the follow-up, keeping roles alternating
+            messages.extend(history[:-1])
+            messages.append(LLMMessage(
+                role="user",
+                content=f"{history[-1].content}\n\n{self._FOLLOWUP_PROMPT}"
+            ))
+        else:
+            messages.extend(history)
+            messages.append(self._FOLLOWUP_MESSAGE)
+        return messages
+    
+    def _goal_message(self, context: TaskContext) -> LLMMessage:
+        """Get the opening goal message, built once per task"""
+        if context._goal_message is None:
+            context._goal_message = LLMMessage(
+                role="user", 
+                content=f"Goal: {context.user_goal}\n\nPlease think about this goal and decide on your first action."
+            )
+        return context._goal_message
+    
+    def _history_messages(self, context: TaskContext) -> List[LLMMessage]:
+        """Get the conversation history, converting only steps completed since the last call"""
+        history = context._history
+        for prev_step in context.steps[context._history_steps:]:
+            if prev_step.action and prev_step.observation is not None:
+                # Add assistant's thought+action
+                history.append(LLMMessage(role="assistant", content=prev_step._assistant_json))
+                
+                # Add observation as user message
+                context._observations.append((len(history), prev_step))
+                history.append(LLMMessage(role="user", content=f"Observation: {prev_step.observation}"))
+        context._history_steps = len(context.steps)
+        
+        # Compact observations that have left the recency window, each exactly once
+        while len(context._observations) - context._elided > self.recent_observations:
+            index, old_step = context._observations[context._elided]
+            context._elided += 1
+            if len(old_step.observation) > self.max_history_chars:
+                history[index] = LLMMessage(
+                    role="user",
+                    content=f"Observation: [observation #{old_step.step_number} elided, {len(old_step.observation)} chars]"
+                )
+        return history
+    
+    def _prior_steps_summary(self, context: TaskContext, count: int) -> str:
+        """Summarize the first count replayed steps, reusing the context's last summary when unchanged"""
+        if context._summary is not None and context._summary[0] == count:
+            return context._summary[1]
+        
+        lines = []
+        for _, step in context._observations[:count]:
+            actions = step.action.get("actions") or [step.action]
+            tools = ", ".join(str(action.get("tool")) for action in actions)
+            observation = " ".join(step.observation.split())
+            if len(observation) > _SUMMARY_OBSERVATION_CHARS:
+                observation = observation[:_SUMMARY_OBSERVATION_CHARS] + "..."
+            lines.append(f"- Step {step.step_number}: {tools} -> {observation}")
+        
+        # Keep the most recent lines when the summary exceeds its budget
+        budget = self.history_summary_chars
+        kept = []
+        for line in reversed(lines):
+            budget -= len(line) + 1
+            if budget < 0:
+                break
+            kept.append(line)
+        if len(kept) < len(lines):
+            kept.append(f"- ({len(lines) - len(kept)} earlier steps omitted)")
+        summary = "Prior-steps summary:\n" + "\n".join(reversed(kept))
+        context._summary = (count, summary)
+        return summary
+    
     def _parse_react_response(self, response_content: str) -> Dict[str, Any]:
         """Parse LLM response into thought and action - handles both JSON and plain text"""
         try:
-            # First try to parse as raw JSON
-            content = response_content.strip()
-            parsed = json.loads(content)
-            return parsed
+            # First try to parse as raw JSON (surrounding whitespace is valid JSON)
+            return json_loads(response_content)
         except json.JSONDecodeError:
             try:
                 # Try to extract JSON from code blocks
-                import re
-                json_match = re.search(r'```json\s*\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(response_content)
                 if json_match:
-                    json_content = json_match.group(1)
-                    parsed = json.loads(json_content)
-                    return parsed
+                    return json_loads(json_match.group(1))
                 
-                # Try to extract JSON without code blocks
-                json_match = re.search(r'(\{.*\})', content, re.DOTALL)
-                if json_match:
-                    json_content = json_match.group(1)
-                    parsed = json.loads(json_content)
-                    return parsed
+                # Try to extract the first JSON object without code blocks
+                brace = response_content.find("{")
+                if brace != -1:
+                    return _JSON_DECODER.raw_decode(response_content, brace)[0]
                     
             except json.JSONDecodeError:
                 pass
             
             # Fallback: Handle plain text responses from models like o4-mini
-            print(f"⚠️ Failed to parse JSON response, handling as plain text: {response_content}")
+            logger.warning("⚠️ Failed to parse JSON response, handling as plain text: %s", response_content)
             
             # Check if this looks like a direct answer to the user's question
             if self._is_direct_answer(response_content):
@@ -397,50 +693,72 @@ Remember: You are the supreme commander. Plan strategically, allocate resources
     
     def _is_direct_answer(self, content: str) -> bool:
         """Check if content looks like a direct answer to the user's question"""
-        content_lower = content.lower().strip()
-        
-        # Look for calculation results
-        if any(pattern in content_lower for pattern in ['$', 'tip', 'percent', '%', '=']):
-            return True
-            
-        # Look for definitive statements
-        if any(content_lower.startswith(word) for word in ['the answer is', 'result:', 'solution:']):
+        if _DIRECT_ANSWER_RE.search(content):
             return True
-            
-        # Look for mathematical expressions
-        import re
-        if re.search(r'\d+\s*[×*x]\s*\d+', content) or re.search(r'\d+\s*=\s*\$?\d+', content):
-            return True
-            
-        return False
+        
+        # Look for definitive statements; only the opening needs lowercasing
+        opening = content.lstrip()[:len(_DIRECT_ANSWER_STARTS[0])].lower()
+        return opening.startswith(_DIRECT_ANSWER_STARTS)
     
     def _needs_more_info(self, content: str) -> bool:
         """Check if content indicates need for more information"""
-        content_lower = content.lower().strip()
+        return _NEEDS_INFO_RE.search(content) is not None
+    
+    async def _execute_actions(self, actions: List[Dict[str, Any]], parallel: bool) -> ToolResult:
+        """Execute a batch of actions, concurrently when the model marked them independent"""
+        if parallel:
+            results = await asyncio.gather(*(self._execute_action(action) for action in actions))
+        else:
+            results = []
+            for action in actions:
+                result = await self._execute_action(action)
+                results.append(result)
+                if result.kind in ("concluded_success", "concluded_failure"):
+                    break
         
-        # Look for questions or requests for clarification
-        question_indicators = ['?', 'what', 'which', 'how', 'need to know', 'clarify', 'specify']
-        return any(indicator in content_lower for indicator in question_indicators)
+        # A conclusion ends the task, so its result stands for the whole batch
+        for result in results:
+            if result.kind in ("concluded_success", "concluded_failure"):
+                return result
+        
+        text = "\n".join(
+            f"[{i}] {action.get('tool')}: {result.text}"
+            for i, (action, result) in enumerate(zip(actions, results), 1)
+        )
+        kind = "error" if all(result.kind == "error" for result in results) else "ok"
+        return ToolResult(kind, text)
     
-    async def _execute_action(self, action: Dict[str, Any]) -> str:
+    async def _execute_action(self, action: Dict[str, Any]) -> ToolResult:
         """Execute a meta-tool action"""
         try:
             tool_name = action.get("tool")
             parameters = action.get("parameters", {})
             
             if not tool_name:
-                return "Error: No tool specified in action"
+                return ToolResult("error", "Error: No tool specified in action")
             
-            meta_tool = self.meta_tool_registry.get_tool(tool_name)
-            result = await meta_tool.execute(**parameters)
-            return result
+            meta_tool = self._tools.get(tool_name)
+            if meta_tool is None:
+                return ToolResult("error", f"Error: Meta-tool '{tool_name}' not found")
+            
+            if tool_name in _CONCLUDE_TOOLS:
+                # Conclusions only format their argument, so they never queue
+                # behind in-flight dispatches from other goals
+                text = await meta_tool.execute(**parameters)
+            else:
+                if self._tool_sem is None:
+                    self._tool_sem = asyncio.Semaphore(self.max_concurrent_tools)
+                async with self._tool_sem:
+                    text = await meta_tool.execute(**parameters)
             
         except ValueError as e:
-            return f"Error: {str(e)}"
+            return ToolResult("error", f"Error: {str(e)}")
         except Exception as e:
-            return f"Error executing action: {str(e)}"
-    
-    def _is_task_concluded(self, observation: str) -> bool:
-        """Check if the task has been concluded"""
-        return ("TASK_COMPLETED_SUCCESSFULLY" in observation or 
-                "TASK_FAILED" in observation)
\ No newline at end of file
+            return ToolResult("error", f"Error executing action: {str(e)}")
+        
+        # Only the conclusion tools end the task; other tools' output may quote the markers
+        if tool_name == "conclude_task_success" and text.startswith(_SUCCESS_MARKER):
+            return ToolResult("concluded_success", text)
+        if tool_name == "conclude_task_failure" and text.startswith(_FAILURE_MARKER):
+            return ToolResult("concluded_failure", text)
+        return ToolResult("ok", text)
\ No newline at end of file
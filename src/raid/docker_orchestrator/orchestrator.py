@@ -1,8 +1,17 @@
 """Docker Orchestrator implementation for managing Sub-Agent containers"""
 
+import asyncio
+import io
+import logging
 import os
-import tempfile
-from typing import Dict, Any, Optional, List
+import tarfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Iterator, Optional, List, Tuple
 from pathlib import Path
 import docker
 from docker.models.containers import Container
@@ -11,18 +20,111 @@ import platform
 import subprocess
 from ..config.sub_agent_config import SubAgentProfile, SubAgentConfigurator
 
+# Container and image progress; the CLI routes the "raid" loggers to stdout
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_docker_client(docker_socket: str) -> docker.DockerClient:
+    """Process-wide Docker client per socket, shared by every orchestrator"""
+    return docker.DockerClient(base_url=docker_socket)
+
+
+# How long a looked-up image is reused before asking the Docker daemon again
+IMAGE_CACHE_SECONDS = 2.0
+
+# Build output lines kept to explain a failed build
+BUILD_LOG_TAIL_LINES = 50
+
+# Most containers stopped or removed at once; the daemon races on many concurrent
+# removals (moby/moby#29369), so cleanup fans out only this far
+CLEANUP_MAX_WORKERS = 10
+
+# Concurrent image removals, submitted in batches so only a bounded number of
+# docker-py responses are held at once
+IMAGE_REMOVAL_WORKERS = 8
+IMAGE_REMOVAL_BATCH_SIZE = 50
+
+# The raid source files, read once per process and written into every image's
+# build context ahead of its Dockerfile and profile
+_SOURCE_FILES_LOCK = threading.Lock()
+# (source fingerprint, (archive name, data) pairs)
+_source_files_cache: Optional[Tuple[FrozenSet[Tuple[str, int]], Tuple[Tuple[str, bytes], ...]]] = None
+
+# Left out of the build context, as the old copytree of the package did
+_SOURCE_EXCLUDED_DIRS = frozenset({"__pycache__"})
+_SOURCE_EXCLUDED_SUFFIXES = (".pyc",)
+
+
+def _iter_source_paths(raid_dir: Path) -> Iterator[Path]:
+    """Yield the raid package's files that go into the build context, in a stable order"""
+    for dirpath, dirnames, filenames in os.walk(raid_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SOURCE_EXCLUDED_DIRS)
+        for filename in sorted(filenames):
+            if not filename.endswith(_SOURCE_EXCLUDED_SUFFIXES):
+                yield Path(dirpath) / filename
+
+
+def _source_fingerprint(raid_dir: Path) -> FrozenSet[Tuple[str, int]]:
+    """(path, mtime) of every build context file, so edits, additions and removals all change it"""
+    return frozenset((str(path), path.stat().st_mtime_ns) for path in _iter_source_paths(raid_dir))
+
+
+def _add_tar_file(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    """Add a regular file with fixed ownership and mtime, so identical content tars identically"""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _source_files() -> Tuple[Tuple[str, bytes], ...]:
+    """Get the source files as (archive name, data) pairs, rereading them only when the source has changed"""
+    global _source_files_cache
+    # Find the src directory
+    raid_dir = Path(__file__).parent.parent
+    if not raid_dir.exists():
+        raise FileNotFoundError(f"Source code not found at {raid_dir.parent}")
+    
+    with _SOURCE_FILES_LOCK:
+        fingerprint = _source_fingerprint(raid_dir)
+        if _source_files_cache is not None and _source_files_cache[0] == fingerprint:
+            return _source_files_cache[1]
+        
+        files = tuple(
+            (f"src/raid/{path.relative_to(raid_dir).as_posix()}", path.read_bytes())
+            for path in _iter_source_paths(raid_dir)
+        )
+        _source_files_cache = (fingerprint, files)
+        return _source_files_cache[1]
+
+
+def _build_context(dockerfile: str, requirements_txt: str, profile: SubAgentProfile) -> io.BytesIO:
+    """Tar build context: the cached source plus this profile's Dockerfile, requirements and profile"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in _source_files():
+            _add_tar_file(tar, name, data)
+        _add_tar_file(tar, "Dockerfile", dockerfile.encode())
+        _add_tar_file(tar, "requirements.txt", requirements_txt.encode())
+        _add_tar_file(tar, f"profiles/{profile.name}.yaml", profile.to_yaml_string().encode())
+    buffer.seek(0)
+    return buffer
+
 
 class DockerOrchestrator:
     """Manages Docker containers for Sub-Agents"""
     
     def __init__(self, docker_socket: str = "unix://var/run/docker.sock"):
-        self.docker_client = docker.DockerClient(base_url=docker_socket)
+        self.docker_client = _get_docker_client(docker_socket)
         self.configurator = SubAgentConfigurator()
         self.running_containers: Dict[str, Container] = {}
+        # image name -> (time.monotonic() expiry, image) from recent lookups and builds
+        self._image_cache: Dict[str, Tuple[float, Image]] = {}
     
     def _open_iterm_for_logs(self, container_name: str):
         """Opens a new iTerm2 tab/window to stream logs for a container on macOS."""
-        print(f"🍏 macOS detected. Attempting to open logs for '{container_name}' in a new iTerm2 window.")
+        logger.info("🍏 macOS detected. Attempting to open logs for '%s' in a new iTerm2 window.", container_name)
 
         # Using single quotes for the shell command to avoid escaping issues with AppleScript's double quotes.
         # The command is broken into two parts for clarity.
@@ -56,14 +158,14 @@ class DockerOrchestrator:
                 capture_output=True,
                 text=True
             )
-            print(f"🚀 Successfully opened a new iTerm2 tab for '{container_name}'.")
+            logger.info("🚀 Successfully opened a new iTerm2 tab for '%s'.", container_name)
         except subprocess.CalledProcessError as e:
-            print(f"⚠️  AppleScript for iTerm2 failed. Is iTerm2 running?")
-            print(f"   STDERR: {e.stderr}")
+            logger.warning("⚠️  AppleScript for iTerm2 failed. Is iTerm2 running?")
+            logger.warning("   STDERR: %s", e.stderr)
             # I will also print the script for debugging
-            print(f"   Failed script content:\n{script}")
+            logger.warning("   Failed script content:\n%s", script)
         except FileNotFoundError:
-            print("⚠️ `osascript` command not found. This feature is only available on macOS.")
+            logger.warning("⚠️ `osascript` command not found. This feature is only available on macOS.")
 
     def build_sub_agent_image(self, profile: SubAgentProfile) -> Image:
         """Build Docker image for a Sub-Agent profile"""
@@ -85,46 +187,65 @@ class DockerOrchestrator:
         #     print(f"⚠️  Could not remove existing image '{image_name}': {e}. Continuing with build...")
         
         # Check if image already exists
+        cached = self._image_cache.get(image_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
         try:
             existing_image = self.docker_client.images.get(image_name)
-            print(f"Image {image_name} already exists, using existing image")
+            logger.info("Image %s already exists, using existing image", image_name)
+            self._image_cache[image_name] = (time.monotonic() + IMAGE_CACHE_SECONDS, existing_image)
             return existing_image
         except docker.errors.ImageNotFound:
             pass
         
-        # Create temporary build context
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Generate Dockerfile
-            dockerfile_content = self.configurator.generate_dockerfile(profile)
-            (temp_path / "Dockerfile").write_text(dockerfile_content)
-            
-            # Generate requirements.txt
-            requirements_content = self.configurator.generate_requirements_txt()
-            (temp_path / "requirements.txt").write_text(requirements_content)
-            
-            # Copy source code
-            src_dir = temp_path / "src"
-            src_dir.mkdir()
-            self._copy_source_code(src_dir)
-            
-            # Copy profiles
-            profiles_dir = temp_path / "profiles"
-            profiles_dir.mkdir()
-            profile.to_yaml(str(profiles_dir / f"{profile.name}.yaml"))
-            
-            # Build image
-            print(f"Building Docker image: {image_name}")
-            image, build_logs = self.docker_client.images.build(
-                path=str(temp_path),
-                tag=image_name,
-                rm=True,
-                labels={"org.raid.agent": "true"}
-            )
-            
-            print(f"Successfully built image: {image_name}")
-            return image
+        # In-memory build context around the cached source files; its entries are
+        # deterministic, so identical COPY layers are reused from the build cache
+        context = _build_context(
+            self.configurator.generate_dockerfile(profile),
+            self.configurator.generate_requirements_txt(),
+            profile
+        )
+        
+        # Earlier versions of this profile's image seed the layer cache, e.g. after a
+        # version bump or on a daemon whose build cache was pruned; the daemon still
+        # falls back to its local cache for everything else
+        cache_from = [
+            tag
+            for image in self.docker_client.images.list(name=f"raid-subagent-{profile.name}")
+            for tag in image.tags
+        ]
+        
+        # Build image, consuming the daemon's output as it streams in
+        logger.info("Building Docker image: %s", image_name)
+        log_tail = deque(maxlen=BUILD_LOG_TAIL_LINES)
+        for chunk in self.docker_client.api.build(
+            fileobj=context,
+            custom_context=True,
+            tag=image_name,
+            cache_from=cache_from or None,
+            pull=False,
+            rm=True,
+            forcerm=True,
+            labels={"org.raid.agent": "true"},
+            decode=True
+        ):
+            if "error" in chunk:
+                raise docker.errors.BuildError(chunk["error"], list(log_tail))
+            log_tail.append(chunk)
+            line = chunk.get("stream", "").strip()
+            if line.startswith("Step "):
+                logger.info("   %s", line)
+        image = self.docker_client.images.get(image_name)
+        
+        logger.info("Successfully built image: %s", image_name)
+        self._image_cache[image_name] = (time.monotonic() + IMAGE_CACHE_SECONDS, image)
+        return image
+    
+    async def build_many(self, profiles: List[SubAgentProfile]) -> List[Image]:
+        """Build images for several profiles concurrently"""
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.build_sub_agent_image, profile) for profile in profiles)
+        ))
     
     def start_sub_agent(
         self, 
@@ -134,22 +255,32 @@ class DockerOrchestrator:
         """Start a Sub-Agent container"""
         container_name = f"raid-subagent-{profile_name}"
         
-        # Check if container already exists (even if not in our tracking)
+        # Check if container already exists (even if not in our tracking);
+        # containers.get already returns fresh state, so no reload() is needed
         try:
             existing_container = self.docker_client.containers.get(container_name)
-            existing_container.reload()
             
             if existing_container.status == "running":
-                print(f"Sub-Agent '{profile_name}' container already running, reusing it")
+                logger.info("Sub-Agent '%s' container already running, reusing it", profile_name)
                 self.running_containers[profile_name] = existing_container
                 return existing_container
             else:
-                print(f"Sub-Agent '{profile_name}' container exists but stopped, removing it")
+                logger.info("Sub-Agent '%s' container exists but stopped, removing it", profile_name)
                 existing_container.remove(force=True)
         except docker.errors.NotFound:
             # Container doesn't exist, which is fine
             pass
         
+        return self._start_fresh(profile_name, environment)
+    
+    def _start_fresh(
+        self,
+        profile_name: str,
+        environment: Optional[Dict[str, str]] = None
+    ) -> Container:
+        """Start a Sub-Agent container once no container with its name exists"""
+        container_name = f"raid-subagent-{profile_name}"
+        
         # Remove from our tracking if it was there
         if profile_name in self.running_containers:
             del self.running_containers[profile_name]
@@ -169,7 +300,7 @@ class DockerOrchestrator:
         
         # Start container (container_name already defined above)
         
-        print(f"Starting Sub-Agent container: {container_name}")
+        logger.info("Starting Sub-Agent container: %s", container_name)
         container = self.docker_client.containers.run(
             image=image.id,
             name=container_name,
@@ -180,13 +311,13 @@ class DockerOrchestrator:
         )
         
         self.running_containers[profile_name] = container
-        print(f"Sub-Agent '{profile_name}' started successfully")
+        logger.info("Sub-Agent '%s' started successfully", profile_name)
 
         if platform.system() == "Darwin":
             try:
                 self._open_iterm_for_logs(container_name)
             except Exception as e:
-                print(f"⚠️  Could not open iTerm2 window for logs: {e}")
+                logger.warning("⚠️  Could not open iTerm2 window for logs: %s", e)
 
         return container
     
@@ -200,28 +331,29 @@ class DockerOrchestrator:
         
         try:
             container = self.docker_client.containers.get(container_name)
-            print(f"Stopping Sub-Agent '{profile_name}'...")
+            logger.info("Stopping Sub-Agent '%s'...", profile_name)
             
             try:
                 container.stop(timeout=10)
             except Exception as e:
-                print(f"Error stopping container (will force remove): {e}")
+                logger.error("Error stopping container (will force remove): %s", e)
             
             container.remove(force=True)
-            print(f"Sub-Agent '{profile_name}' stopped and removed successfully")
+            logger.info("Sub-Agent '%s' stopped and removed successfully", profile_name)
             
         except docker.errors.NotFound:
-            print(f"Sub-Agent '{profile_name}' container not found (already removed)")
+            logger.info("Sub-Agent '%s' container not found (already removed)", profile_name)
         except Exception as e:
-            print(f"Error stopping Sub-Agent '{profile_name}': {e}")
+            logger.error("Error stopping Sub-Agent '%s': %s", profile_name, e)
     
-    def get_sub_agent_status(self, profile_name: str) -> Dict[str, Any]:
-        """Get status of a Sub-Agent container"""
-        if profile_name not in self.running_containers:
-            return {"status": "not_running"}
-        
-        container = self.running_containers[profile_name]
-        container.reload()  # Refresh container info
+    def get_sub_agent_status(self, profile_name: str, container: Optional[Container] = None) -> Dict[str, Any]:
+        """Get status of a Sub-Agent container, from a freshly fetched container if given"""
+        if container is None:
+            if profile_name not in self.running_containers:
+                return {"status": "not_running"}
+            
+            container = self.running_containers[profile_name]
+            container.reload()  # Refresh container info
         
         return {
             "status": container.status,
@@ -233,10 +365,36 @@ class DockerOrchestrator:
     
     def list_running_sub_agents(self) -> List[Dict[str, Any]]:
         """List all running Sub-Agent containers"""
-        running_agents = []
+        if not self.running_containers:
+            return []
         
-        for profile_name, container in self.running_containers.items():
-            status = self.get_sub_agent_status(profile_name)
+        # Two daemon requests in total instead of a reload plus an image lookup per container
+        listed = {
+            c.id: c for c in self.docker_client.containers.list(
+                all=True, filters={"name": "raid-subagent-"}, sparse=True
+            )
+        }
+        image_tags = {
+            img.id: img.tags for img in self.docker_client.images.list(
+                filters={"label": "org.raid.agent=true"}
+            )
+        }
+        
+        running_agents = []
+        for profile_name, tracked in self.running_containers.items():
+            container = listed.get(tracked.id)
+            if container is None:
+                status = {"status": "not_running"}
+            else:
+                # Sparse list entries carry Names/ImageID and a Unix Created time
+                tags = image_tags.get(container.attrs.get("ImageID"))
+                status = {
+                    "status": container.status,
+                    "id": container.id,
+                    "name": container.attrs["Names"][0].lstrip("/"),
+                    "created": datetime.fromtimestamp(container.attrs["Created"], tz=timezone.utc).isoformat(),
+                    "image": tags[0] if tags else "unknown"
+                }
             status["profile_name"] = profile_name
             running_agents.append(status)
         
@@ -250,72 +408,95 @@ class DockerOrchestrator:
         """Ensure a Sub-Agent is running, start if not"""
         container_name = f"raid-subagent-{profile_name}"
         
-        # Check if container exists
+        # Check if container exists (containers.get returns fresh state)
         try:
             existing_container = self.docker_client.containers.get(container_name)
-            existing_container.reload()
             
             if existing_container.status == "running":
-                print(f"Sub-Agent '{profile_name}' container already running, reusing")
+                logger.info("Sub-Agent '%s' container already running, reusing", profile_name)
                 self.running_containers[profile_name] = existing_container
                 return existing_container
             else:
-                print(f"Sub-Agent '{profile_name}' container exists but not running ({existing_container.status}), removing...")
+                logger.info("Sub-Agent '%s' container exists but not running (%s), removing...", profile_name, existing_container.status)
                 existing_container.remove(force=True)
                 
         except docker.errors.NotFound:
             # Container doesn't exist, which is fine
             pass
         except Exception as e:
-            print(f"Error checking existing container: {e}")
+            logger.error("Error checking existing container: %s", e)
             # Try to remove it anyway
             try:
                 existing_container = self.docker_client.containers.get(container_name)
                 existing_container.remove(force=True)
             except:
                 pass
+            # The container state is unknown here, so let start_sub_agent check again
+            return self.start_sub_agent(profile_name, environment)
         
-        # Start fresh container
-        return self.start_sub_agent(profile_name, environment)
+        # Start fresh container; the name is known to be free, so skip start_sub_agent's lookup
+        return self._start_fresh(profile_name, environment)
     
     def cleanup_all(self) -> None:
         """Stop and cleanup all Sub-Agent containers"""
         profile_names = list(self.running_containers.keys())
         
-        for profile_name in profile_names:
-            try:
-                self.stop_sub_agent(profile_name)
-            except Exception as e:
-                print(f"Error stopping {profile_name}: {e}")
+        # Each stop waits on the container's shutdown, so stop them side by side
+        if profile_names:
+            with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(profile_names))) as pool:
+                futures = {pool.submit(self.stop_sub_agent, name): name for name in profile_names}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error("Error stopping %s: %s", futures[future], e)
         
-        # Also clean up any orphaned raid containers
+        self._remove_orphaned_containers()
+    
+    def _remove_orphaned_containers(self) -> None:
+        """Remove raid containers left behind outside our tracking"""
         try:
             containers = self.docker_client.containers.list(all=True, filters={"name": "raid-subagent"})
-            for container in containers:
+        except Exception as e:
+            logger.error("Error during orphaned container cleanup: %s", e)
+            return
+        if not containers:
+            return
+        
+        def remove(container: Container) -> None:
+            logger.info("Cleaning up orphaned container: %s", container.name)
+            container.remove(force=True)
+        
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(containers))) as pool:
+            futures = {pool.submit(remove, container): container for container in containers}
+            for future in as_completed(futures):
                 try:
-                    print(f"Cleaning up orphaned container: {container.name}")
-                    container.remove(force=True)
+                    future.result()
                 except Exception as e:
-                    print(f"Error removing orphaned container {container.name}: {e}")
-        except Exception as e:
-            print(f"Error during orphaned container cleanup: {e}")
+                    logger.error("Error removing orphaned container %s: %s", futures[future].name, e)
     
-    def _copy_source_code(self, dest_dir: Path) -> None:
-        """Copy source code to build context"""
-        import shutil
-        
-        # Find the src directory
-        current_file = Path(__file__)
-        src_root = current_file.parent.parent.parent  # Go up to find src/
-        
-        if (src_root / "raid").exists():
-            shutil.copytree(
-                src_root / "raid",
-                dest_dir / "raid",
-                ignore=shutil.ignore_patterns("__pycache__", "*.pyc")
-            )
-        else:
-            raise FileNotFoundError(f"Source code not found at {src_root}")
+    # Async wrappers: the Docker SDK is blocking, so these run it in worker threads
+    # and keep the event loop responsive during multi-agent orchestration
+    
+    async def astart_sub_agent(self, profile_name: str, environment: Optional[Dict[str, str]] = None) -> Container:
+        """Async start_sub_agent"""
+        return await asyncio.to_thread(self.start_sub_agent, profile_name, environment)
+    
+    async def aensure_sub_agent_running(self, profile_name: str, environment: Optional[Dict[str, str]] = None) -> Container:
+        """Async ensure_sub_agent_running"""
+        return await asyncio.to_thread(self.ensure_sub_agent_running, profile_name, environment)
+    
+    async def astop_sub_agent(self, profile_name: str) -> None:
+        """Async stop_sub_agent"""
+        await asyncio.to_thread(self.stop_sub_agent, profile_name)
+    
+    async def acleanup_all(self) -> None:
+        """Async cleanup_all"""
+        await asyncio.to_thread(self.cleanup_all)
+    
+    async def acleanup_unused_images(self, max_images_to_keep: int = 10) -> None:
+        """Async cleanup_unused_images"""
+        await asyncio.to_thread(self.cleanup_unused_images, max_images_to_keep)
     
     def get_container_logs(self, profile_name: str, tail: int = 100) -> str:
         """Get logs from a Sub-Agent container"""
@@ -333,22 +514,22 @@ class DockerOrchestrator:
         try:
             container = self.docker_client.containers.get(container_id)
             container.stop(timeout=10)
-            print(f"Stopped container {container_id[:12]}")
+            logger.info("Stopped container %s", container_id[:12])
         except docker.errors.NotFound:
-            print(f"Container {container_id[:12]} not found (already removed)")
+            logger.info("Container %s not found (already removed)", container_id[:12])
         except Exception as e:
-            print(f"Error stopping container {container_id[:12]}: {e}")
+            logger.error("Error stopping container %s: %s", container_id[:12], e)
     
     def remove_container(self, container_id: str) -> None:
         """Remove a container by ID"""
         try:
             container = self.docker_client.containers.get(container_id)
             container.remove(force=True)
-            print(f"Removed container {container_id[:12]}")
+            logger.info("Removed container %s", container_id[:12])
         except docker.errors.NotFound:
-            print(f"Container {container_id[:12]} not found (already removed)")
+            logger.info("Container %s not found (already removed)", container_id[:12])
         except Exception as e:
-            print(f"Error removing container {container_id[:12]}: {e}")
+            logger.error("Error removing container %s: %s", container_id[:12], e)
     
     def is_container_running(self, container_id: str) -> bool:
         """Check if a specific container is running by its ID."""
@@ -358,20 +539,42 @@ class DockerOrchestrator:
         except docker.errors.NotFound:
             return False
         except Exception as e:
-            print(f"Error checking container status for {container_id}: {e}")
+            logger.error("Error checking container status for %s: %s", container_id, e)
             return False
 
+    def _remove_images(self, images: List[Image]) -> List[Tuple[str, docker.errors.APIError]]:
+        """Force-remove images concurrently, returning (name, error) for each that failed"""
+        def remove(image: Image) -> None:
+            self.docker_client.images.remove(image=image.id, force=True)
+        
+        failures = []
+        with ThreadPoolExecutor(max_workers=IMAGE_REMOVAL_WORKERS) as pool:
+            for start in range(0, len(images), IMAGE_REMOVAL_BATCH_SIZE):
+                batch = images[start:start + IMAGE_REMOVAL_BATCH_SIZE]
+                futures = {}
+                for image in batch:
+                    # Use the first tag for a more user-friendly name in logs
+                    image_name = image.tags[0] if image.tags else image.id
+                    logger.info("   - Removing %s...", image_name)
+                    futures[pool.submit(remove, image)] = image_name
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except docker.errors.APIError as e:
+                        failures.append((futures[future], e))
+        return failures
+    
     def cleanup_unused_images(self, max_images_to_keep: int = 10) -> None:
         """
         Cleans up unused raid-subagent images, keeping a specified number of the most recent ones.
         """
-        print(f"\n🧹 Starting unused Docker image cleanup (keeping max {max_images_to_keep})...")
+        logger.info("\n🧹 Starting unused Docker image cleanup (keeping max %s)...", max_images_to_keep)
         try:
             # Prune dangling images (the <none>:<none> ones)
             pruned_images = self.docker_client.images.prune(filters={'dangling': True})
             if "ImagesDeleted" in pruned_images and pruned_images["ImagesDeleted"]:
                 space_reclaimed = pruned_images.get('SpaceReclaimed', 0)
-                print(f"🧹 Pruned {len(pruned_images['ImagesDeleted'])} dangling images, reclaimed {space_reclaimed // 1024 // 1024} MB.")
+                logger.info("🧹 Pruned %s dangling images, reclaimed %s MB.", len(pruned_images['ImagesDeleted']), space_reclaimed // 1024 // 1024)
 
             # 1. Get all raid-subagent images, sorted by creation time (newest first)
             all_raid_images = self.docker_client.images.list(
@@ -384,7 +587,7 @@ class DockerOrchestrator:
                 filters={"label": "org.raid.agent=true"}
             )
             used_image_ids = {container.image.id for container in running_containers}
-            print(f"🕵️ Found {len(all_raid_images)} total Raid images and {len(used_image_ids)} images in use.")
+            logger.info("🕵️ Found %s total Raid images and %s images in use.", len(all_raid_images), len(used_image_ids))
 
             # 3. Determine which images are unused
             unused_images = []
@@ -392,24 +595,24 @@ class DockerOrchestrator:
                 if img.id not in used_image_ids:
                     unused_images.append(img)
             
-            print(f"👉 Found {len(unused_images)} unused images.")
+            logger.info("👉 Found %s unused images.", len(unused_images))
 
             # 4. If unused images exceed the limit, remove the oldest ones
             if len(unused_images) > max_images_to_keep:
                 images_to_remove = unused_images[max_images_to_keep:]
-                print(f"🗑️  Will remove {len(images_to_remove)} oldest images to meet the limit.")
-                for img_to_remove in images_to_remove:
-                    try:
-                        # Use the first tag for a more user-friendly name in logs
-                        image_name = img_to_remove.tags[0] if img_to_remove.tags else img_to_remove.id
-                        print(f"   - Removing {image_name}...")
-                        self.docker_client.images.remove(image=img_to_remove.id, force=True)
-                    except docker.errors.APIError as e:
-                        print(f"   - ⚠️  Could not remove image {image_name}: {e}")
+                logger.info("🗑️  Will remove %s oldest images to meet the limit.", len(images_to_remove))
+                failures = self._remove_images(images_to_remove)
+                self._image_cache.clear()
+                if failures:
+                    logger.warning(
+                        "   - ⚠️  Could not remove %s of %s images: %s",
+                        len(failures), len(images_to_remove),
+                        "; ".join(f"{name}: {error}" for name, error in failures)
+                    )
             else:
-                print("✅ Image count is within the limit. No images to remove.")
+                logger.info("✅ Image count is within the limit. No images to remove.")
 
         except Exception as e:
-            print(f"❌ An error occurred during image cleanup: {e}")
+            logger.error("❌ An error occurred during image cleanup: %s", e)
         
-        print("🧹 Image cleanup finished.")
\ No newline at end of file
+        logger.info("🧹 Image cleanup finished.")
\ No newline at end of file
@@ -136,8 +136,8 @@ class SubAgentLifecycleManager:
         if self.force_cleanup_on_shutdown:
             await self._cleanup_all_agents("System shutdown")
         
-        # Also cleanup unused docker images
-        self.orchestrator.cleanup_unused_images(max_images_to_keep=10)
+        # Also cleanup unused docker images (off the event loop)
+        await self.orchestrator.acleanup_unused_images(max_images_to_keep=10)
 
         print("🔄 Lifecycle manager stopped")
     
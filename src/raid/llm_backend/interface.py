@@ -1,7 +1,7 @@
 """Abstract interface for LLM backends"""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from pydantic import BaseModel
 
 
@@ -37,7 +37,22 @@ class LLMBackend(ABC):
         """Generate response from LLM"""
         pass
     
+    async def generate_stream(
+        self,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream the response text in chunks (one chunk from generate unless overridden)"""
+        response = await self.generate(messages, max_tokens=max_tokens, temperature=temperature, **kwargs)
+        yield response.content
+    
     @abstractmethod
     async def health_check(self) -> bool:
         """Check if the LLM backend is available"""
+        pass
+    
+    async def close(self) -> None:
+        """Release pooled connections (no-op unless the backend holds any)"""
         pass
\ No newline at end of file
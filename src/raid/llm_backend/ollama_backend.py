@@ -1,10 +1,15 @@
 """Ollama backend implementation"""
 
-from typing import List, Optional, Any
+from typing import AsyncIterator, List, Optional, Any
+import asyncio
 import aiohttp
 import json
+import logging
 from .interface import LLMBackend, LLMResponse, LLMMessage
 
+# Session lifecycle diagnostics; the CLI routes the "raid" loggers to stdout
+logger = logging.getLogger(__name__)
+
 
 class OllamaBackend(LLMBackend):
     """Ollama LLM backend implementation"""
@@ -12,6 +17,36 @@ class OllamaBackend(LLMBackend):
     def __init__(self, model: str, base_url: str = "http://localhost:11434", **kwargs: Any):
         super().__init__(model, **kwargs)
         self.base_url = base_url.rstrip("/")
+        # One pooled session, so concurrent and back-to-back calls reuse keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it for the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self._discard_session()
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+    
+    def _discard_session(self) -> None:
+        """Drop a session left open by another event loop, closing its connections synchronously"""
+        # The old loop (e.g. one finished by asyncio.run) cannot await close(), so
+        # detach the connector and close it directly instead of leaking it
+        logger.debug("Closing Ollama session left open by a previous event loop")
+        connector = self._session.connector
+        self._session.detach()
+        if connector is not None:
+            connector._close()
+        self._session = None
+    
+    async def close(self) -> None:
+        """Close the shared session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def generate(
         self,
@@ -47,37 +82,79 @@ class OllamaBackend(LLMBackend):
                 payload["options"] = options
             
             # Make API call
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise RuntimeError(f"Ollama API error: {error_text}")
-                    
-                    result = await response.json()
-                    
-                    return LLMResponse(
-                        content=result.get("message", {}).get("content", ""),
-                        finish_reason=result.get("done_reason", "stop"),
-                        usage={
-                            "prompt_tokens": result.get("prompt_eval_count", 0),
-                            "completion_tokens": result.get("eval_count", 0),
-                            "total_tokens": result.get("prompt_eval_count", 0) + result.get("eval_count", 0),
-                        },
-                        model=self.model
-                    )
+            async with self._get_session().post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Ollama API error: {error_text}")
+                
+                result = await response.json()
+                
+                return LLMResponse(
+                    content=result.get("message", {}).get("content", ""),
+                    finish_reason=result.get("done_reason", "stop"),
+                    usage={
+                        "prompt_tokens": result.get("prompt_eval_count", 0),
+                        "completion_tokens": result.get("eval_count", 0),
+                        "total_tokens": result.get("prompt_eval_count", 0) + result.get("eval_count", 0),
+                    },
+                    model=self.model
+                )
                     
         except Exception as e:
             raise RuntimeError(f"Ollama API error: {str(e)}")
     
+    async def generate_stream(
+        self,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream response text using Ollama API (newline-delimited JSON chunks)"""
+        payload = {
+            "model": self.model,
+            "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+            **kwargs,
+            "stream": True
+        }
+        options = {}
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+        if temperature is not None:
+            options["temperature"] = temperature
+        if options:
+            payload["options"] = options
+        
+        try:
+            async with self._get_session().post(
+                f"{self.base_url}/api/chat",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Ollama API error: {error_text}")
+                
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        yield content
+                    if chunk.get("done"):
+                        break
+        except Exception as e:
+            raise RuntimeError(f"Ollama API error: {str(e)}")
+    
     async def health_check(self) -> bool:
         """Check Ollama API availability"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/version") as response:
-                    return response.status == 200
+            async with self._get_session().get(f"{self.base_url}/api/version") as response:
+                return response.status == 200
         except Exception:
             return False
\ No newline at end of file
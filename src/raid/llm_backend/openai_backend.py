@@ -1,6 +1,6 @@
 """OpenAI backend implementation"""
 
-from typing import List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 import openai
 from .interface import LLMBackend, LLMResponse, LLMMessage
 
@@ -12,6 +12,49 @@ class OpenAIBackend(LLMBackend):
         super().__init__(model, **kwargs)
         self.client = openai.AsyncOpenAI(api_key=api_key)
     
+    def _request_params(
+        self,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build chat.completions.create parameters for a request"""
+        # Convert messages to OpenAI format
+        openai_messages = [
+            {"role": msg.role, "content": msg.content}
+            for msg in messages
+        ]
+        
+        # Prepare request parameters
+        request_params = {
+            "model": self.model,
+            "messages": openai_messages,
+        }
+        
+        # Special handling for o4-mini model
+        if self.model == "o4-mini":
+            request_params["response_format"] = {"type": "text"}
+            request_params["reasoning_effort"] = kwargs.get("reasoning_effort", "medium")
+            # o4-mini uses max_completion_tokens instead of max_tokens
+            if max_tokens is not None:
+                request_params["max_completion_tokens"] = max_tokens
+            # o4-mini doesn't support custom temperature, only default (1)
+            # So we skip temperature parameter for o4-mini
+        else:
+            # Standard models support temperature and max_tokens
+            if temperature is not None:
+                request_params["temperature"] = temperature
+            if max_tokens is not None:
+                request_params["max_tokens"] = max_tokens
+        
+        # Add other kwargs (excluding our special handled ones)
+        for key, value in kwargs.items():
+            if key not in ["reasoning_effort"]:  # Skip our custom params
+                request_params[key] = value
+        
+        return request_params
+    
     async def generate(
         self,
         messages: List[LLMMessage],
@@ -21,60 +64,68 @@ class OpenAIBackend(LLMBackend):
     ) -> LLMResponse:
         """Generate response using OpenAI API"""
         try:
-            # Convert messages to OpenAI format
-            openai_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in messages
-            ]
-            
-            # Prepare request parameters
-            request_params = {
-                "model": self.model,
-                "messages": openai_messages,
-            }
-            
-            # Special handling for o4-mini model
-            if self.model == "o4-mini":
-                request_params["response_format"] = {"type": "text"}
-                request_params["reasoning_effort"] = kwargs.get("reasoning_effort", "medium")
-                # o4-mini uses max_completion_tokens instead of max_tokens
-                if max_tokens is not None:
-                    request_params["max_completion_tokens"] = max_tokens
-                # o4-mini doesn't support custom temperature, only default (1)
-                # So we skip temperature parameter for o4-mini
-            else:
-                # Standard models support temperature and max_tokens
-                if temperature is not None:
-                    request_params["temperature"] = temperature
-                if max_tokens is not None:
-                    request_params["max_tokens"] = max_tokens
-            
-            # Add other kwargs (excluding our special handled ones)
-            for key, value in kwargs.items():
-                if key not in ["reasoning_effort"]:  # Skip our custom params
-                    request_params[key] = value
-            
             # Make API call
-            response = await self.client.chat.completions.create(**request_params)
+            response = await self.client.chat.completions.create(
+                **self._request_params(messages, max_tokens, temperature, kwargs)
+            )
+            
+            usage = None
+            if response.usage:
+                usage = {
+                    "prompt_tokens": response.usage.prompt_tokens,
+                    "completion_tokens": response.usage.completion_tokens,
+                    "total_tokens": response.usage.total_tokens,
+                }
+                # Prompt tokens served from OpenAI's automatic prefix cache
+                details = getattr(response.usage, "prompt_tokens_details", None)
+                cached_tokens = getattr(details, "cached_tokens", None)
+                if cached_tokens is not None:
+                    usage["cached_tokens"] = cached_tokens
             
             return LLMResponse(
                 content=response.choices[0].message.content or "",
                 finish_reason=response.choices[0].finish_reason or "unknown",
-                usage={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                    "total_tokens": response.usage.total_tokens if response.usage else 0,
-                } if response.usage else None,
+                usage=usage,
                 model=response.model
             )
             
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
     
+    async def generate_stream(
+        self,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream response text using OpenAI API"""
+        try:
+            stream = await self.client.chat.completions.create(
+                **self._request_params(messages, max_tokens, temperature, kwargs),
+                stream=True
+            )
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+        
+        # Closing the stream early (consumer stopped reading) drops the connection
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+        finally:
+            await stream.close()
+    
     async def health_check(self) -> bool:
         """Check OpenAI API availability"""
         try:
             await self.client.models.list()
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    async def close(self) -> None:
+        """Close the client's HTTP connection pool"""
+        await self.client.close()
\ No newline at end of file
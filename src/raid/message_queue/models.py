@@ -1,12 +1,34 @@
 """Message models for queue communication"""
 
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import uuid
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class TaskMessage(BaseModel):
+
+class _QueueMessage(BaseModel):
+    """Base for messages that travel over the Redis queues"""
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize for a queue, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.dumps(self.model_dump())
+        return self.model_dump_json().encode()
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]):
+        """Parse a message read from a queue"""
+        if orjson is not None:
+            return cls.model_validate(orjson.loads(data))
+        return cls.model_validate_json(data)
+
+
+class TaskMessage(_QueueMessage):
     """Message format for task requests"""
     task_id: str
     sub_agent_profile: str
@@ -37,7 +59,7 @@ class TaskMessage(BaseModel):
         )
 
 
-class ResultMessage(BaseModel):
+class ResultMessage(_QueueMessage):
     """Message format for task results"""
     task_id: str
     correlation_id: str
@@ -1,12 +1,17 @@
 """Redis-based message queue implementation"""
 
-import json
 import asyncio
-from typing import Optional, Callable, Dict, Any
+import time
+from typing import Optional, Callable, Dict, Any, List, Tuple
 import redis.asyncio as redis
 from .models import TaskMessage, ResultMessage
 from ..config.settings import MessageQueueConfig
 
+# A sub-agent's ready marker expires unless refreshed this often, so a crashed
+# sub-agent stops counting as ready; it refreshes the marker every READY_HEARTBEAT_SECONDS
+READY_TTL_SECONDS = 30
+READY_HEARTBEAT_SECONDS = 10
+
 
 class RedisMQ:
     """Redis-based message queue for Raid system"""
@@ -14,35 +19,49 @@ class RedisMQ:
     def __init__(self, config: MessageQueueConfig):
         self.config = config
         self.redis_client: Optional[redis.Redis] = None
-        self._subscribers: Dict[str, Callable] = {}
+        # channel -> (pubsub, listener task) of each live subscription; one channel
+        # may carry several, e.g. every agent of a group on its broadcast channel
+        self._subscribers: Dict[str, List[Tuple[Any, asyncio.Task]]] = {}
     
     async def connect(self) -> None:
-        """Connect to Redis"""
+        """Connect to Redis (no-op if already connected)"""
+        if self.redis_client is not None:
+            return
         try:
-            self.redis_client = redis.Redis(
+            # Listeners, readiness waits and BRPOPs each hold a connection while they
+            # run, so at the limit callers wait for one instead of failing outright
+            pool = redis.BlockingConnectionPool(
                 host=self.config.redis_host,
                 port=self.config.redis_port,
                 db=self.config.redis_db,
                 password=self.config.redis_password,
-                decode_responses=True
+                decode_responses=True,
+                max_connections=self.config.redis_max_connections,
+                timeout=self.config.redis_pool_timeout
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             # Test connection
             await self.redis_client.ping()
         except Exception as e:
+            self.redis_client = None
             raise RuntimeError(f"Failed to connect to Redis: {e}")
     
     async def disconnect(self) -> None:
         """Disconnect from Redis"""
+        for channel in list(self._subscribers):
+            await self.unsubscribe_from_channel(channel)
         if self.redis_client:
             await self.redis_client.close()
+            # close() leaves an explicitly supplied pool open
+            await self.redis_client.connection_pool.disconnect()
+            self.redis_client = None
     
     async def send_task(self, queue_name: str, task: TaskMessage) -> None:
         """Send a task message to a queue"""
         if not self.redis_client:
             raise RuntimeError("Not connected to Redis")
         
-        message_data = task.model_dump_json()
-        await self.redis_client.lpush(queue_name, message_data)
+        await self.redis_client.lpush(queue_name, task.to_json_bytes())
     
     async def receive_task(self, queue_name: str, timeout: int = 0) -> Optional[TaskMessage]:
         """Receive a task message from a queue"""
@@ -53,8 +72,7 @@ class RedisMQ:
             result = await self.redis_client.brpop(queue_name, timeout=timeout)
             if result:
                 _, message_data = result
-                task_dict = json.loads(message_data)
-                return TaskMessage(**task_dict)
+                return TaskMessage.from_json(message_data)
             return None
         except Exception as e:
             raise RuntimeError(f"Failed to receive task: {e}")
@@ -64,8 +82,7 @@ class RedisMQ:
         if not self.redis_client:
             raise RuntimeError("Not connected to Redis")
         
-        message_data = result.model_dump_json()
-        await self.redis_client.lpush(queue_name, message_data)
+        await self.redis_client.lpush(queue_name, result.to_json_bytes())
     
     async def receive_result(self, queue_name: str, timeout: int = 0) -> Optional[ResultMessage]:
         """Receive a result message from a queue"""
@@ -76,8 +93,7 @@ class RedisMQ:
             result = await self.redis_client.brpop(queue_name, timeout=timeout)
             if result:
                 _, message_data = result
-                result_dict = json.loads(message_data)
-                return ResultMessage(**result_dict)
+                return ResultMessage.from_json(message_data)
             return None
         except Exception as e:
             raise RuntimeError(f"Failed to receive result: {e}")
@@ -117,6 +133,56 @@ class RedisMQ:
         """Get result queue name for a sub-agent profile"""
         return f"raid:results:{profile}"
     
+    def get_ready_key(self, profile: str) -> str:
+        """Get the key (and channel) a sub-agent uses to signal readiness"""
+        return f"raid:ready:{profile}"
+    
+    # Readiness signalling
+    
+    async def announce_ready(self, profile: str) -> None:
+        """Record and broadcast that a sub-agent is listening for tasks"""
+        if not self.redis_client:
+            raise RuntimeError("Not connected to Redis")
+        
+        ready_key = self.get_ready_key(profile)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(ready_key, time.time(), ex=READY_TTL_SECONDS)
+            pipe.publish(ready_key, "ready")
+            await pipe.execute()
+    
+    async def refresh_ready(self, profile: str) -> None:
+        """Extend a sub-agent's ready marker (heartbeat)"""
+        if not self.redis_client:
+            raise RuntimeError("Not connected to Redis")
+        
+        await self.redis_client.set(self.get_ready_key(profile), time.time(), ex=READY_TTL_SECONDS)
+    
+    async def clear_ready(self, profile: str) -> None:
+        """Remove a sub-agent's ready marker"""
+        if not self.redis_client:
+            raise RuntimeError("Not connected to Redis")
+        
+        await self.redis_client.delete(self.get_ready_key(profile))
+    
+    async def wait_ready(self, profile: str) -> None:
+        """Wait until a sub-agent has announced it is ready (callers bound this with a timeout)"""
+        if not self.redis_client:
+            raise RuntimeError("Not connected to Redis")
+        
+        ready_key = self.get_ready_key(profile)
+        pubsub = self.redis_client.pubsub()
+        # Subscribe before checking the marker so an announcement in between is not missed
+        await pubsub.subscribe(ready_key)
+        try:
+            if await self.redis_client.exists(ready_key):
+                return
+            async for message in pubsub.listen():
+                if message['type'] == 'message':
+                    return
+        finally:
+            await pubsub.unsubscribe(ready_key)
+            await pubsub.close()
+    
     # Pub/Sub methods for collaboration
     
     async def publish_message(self, channel: str, message: str) -> None:
@@ -135,11 +201,9 @@ class RedisMQ:
         pubsub = self.redis_client.pubsub()
         await pubsub.subscribe(channel)
         
-        # Store subscription for cleanup
-        self._subscribers[channel] = callback
-        
-        # Start listening task
-        asyncio.create_task(self._listen_to_channel(pubsub, channel, callback))
+        # Start listening task, and store the subscription for cleanup
+        task = asyncio.create_task(self._listen_to_channel(pubsub, channel, callback))
+        self._subscribers.setdefault(channel, []).append((pubsub, task))
     
     async def _listen_to_channel(self, pubsub, channel: str, callback: Callable[[str, str], None]) -> None:
         """Listen to messages on a subscribed channel"""
@@ -150,10 +214,16 @@ class RedisMQ:
         except Exception as e:
             print(f"Error listening to channel {channel}: {e}")
         finally:
-            await pubsub.unsubscribe(channel)
+            # A listener that stops on its own no longer counts as a subscription
+            subscriptions = self._subscribers.get(channel, [])
+            subscriptions[:] = [entry for entry in subscriptions if entry[0] is not pubsub]
+            if not subscriptions:
+                self._subscribers.pop(channel, None)
             await pubsub.close()
     
     async def unsubscribe_from_channel(self, channel: str) -> None:
-        """Unsubscribe from a Redis channel"""
-        if channel in self._subscribers:
-            del self._subscribers[channel]
\ No newline at end of file
+        """Unsubscribe from a Redis channel, stopping its listeners and closing their connections"""
+        for pubsub, task in self._subscribers.pop(channel, []):
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await pubsub.close()
\ No newline at end of file
@@ -11,10 +11,15 @@ from ..llm_backend.interface import LLMBackend, LLMMessage
 from ..llm_backend.factory import create_llm_backend
 from ..tools import create_tool_registry
 from ..message_queue.models import TaskMessage, ResultMessage
-from ..message_queue.redis_mq import RedisMQ
+from ..message_queue.redis_mq import READY_HEARTBEAT_SECONDS, RedisMQ
 from ..config.settings import LLMBackendConfig, MessageQueueConfig
 from ..config.sub_agent_config import SubAgentProfile
-from ..config.collaboration import CollaborationMessage, CollaborationMessageType, CollaborativeAgentGroup
+from ..config.collaboration import (
+    CollaborationMessage,
+    CollaborationMessageType,
+    CollaborativeAgentGroup,
+    collaboration_channel_name,
+)
 from .react_engine import SubAgentReActEngine  # ADDED: Import the new ReAct Engine
 
 
@@ -28,16 +33,20 @@ class SubAgent:
         # Initialize LLM backend - merge profile config with global config for credentials
         if global_config:
             # Use global config as base and override with profile specifics
+            overrides = profile.llm_config.model_dump(
+                include={"model", "max_tokens", "temperature"},
+                exclude_unset=True
+            )
             llm_config = LLMBackendConfig(
                 provider=global_config.llm_backend.provider,
                 api_key=global_config.llm_backend.api_key,
                 base_url=global_config.llm_backend.base_url,
-                model=profile.llm_config.get("model", global_config.llm_backend.model),
-                max_tokens=profile.llm_config.get("max_tokens", global_config.llm_backend.max_tokens),
-                temperature=profile.llm_config.get("temperature", global_config.llm_backend.temperature)
+                model=overrides.get("model", global_config.llm_backend.model),
+                max_tokens=overrides.get("max_tokens", global_config.llm_backend.max_tokens),
+                temperature=overrides.get("temperature", global_config.llm_backend.temperature)
             )
         else:
-            llm_config = LLMBackendConfig(**profile.llm_config)
+            llm_config = LLMBackendConfig(**profile.llm_config.model_dump(exclude_unset=True))
         
         self.llm_backend = create_llm_backend(llm_config)
         
@@ -66,10 +75,11 @@ class SubAgent:
         self.collaboration_context = {}  # Store shared data from other agents
         
         if self.collaboration_enabled and self.collaboration_group_id:
-            self.collaboration_channel = f"raid:collaboration:{self.collaboration_group_id}"
+            self.collaboration_channel = collaboration_channel_name(self.collaboration_group_id)
             print(f"Sub-Agent '{self.profile.name}' enabled for collaboration in group: {self.collaboration_group_id}")
         
         self.running = False
+        self._heartbeat_task: Optional[asyncio.Task] = None
     
 
     
@@ -77,6 +87,9 @@ class SubAgent:
         """Start the Sub-Agent to listen for tasks"""
         await self.mq.connect()
         self.running = True
+        await self.mq.announce_ready(self.profile.name)
+        # Keep the ready marker alive; it expires on its own if this process dies
+        self._heartbeat_task = asyncio.create_task(self._ready_heartbeat())
         
         print(f"Sub-Agent '{self.profile.name}' started, listening for tasks...")
         
@@ -116,9 +129,26 @@ class SubAgent:
     async def stop(self) -> None:
         """Stop the Sub-Agent"""
         self.running = False
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        try:
+            await self.mq.clear_ready(self.profile.name)
+        except Exception as e:
+            print(f"Error clearing ready marker: {e}")
         await self.mq.disconnect()
+        await self.llm_backend.close()
         print(f"Sub-Agent '{self.profile.name}' stopped")
     
+    async def _ready_heartbeat(self) -> None:
+        """Refresh the ready marker while the Sub-Agent is running"""
+        while self.running:
+            await asyncio.sleep(READY_HEARTBEAT_SECONDS)
+            try:
+                await self.mq.refresh_ready(self.profile.name)
+            except Exception as e:
+                print(f"Error refreshing ready marker: {e}")
+    
     async def _process_task(self, task: TaskMessage) -> ResultMessage:
         """Process a single task using ReAct Engine"""
         try:
@@ -147,13 +177,18 @@ class SubAgent:
         
         async def collaboration_message_handler(channel: str, message_data: str):
             try:
-                message_dict = eval(message_data)  # Safe in controlled environment
-                message = CollaborationMessage(**message_dict)
-                await self._handle_collaboration_message(message)
+                message = CollaborationMessage.from_json_for_agent(message_data, self.profile.name)
+                if message is not None:
+                    await self._handle_collaboration_message(message)
             except Exception as e:
                 print(f"Error processing collaboration message: {e}")
         
+        # Broadcast channel plus this agent's directed channel
         await self.mq.subscribe_to_channel(self.collaboration_channel, collaboration_message_handler)
+        await self.mq.subscribe_to_channel(
+            collaboration_channel_name(self.collaboration_group_id, self.profile.name),
+            collaboration_message_handler
+        )
     
     async def _handle_collaboration_message(self, message: CollaborationMessage) -> None:
         """Handle incoming collaboration messages"""
@@ -239,7 +274,8 @@ class SubAgent:
             return False
         
         try:
-            await self.mq.publish_message(self.collaboration_channel, message.model_dump_json())
+            channel = collaboration_channel_name(self.collaboration_group_id, message.target_agent)
+            await self.mq.publish_message(channel, message.to_json())
             print(f"Sent collaboration message: {message.message_type} to {message.target_agent or 'all'}")
             return True
         except Exception as e:
@@ -2,8 +2,9 @@
 
 import json
 import asyncio
+import time
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
 
 from ..llm_backend.interface import LLMMessage
 from ..message_queue.models import TaskMessage, ResultMessage
+from ..utils import json_dumps, json_loads, ns_to_datetime
 
 
 class SubAgentReActStep(BaseModel):
@@ -20,16 +22,22 @@ class SubAgentReActStep(BaseModel):
     thought: str
     action: Optional[Dict[str, Any]] = None
     observation: Optional[str] = None
-    timestamp: datetime
+    timestamp: int = Field(default_factory=time.time_ns)  # Nanoseconds since the epoch
     
     @classmethod
     def create_thought(cls, step_number: int, thought: str) -> "SubAgentReActStep":
         """Create a thought step"""
-        return cls(
-            step_number=step_number,
-            thought=thought,
-            timestamp=datetime.utcnow()
-        )
+        return cls(step_number=step_number, thought=thought)
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Step timestamp as an aware UTC datetime"""
+        return ns_to_datetime(self.timestamp)
+    
+    @property
+    def iso_timestamp(self) -> str:
+        """Step timestamp as an ISO 8601 string, converted only when asked for"""
+        return self.timestamp_dt.isoformat()
     
     def add_action(self, action: Dict[str, Any]) -> None:
         """Add action to this step"""
@@ -47,7 +55,7 @@ class SubAgentTaskContext(BaseModel):
     steps: List[SubAgentReActStep]
     status: str  # "in_progress", "completed", "failed"
     final_result: Optional[str] = None
-    created_at: datetime
+    created_at: int = Field(default_factory=time.time_ns)  # Nanoseconds since the epoch
     
     @classmethod
     def create(cls, task_id: str, task_prompt: str) -> "SubAgentTaskContext":
@@ -56,10 +64,14 @@ class SubAgentTaskContext(BaseModel):
             task_id=task_id,
             task_prompt=task_prompt,
             steps=[],
-            status="in_progress",
-            created_at=datetime.utcnow()
+            status="in_progress"
         )
     
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as an aware UTC datetime"""
+        return ns_to_datetime(self.created_at)
+    
     def add_step(self, step: SubAgentReActStep) -> None:
         """Add a step to the context"""
         self.steps.append(step)
@@ -266,7 +278,7 @@ Guidelines:
                 elif self._is_final_answer(step):
                      llm_response["final_answer"] = self._extract_final_answer(step)
                 
-                messages.append(LLMMessage(role="assistant", content=json.dumps(llm_response)))
+                messages.append(LLMMessage(role="assistant", content=json_dumps(llm_response)))
 
             if step.observation:
                 # Observation from tool execution
@@ -306,7 +318,7 @@ Guidelines:
             else:
                 json_part = response_content
             
-            return json.loads(json_part)
+            return json_loads(json_part)
         except (json.JSONDecodeError, IndexError) as e:
             print(f"Error decoding JSON from LLM response: {e}\nRaw response: {response_content}")
             raise
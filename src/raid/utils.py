@@ -0,0 +1,34 @@
+"""Small helpers shared across the Raid packages"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+
+# slots=True is only accepted by dataclass on Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any) -> str:
+    """Compact JSON with no whitespace, via orjson when available (non-ASCII is kept as UTF-8)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Convert a time.time_ns() stamp to an aware UTC datetime"""
+    return datetime.fromtimestamp(ns / 1_000_000_000, tz=timezone.utc)
@@ -0,0 +1,97 @@
+"""Tests for collaboration messages and group management"""
+
+import asyncio
+import dataclasses
+import heapq
+import time
+
+import pytest
+
+from raid.config.collaboration import CollaborationManager, CollaborationMessage
+from raid.config.settings import LLMBackendConfig, MessageQueueConfig, RaidConfig
+
+
+def test_message_is_immutable_so_cached_json_stays_current():
+    message = CollaborationMessage.create_data_share("alpha", "group", {"total": 1})
+    serialized = message.to_json()
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        message.status = "changed"
+    
+    assert message.to_json() is serialized
+    assert CollaborationMessage.from_json(serialized) == message
+
+
+HOUR = 3600
+
+
+def _config():
+    return RaidConfig(
+        llm_backend=LLMBackendConfig(provider="ollama", model="test"),
+        message_queue=MessageQueueConfig()
+    )
+
+
+def _age(group, created_hours_ago, active_hours_ago):
+    now = time.time()
+    group.created_ts = now - created_hours_ago * HOUR
+    group.last_activity_ts = now - active_hours_ago * HOUR
+
+
+def test_cleanup_removes_only_old_inactive_groups():
+    manager = CollaborationManager(_config())
+    stale = manager.create_collaboration_group("stale")
+    young = manager.create_collaboration_group("young")
+    busy = manager.create_collaboration_group("busy")
+    _age(stale, created_hours_ago=30, active_hours_ago=2)
+    _age(young, created_hours_ago=5, active_hours_ago=2)
+    _age(busy, created_hours_ago=30, active_hours_ago=0.5)
+    
+    removed = asyncio.run(manager.cleanup_inactive_groups(max_age_hours=24))
+    
+    assert removed == [stale.group_id]
+    assert set(manager.active_groups) == {young.group_id, busy.group_id}
+
+
+def test_inactivity_threshold_is_a_parameter():
+    manager = CollaborationManager(_config())
+    recent = manager.create_collaboration_group("recent")
+    idle = manager.create_collaboration_group("idle")
+    _age(recent, created_hours_ago=30, active_hours_ago=2)
+    _age(idle, created_hours_ago=30, active_hours_ago=4)
+    
+    assert asyncio.run(manager.cleanup_inactive_groups(inactive_hours=3)) == [idle.group_id]
+
+
+def test_groups_not_yet_due_are_requeued_once(monkeypatch):
+    manager = CollaborationManager(_config())
+    group = manager.create_collaboration_group("young")
+    _age(group, created_hours_ago=5, active_hours_ago=2)
+    
+    pushes = []
+    real_heappush = heapq.heappush
+    monkeypatch.setattr(heapq, "heappush", lambda heap, item: pushes.append(item) or real_heappush(heap, item))
+    
+    for _ in range(3):
+        assert asyncio.run(manager.cleanup_inactive_groups()) == []
+    
+    # Requeued at its real deadline on the first sweep, then left alone
+    assert len(pushes) == 1
+    assert pushes[0][0] == group.created_ts + 24 * HOUR
+
+
+def test_activity_moves_a_queued_deadline():
+    manager = CollaborationManager(_config())
+    group = manager.create_collaboration_group("group")
+    _age(group, created_hours_ago=30, active_hours_ago=0.5)
+    assert asyncio.run(manager.cleanup_inactive_groups()) == []
+    
+    # Activity after the group was queued pushes it back again instead of removing it
+    _age(group, created_hours_ago=30, active_hours_ago=0)
+    manager._expiry_heap[:] = [(time.time() - 1, group.group_id)]
+    assert asyncio.run(manager.cleanup_inactive_groups()) == []
+    assert manager._expiry_heap[0][0] > time.time()
+    
+    _age(group, created_hours_ago=30, active_hours_ago=2)
+    manager._expiry_heap[:] = [(time.time() - 1, group.group_id)]
+    assert asyncio.run(manager.cleanup_inactive_groups()) == [group.group_id]
@@ -0,0 +1,58 @@
+"""Tests for dynamic Sub-Agent role templates"""
+
+from datetime import timezone
+
+import pytest
+
+from raid.config.dynamic_subagent import DynamicSubAgentManager, RoleTemplateRegistry
+
+
+@pytest.mark.parametrize("task, role", [
+    # Substrings of longer words still route to their role
+    ("Compare prices across three stores", "financial_analyst"),
+    ("Estimate the costs of the migration", "financial_analyst"),
+    ("Total for the discounted items", "financial_analyst"),
+    ("Find trends in the sales figures", "data_analyst"),
+    ("Look for patterns in the logs", "data_analyst"),
+    ("Spend the afternoon researching options", "research_analyst"),
+    ("Revalidate the report", "quality_analyst"),
+    ("Keep checking the output", "quality_analyst"),
+    # Earlier roles win when keywords of several roles appear
+    ("Check the budget data", "financial_analyst"),
+    ("Study the data", "data_analyst"),
+    ("Verify the research", "research_analyst"),
+    ("Write a haiku", "problem_solver"),
+])
+def test_suggest_role_for_task(task, role):
+    assert RoleTemplateRegistry().suggest_role_for_task(task) == role
+
+
+@pytest.mark.parametrize("role_name", [
+    "data_analyst", "financial_analyst", "research_analyst", "problem_solver", "quality_analyst"
+])
+def test_default_roles_are_built_from_the_role_tables(role_name):
+    registry = RoleTemplateRegistry()
+    role = registry.get_role(role_name)
+    
+    assert role.role_name == role_name
+    assert role.description == registry.get_available_roles()[role_name]
+    assert registry.get_role(role_name) is role
+    
+    profile = role.create_profile("Sum the invoices", {"provider": "openai", "model": "gpt-4o"})
+    assert "Task Context: Sum the invoices" in profile.system_prompt
+    assert "{" not in profile.system_prompt
+
+
+def test_unknown_role_is_rejected():
+    with pytest.raises(ValueError):
+        RoleTemplateRegistry().get_role("astronaut")
+
+
+def test_agent_created_datetime_is_aware_utc():
+    manager = DynamicSubAgentManager()
+    profile = manager.create_dynamic_agent("Total the invoices", role_name="data_analyst")
+    
+    created = manager.get_agent_created_datetime(profile.name)
+    
+    assert created.tzinfo is timezone.utc
+    assert created.timestamp() == manager.active_agents[profile.name]["created_at"]
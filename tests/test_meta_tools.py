@@ -0,0 +1,150 @@
+"""Tests for the Control Agent's meta-tools"""
+
+import asyncio
+import logging
+import types
+from pathlib import Path
+
+import pytest
+
+from raid.config.collaboration import CollaborationManager, CollaborativeAgentGroup
+from raid.config.dynamic_subagent import DynamicSubAgentManager
+from raid.config.settings import LLMBackendConfig, MessageQueueConfig, RaidConfig
+from raid.config.sub_agent_config import SubAgentConfigurator
+from raid.control_agent import meta_tools
+from raid.control_agent.meta_tools import CreateCollaborativeSubAgentGroupTool, DispatchToSubAgentTool
+from raid.message_queue.models import ResultMessage
+
+PROFILES_DIR = Path(__file__).parent.parent / "profiles"
+
+
+class FakeOrchestrator:
+    async def aensure_sub_agent_running(self, profile_name, environment=None):
+        return types.SimpleNamespace(id="c0ffee", status="running")
+
+
+class FakeMQ:
+    """Queues that answer every task at once, for a Sub-Agent that never reports ready"""
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def wait_ready(self, profile):
+        await asyncio.Event().wait()
+    
+    def get_task_queue_name(self, profile):
+        return f"raid:tasks:{profile}"
+    
+    def get_result_queue_name(self, profile):
+        return f"raid:results:{profile}"
+    
+    async def send_task(self, queue_name, task):
+        self.sent.append(task)
+    
+    async def wait_for_result(self, correlation_id, result_queue, timeout):
+        task = self.sent[-1]
+        return ResultMessage.success(task.task_id, correlation_id, "42")
+
+
+def _tool(mq):
+    config = RaidConfig(
+        llm_backend=LLMBackendConfig(provider="ollama", model="test"),
+        message_queue=MessageQueueConfig()
+    )
+    
+    async def mq_provider():
+        return mq
+    
+    return DispatchToSubAgentTool(
+        config,
+        configurator=SubAgentConfigurator(str(PROFILES_DIR)),
+        mq_provider=mq_provider,
+        orchestrator=FakeOrchestrator()
+    )
+
+
+def test_dispatch_logs_and_does_not_trust_a_readiness_timeout(monkeypatch, caplog):
+    monkeypatch.setattr(meta_tools, "READY_TIMEOUT_SECONDS", 0.01)
+    mq = FakeMQ()
+    tool = _tool(mq)
+    
+    with caplog.at_level(logging.WARNING, logger="raid.control_agent.meta_tools"):
+        result = asyncio.run(tool.execute(sub_agent_profile="calculator_agent", task_prompt="6 * 7"))
+    
+    assert result == "Sub-Agent Result: 42"
+    assert len(mq.sent) == 1
+    assert "did not report ready" in caplog.text
+    assert "calculator_agent" not in tool._ready_at
+
+
+def test_meta_tool_without_definition_constants_is_rejected():
+    with pytest.raises(TypeError, match="description, parameters"):
+        class IncompleteTool(meta_tools.MetaTool):
+            name = "incomplete"
+            
+            async def execute(self, **kwargs):
+                return ""
+
+
+def test_abstract_meta_tool_base_may_defer_definition_constants():
+    class ToolBase(meta_tools.MetaTool):
+        pass
+    
+    class ConcreteTool(ToolBase):
+        name = "concrete"
+        description = "A complete tool"
+        parameters = []
+        
+        async def execute(self, **kwargs):
+            return "done"
+    
+    assert ConcreteTool(None).get_definition().name == "concrete"
+
+
+class HalfFailingOrchestrator:
+    """Starts the data analyst's container and fails every other one"""
+    
+    def __init__(self):
+        self.running = set()
+    
+    async def aensure_sub_agent_running(self, profile_name, environment=None):
+        if "data_analyst" not in profile_name:
+            raise RuntimeError("no space left on device")
+        self.running.add(profile_name)
+        return types.SimpleNamespace(id="c0ffee", status="running")
+    
+    async def astop_sub_agent(self, profile_name):
+        self.running.discard(profile_name)
+
+
+def test_group_is_torn_down_when_a_container_fails_to_start(monkeypatch, tmp_path):
+    async def no_messaging(self):
+        pass
+    
+    monkeypatch.setattr(CollaborativeAgentGroup, "initialize_messaging", no_messaging)
+    config = RaidConfig(
+        llm_backend=LLMBackendConfig(provider="ollama", model="test"),
+        message_queue=MessageQueueConfig()
+    )
+    orchestrator = HalfFailingOrchestrator()
+    dynamic_manager = DynamicSubAgentManager()
+    collaboration_manager = CollaborationManager(config)
+    tool = CreateCollaborativeSubAgentGroupTool(
+        config,
+        configurator=SubAgentConfigurator(str(tmp_path)),
+        dynamic_manager=dynamic_manager,
+        collaboration_manager=collaboration_manager,
+        orchestrator=orchestrator
+    )
+    
+    result = asyncio.run(tool.execute(
+        group_task_description="Check the quarterly numbers",
+        agent_roles="data_analyst, quality_analyst"
+    ))
+    
+    assert "Error starting container" in result
+    assert "was not created" in result
+    assert orchestrator.running == set()
+    assert dynamic_manager.active_agents == {}
+    assert collaboration_manager.active_groups == {}
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,19 @@
+"""Tests for the Ollama backend's shared HTTP session"""
+
+import asyncio
+
+from raid.llm_backend.ollama_backend import OllamaBackend
+
+
+def test_session_from_a_previous_loop_is_closed_when_replaced():
+    backend = OllamaBackend("test")
+    
+    async def get_session():
+        return backend._get_session()
+    
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+    
+    assert second is not first
+    assert first.closed
+    asyncio.run(backend.close())
@@ -0,0 +1,49 @@
+"""Tests for the in-memory Docker build context"""
+
+import os
+import tarfile
+from pathlib import Path
+
+from raid.config.sub_agent_config import SubAgentProfile
+from raid.docker_orchestrator import orchestrator
+
+PROFILES_DIR = Path(__file__).parent.parent / "profiles"
+
+
+def _context_names() -> list:
+    profile = SubAgentProfile.from_yaml(str(PROFILES_DIR / "calculator_agent.yaml"))
+    context = orchestrator._build_context("FROM python:3.11-slim\n", "redis\n", profile)
+    with tarfile.open(fileobj=context, mode="r") as tar:
+        return tar.getnames()
+
+
+def test_build_context_is_one_complete_archive():
+    names = _context_names()
+    
+    assert "src/raid/docker_orchestrator/orchestrator.py" in names
+    assert names[-3:] == ["Dockerfile", "requirements.txt", "profiles/calculator_agent.yaml"]
+
+
+def test_build_context_keeps_old_exclusions():
+    names = _context_names()
+    
+    assert not any("__pycache__" in name or name.endswith(".pyc") for name in names)
+
+
+def test_source_files_are_reused_until_the_source_changes():
+    assert orchestrator._source_files() is orchestrator._source_files()
+
+
+def test_source_fingerprint_covers_non_python_files(tmp_path):
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "module.cpython-311.pyc").write_bytes(b"")
+    notes = tmp_path / "NOTES.md"
+    notes.write_text("old")
+    fingerprint = orchestrator._source_fingerprint(tmp_path)
+    
+    stat = notes.stat()
+    notes.write_text("new")
+    os.utime(notes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert orchestrator._source_fingerprint(tmp_path) != fingerprint
+    assert [path.name for path in orchestrator._iter_source_paths(tmp_path)] == ["NOTES.md"]
@@ -0,0 +1,77 @@
+"""Tests for the Control Agent's ReAct engine"""
+
+import asyncio
+import json
+
+from raid.config.settings import LLMBackendConfig, MessageQueueConfig, RaidConfig
+from raid.control_agent.meta_tools import ConcludeTaskSuccessTool
+from raid.control_agent.react_engine import ReActEngine, ReActStep
+from raid.llm_backend.interface import LLMBackend, LLMResponse
+
+
+class ConcludingBackend(LLMBackend):
+    """Concludes every goal on the first step, counting the calls"""
+    
+    def __init__(self):
+        super().__init__("test")
+        self.calls = 0
+    
+    async def generate(self, messages, max_tokens=None, temperature=None, **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content=json.dumps({
+                "thought": "Done",
+                "action": {"tool": "conclude_task_success", "parameters": {"final_summary": "42"}}
+            }),
+            finish_reason="stop",
+            model=self.model
+        )
+    
+    async def health_check(self):
+        return True
+
+
+class SingleToolRegistry:
+    """The parts of MetaToolRegistry the engine reads, with only the success conclusion"""
+    
+    version = 1
+    
+    def __init__(self):
+        config = RaidConfig(
+            llm_backend=LLMBackendConfig(provider="ollama", model="test"),
+            message_queue=MessageQueueConfig()
+        )
+        self._tools = {"conclude_task_success": ConcludeTaskSuccessTool(config)}
+    
+    def get_all_tools(self):
+        return self._tools
+    
+    def snapshot(self):
+        return tuple(
+            (tool.name, tool.description,
+             tuple((p.name, p.type, p.description, p.required) for p in tool.parameters))
+            for tool in self._tools.values()
+        )
+
+
+def test_goal_cache_hits_do_not_share_steps():
+    backend = ConcludingBackend()
+    engine = ReActEngine(backend, SingleToolRegistry(), cache_strategy="exact-match")
+    
+    async def scenario():
+        first = await engine.process_goal("What is 6 * 7?")
+        first.steps.append(ReActStep(step_number=99, thought="added by the caller"))
+        first.steps[0].thought = "edited by the caller"
+        
+        second = await engine.process_goal("what is  6 * 7?")
+        second.steps.clear()
+        
+        third = await engine.process_goal("What is 6 * 7?")
+        return first, second, third
+    
+    first, second, third = asyncio.run(scenario())
+    assert backend.calls == 1
+    assert third.status == "completed"
+    assert [step.thought for step in third.steps] == ["Done"]
+    assert third.steps is not first.steps
+    assert len({first.task_id, second.task_id, third.task_id}) == 3
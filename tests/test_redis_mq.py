@@ -0,0 +1,156 @@
+"""Tests for RedisMQ pub/sub subscription bookkeeping"""
+
+import asyncio
+
+import redis.asyncio as redis
+
+from raid.config.settings import MessageQueueConfig
+from raid.message_queue.redis_mq import READY_TTL_SECONDS, RedisMQ
+
+
+class FakePubSub:
+    """Stands in for redis.asyncio.client.PubSub, blocking until closed"""
+    
+    def __init__(self):
+        self.channels = []
+        self.closed = False
+        self._stop = asyncio.Event()
+    
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+    
+    async def listen(self):
+        await self._stop.wait()
+        return
+        yield  # pragma: no cover - makes this an async generator
+    
+    async def close(self):
+        self.closed = True
+        self._stop.set()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pubsubs = []
+    
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+
+def _connected_mq():
+    mq = RedisMQ(MessageQueueConfig())
+    mq.redis_client = FakeRedis()
+    return mq
+
+
+async def _noop(channel, data):
+    pass
+
+
+def test_subscriptions_on_one_channel_are_kept_separately():
+    async def scenario():
+        mq = _connected_mq()
+        await mq.subscribe_to_channel("bcast", _noop)
+        await mq.subscribe_to_channel("bcast", _noop)
+        assert len(mq._subscribers["bcast"]) == 2
+        await mq.unsubscribe_from_channel("bcast")
+    
+    asyncio.run(scenario())
+
+
+def test_unsubscribe_stops_listeners_and_closes_pubsubs():
+    async def scenario():
+        mq = _connected_mq()
+        await mq.subscribe_to_channel("bcast", _noop)
+        await mq.subscribe_to_channel("bcast", _noop)
+        await mq.subscribe_to_channel("direct", _noop)
+        tasks = [task for entries in mq._subscribers.values() for _, task in entries]
+        
+        await mq.unsubscribe_from_channel("bcast")
+        assert "bcast" not in mq._subscribers
+        assert [p.closed for p in mq.redis_client.pubsubs] == [True, True, False]
+        assert [task.done() for task in tasks] == [True, True, False]
+        await mq.unsubscribe_from_channel("direct")
+    
+    asyncio.run(scenario())
+
+
+def test_listener_that_stops_removes_its_subscription():
+    async def scenario():
+        mq = _connected_mq()
+        await mq.subscribe_to_channel("bcast", _noop)
+        pubsub, task = mq._subscribers["bcast"][0]
+        pubsub._stop.set()
+        await task
+        return mq
+    
+    mq = asyncio.run(scenario())
+    assert mq._subscribers == {}
+
+
+def test_connection_pool_waits_for_a_free_connection(monkeypatch):
+    async def ping(self):
+        return True
+    
+    monkeypatch.setattr(redis.Redis, "ping", ping)
+    
+    async def scenario():
+        mq = RedisMQ(MessageQueueConfig(redis_max_connections=2, redis_pool_timeout=0.5))
+        await mq.connect()
+        pool = mq.redis_client.connection_pool
+        await mq.disconnect()
+        return pool
+    
+    pool = asyncio.run(scenario())
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 2
+    assert pool.timeout == 0.5
+
+
+class RecordingPipeline:
+    def __init__(self, calls):
+        self.calls = calls
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def set(self, *args, **kwargs):
+        self.calls.append(("set", args, kwargs))
+    
+    def publish(self, *args):
+        self.calls.append(("publish", args, {}))
+    
+    async def execute(self):
+        return []
+
+
+class RecordingRedis:
+    """Records SET/PUBLISH calls, directly or through a pipeline"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def pipeline(self, transaction=True):
+        return RecordingPipeline(self.calls)
+    
+    async def set(self, *args, **kwargs):
+        self.calls.append(("set", args, kwargs))
+
+
+def test_ready_marker_expires_unless_refreshed():
+    async def scenario():
+        mq = RedisMQ(MessageQueueConfig())
+        mq.redis_client = RecordingRedis()
+        await mq.announce_ready("calculator_agent")
+        await mq.refresh_ready("calculator_agent")
+        return mq.redis_client.calls
+    
+    calls = asyncio.run(scenario())
+    sets = [kwargs for name, _, kwargs in calls if name == "set"]
+    assert sets == [{"ex": READY_TTL_SECONDS}, {"ex": READY_TTL_SECONDS}]
+    assert [name for name, _, _ in calls].count("publish") == 1
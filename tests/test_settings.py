@@ -0,0 +1,56 @@
+"""Tests for RaidConfig.from_env caching"""
+
+import pytest
+
+from raid.config.settings import RaidConfig, clear_config_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache(monkeypatch):
+    monkeypatch.setenv("RAID_LLM_PROVIDER", "ollama")
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def test_from_env_returns_independent_copies():
+    first = RaidConfig.from_env()
+    first.message_queue.redis_host = "elsewhere"
+    first.max_dynamic_sub_agents = 99
+    
+    second = RaidConfig.from_env()
+    assert second is not first
+    assert second.message_queue.redis_host == "localhost"
+    assert second.max_dynamic_sub_agents == 5
+
+
+def test_from_env_follows_environment_changes(monkeypatch):
+    assert RaidConfig.from_env().message_queue.redis_port == 6379
+    
+    monkeypatch.setenv("RAID_REDIS_PORT", "6380")
+    
+    assert RaidConfig.from_env().message_queue.redis_port == 6380
+
+
+def test_clear_config_cache_forces_a_rebuild():
+    from raid.config.settings import _build_config
+    
+    RaidConfig.from_env()
+    RaidConfig.from_env()
+    assert _build_config.cache_info().misses == 1
+    
+    clear_config_cache()
+    RaidConfig.from_env()
+    assert _build_config.cache_info().misses == 1
+    assert _build_config.cache_info().hits == 0
+
+
+def test_config_deep_copies_after_reading_the_subagent_env():
+    config = RaidConfig.from_env()
+    assert config.subagent_base_env["RAID_LLM_PROVIDER"] == "ollama"
+    
+    copy = config.model_copy(deep=True)
+    copy.message_queue.redis_port = 6380
+    
+    assert copy.subagent_base_env["RAID_REDIS_PORT"] == "6380"
+    assert config.subagent_base_env["RAID_REDIS_PORT"] == "6379"
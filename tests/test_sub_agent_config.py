@@ -0,0 +1,74 @@
+"""Tests for Sub-Agent profile loading and caching"""
+
+import os
+import shutil
+from pathlib import Path
+
+from raid.config.sub_agent_config import LLMConfig, SubAgentConfigurator
+
+PROFILES_DIR = Path(__file__).parent.parent / "profiles"
+
+
+def _edit_in_place(path: Path, old: str, new: str) -> None:
+    """Rewrite a file's content and move its mtime forward, leaving the directory untouched"""
+    stat = path.stat()
+    path.write_text(path.read_text().replace(old, new))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _configurator(tmp_path: Path) -> SubAgentConfigurator:
+    shutil.copy(PROFILES_DIR / "calculator_agent.yaml", tmp_path / "calculator_agent.yaml")
+    return SubAgentConfigurator(str(tmp_path))
+
+
+def test_load_profile_sees_edits_in_place(tmp_path):
+    configurator = _configurator(tmp_path)
+    profile = configurator.load_profile("calculator_agent")
+    
+    _edit_in_place(tmp_path / "calculator_agent.yaml", profile.description, "Edited description")
+    
+    assert configurator.load_profile("calculator_agent").description == "Edited description"
+
+
+def test_get_all_profiles_sees_edits_in_place(tmp_path):
+    configurator = _configurator(tmp_path)
+    profile = configurator.get_all_profiles()["calculator_agent"]
+    dir_mtime_ns = tmp_path.stat().st_mtime_ns
+    
+    _edit_in_place(tmp_path / "calculator_agent.yaml", profile.description, "Edited description")
+    
+    assert tmp_path.stat().st_mtime_ns == dir_mtime_ns
+    assert configurator.get_all_profiles()["calculator_agent"].description == "Edited description"
+
+
+def test_get_all_profiles_sees_new_files(tmp_path):
+    configurator = _configurator(tmp_path)
+    assert list(configurator.get_all_profiles()) == ["calculator_agent"]
+    
+    shutil.copy(PROFILES_DIR / "research_agent.yaml", tmp_path / "research_agent.yaml")
+    
+    assert sorted(configurator.get_all_profiles()) == ["calculator_agent", "research_agent"]
+
+
+def test_get_all_profiles_skips_invalid_profiles(tmp_path):
+    configurator = _configurator(tmp_path)
+    invalid = tmp_path / "invalid_agent.yaml"
+    invalid.write_text((tmp_path / "calculator_agent.yaml").read_text())
+    _edit_in_place(invalid, "tools:\n", "tools: calculator\nunused:\n")
+    
+    assert list(configurator.get_all_profiles()) == ["calculator_agent"]
+
+
+def test_to_yaml_leaves_unset_llm_fields_unset(tmp_path):
+    configurator = _configurator(tmp_path)
+    profile = configurator.load_profile("calculator_agent")
+    profile = profile.model_copy(update={
+        "name": "minimal_agent",
+        "llm_config": LLMConfig(provider="openai", model="gpt-4o"),
+    })
+    
+    configurator.save_profile(profile)
+    reloaded = configurator.load_profile("minimal_agent")
+    
+    assert reloaded.llm_config.model_fields_set == {"provider", "model"}
+    assert "temperature" not in (tmp_path / "minimal_agent.yaml").read_text()